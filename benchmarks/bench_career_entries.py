@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+parse_career_entries() 스케일링 벤치마크.
+
+경력 항목 수를 늘린 합성 경력 블록(항목 50개 ~ 수천 개)으로 파싱 시간을 재서 항목당 시간이 일정한지(선형) 확인합니다.
+기존 구현(중첩 while + 다음 기간 줄에서 i -= 1 후 연봉/근무지역/퇴사사유 재스캔)을 reference로 두고
+현재 구현(한 번만 앞으로 읽는 상태 기계)과 결과가 같은지도 확인합니다.
+결과가 다르거나, 가장 큰 입력의 항목당 시간이 가장 작은 입력의 MAX_PER_ENTRY_GROWTH 배를 넘으면 exit 1.
+
+사용법:
+    python3 benchmarks/bench_career_entries.py [--repeat N] [항목수,항목수,...]
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import parse_pdf_resume  # noqa: E402
+from layout_lines import as_layout_lines, tokenize_layout  # noqa: E402
+
+P = parse_pdf_resume.P
+
+# 항목당 시간이 이 배수 이상 늘면 선형이 아니라고 봄 (캐시·GC 흔들림 여유 포함)
+MAX_PER_ENTRY_GROWTH = 2.0
+
+
+def reference_parse_career_entries(block) -> list:
+    """변경 전 구현 (중첩 while, 기간 줄에서 한 줄 되돌아감, 연봉 줄 이후 두 번째 스캔 루프). 결과 비교·시간 기준용."""
+    entries = []
+    lines = as_layout_lines(block)
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        m = P.CAREER_DATE_LINE.match(line.text) if line.date else None
+        if m:
+            start_date = m.group(1)
+            end_raw = m.group(2)
+            rest = m.group(3)
+            parts = rest.split("·", 1)
+            company = parts[0].strip() if parts else ""
+            role = parts[1].strip() if len(parts) > 1 else ""
+            duration = ""
+            desc_lines = []
+            salary = ""
+            region = ""
+            leave_reason = ""
+            i += 1
+            while i < len(lines):
+                next_record = lines[i]
+                next_line = next_record.raw
+                if next_record.date and P.CAREER_DATE_START.match(next_record.text):
+                    i -= 1
+                    break
+                if P.CAREER_DURATION.match(next_record.text):
+                    duration = next_record.text
+                    i += 1
+                    continue
+                if not next_record.blank and not next_record.text.startswith("연봉"):
+                    desc_lines.append(next_record.text)
+                if "연봉" in next_line or "근무지역" in next_line or "퇴사사유" in next_line:
+                    sm = P.CAREER_SALARY.search(next_line)
+                    if sm:
+                        salary = sm.group(1).strip()
+                    rm = P.CAREER_REGION.search(next_line)
+                    if not rm:
+                        rm = P.CAREER_REGION_LOOSE.search(next_line)
+                    if rm:
+                        region = rm.group(1).strip()
+                    lm = P.CAREER_LEAVE_REASON.search(next_line)
+                    if lm:
+                        leave_reason = lm.group(1).strip()
+                    break
+                i += 1
+            description = " ".join(desc_lines) if desc_lines else ""
+            while i + 1 < len(lines):
+                i += 1
+                if lines[i].date and P.CAREER_DATE_START.match(lines[i].text):
+                    i -= 1
+                    break
+                l = lines[i].raw
+                sm = P.CAREER_SALARY.search(l)
+                if sm:
+                    salary = sm.group(1).strip()
+                rm = P.CAREER_REGION.search(l)
+                if not rm:
+                    rm = P.CAREER_REGION_LOOSE.search(l)
+                if rm:
+                    region = rm.group(1).strip()
+                lm = P.CAREER_LEAVE_REASON.search(l)
+                if lm:
+                    leave_reason = lm.group(1).strip()
+            entries.append({
+                "startDate": start_date,
+                "endDate": "재직중" if end_raw == "재직중" else end_raw,
+                "companyNameAndDepartment": company,
+                "role": role,
+                "duration": duration,
+                "description": description,
+                "salary": salary,
+                "region": region,
+                "leaveReason": leave_reason,
+            })
+        i += 1
+    return entries
+
+
+def make_career_block(entries: int, seed: int = 0) -> str:
+    """사람인 -layout 경력 구간 형태의 합성 텍스트 (항목마다 기간 줄, 근무기간, 설명 1~4줄, 연봉 줄, 가끔 추가 줄)."""
+    r = random.Random(seed)
+    words = ["프레스", "금형", "설비", "보전", "품질", "개선", "생산", "라인", "관리", "자동화", "PLC", "공정"]
+    out = ["경력 총 " + str(entries) + "년", "", ""]
+    for k in range(entries):
+        y = 2025 - k % 40
+        end = "재직중" if k == 0 else f"{y}.{r.randint(1, 12):02d}"
+        out.append(f"{y - 1}.{r.randint(1, 12):02d} ~ {end}    (주)회사{k} {r.choice(words)}팀 · {r.choice(words)} 사원")
+        out.append(f"{r.randint(1, 11)}개월" if k % 3 else f"{r.randint(1, 9)}년 {r.randint(1, 11)}개월")
+        for _ in range(r.randint(1, 4)):
+            out.append("  " + " ".join(r.choice(words) for _ in range(r.randint(3, 9))))
+        out.append(f"연봉 {r.randint(24, 60)}00만원   근무지역 {r.choice(['경기', '서울', '인천'])}   퇴사사유 {r.choice(['계약만료', '이직', '개인사정'])}")
+        if k % 5 == 4:
+            out.append("근무지역 " + r.choice(["부산", "대구"]))
+        out.append("")
+    return "\n".join(out) + "\n"
+
+
+def _best_ms(fn, records: list, repeat: int) -> float:
+    """repeat회 중 최소 시간 (ms). 스케일링 비교에는 평균보다 흔들림이 적음."""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(records)
+        ms = (time.perf_counter() - t0) * 1000
+        best = ms if best is None else min(best, ms)
+    return best
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 7
+    if len(args) >= 2 and args[0] == "--repeat" and args[1].isdigit():
+        repeat = max(1, int(args[1]))
+        args = args[2:]
+    sizes = [50, 200, 1000, 5000]
+    if args:
+        try:
+            sizes = sorted(int(n) for n in args[0].split(",") if n)
+        except ValueError:
+            sizes = []
+    if not sizes or len(args) > 1:
+        print(json.dumps({"error": "Usage: bench_career_entries.py [--repeat N] [entries,entries,...]"}), file=sys.stderr)
+        sys.exit(1)
+
+    results = []
+    for n in sizes:
+        text = make_career_block(n, n)
+        ref = reference_parse_career_entries(text)
+        cur = parse_pdf_resume.parse_career_entries(text)
+        # 시간은 줄 레코드(parse_pdf_resume_text 가 넘기는 형태)로 재서 토큰화 비용을 빼고 파서 루프만 비교
+        records = tokenize_layout(text)
+        ref_ms = _best_ms(reference_parse_career_entries, records, repeat)
+        cur_ms = _best_ms(parse_pdf_resume.parse_career_entries, records, repeat)
+        results.append({
+            "entries": n,
+            "lines": text.count("\n") + 1,
+            "parsedEntries": len(cur),
+            "identical": ref == cur,
+            "referenceMs": round(ref_ms, 3),
+            "currentMs": round(cur_ms, 3),
+            "currentPerEntryUs": round(cur_ms * 1000 / n, 3),
+            "speedup": round(ref_ms / cur_ms, 2) if cur_ms else None,
+        })
+    growth = results[-1]["currentPerEntryUs"] / results[0]["currentPerEntryUs"] if results[0]["currentPerEntryUs"] else None
+    linear = growth is not None and growth <= MAX_PER_ENTRY_GROWTH
+    print(json.dumps({
+        "repeat": repeat,
+        "perEntryGrowth": round(growth, 2) if growth is not None else None,
+        "linear": linear,
+        "results": results,
+    }, ensure_ascii=False, indent=2))
+    if not linear or not all(r["identical"] and r["parsedEntries"] == r["entries"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DOCX 표 구조 추출 엔진 비교 벤치마크 + 결과 동일성 검사
+(extract_table_structure: python-docx 객체 모델 vs lxml iterparse, docx_table_xml.py).
+
+DOCX마다 엔진별 추출 시간(repeat회)을 재고, lxml 결과(tables/rows/cells/position JSON)가 python-docx 결과와
+완전히 같은지 비교합니다. 다른 파일이 하나라도 있으면 처음 다른 위치(경로)를 함께 출력하고 exit 1.
+docxParser.ts 가 읽는 출력이므로 docx_table_xml.py 를 바꾼 뒤에는 이 스크립트로 확인하세요.
+
+사용법:
+    python3 benchmarks/bench_docx_engines.py [--repeat N] [폴더|파일.docx ...]   # 기본: generated_resumes/ + resume_form.docx
+"""
+
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT / "scripts"))
+
+from extract_resume_form_structure import DOCX_ENGINES, extract_table_structure  # noqa: E402
+
+
+def _p95(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+
+
+def _first_diff(a, b, path: str = "$"):
+    """a, b(JSON 값)가 처음 달라지는 위치 (같으면 None)."""
+    if type(a) is not type(b):
+        return path
+    if isinstance(a, dict):
+        for key in list(a) + [k for k in b if k not in a]:
+            if key not in a or key not in b:
+                return f"{path}.{key}"
+            found = _first_diff(a[key], b[key], f"{path}.{key}")
+            if found:
+                return found
+        return None
+    if isinstance(a, list):
+        for i, (x, y) in enumerate(zip(a, b)):
+            found = _first_diff(x, y, f"{path}[{i}]")
+            if found:
+                return found
+        return None if len(a) == len(b) else f"{path}.length"
+    return None if a == b else path
+
+
+def _iter_docx_paths(targets: list[str]) -> list[str]:
+    paths = []
+    for target in targets:
+        p = Path(target)
+        if p.is_dir():
+            paths += sorted(str(x) for x in p.glob("*.docx"))
+        elif p.exists():
+            paths.append(str(p))
+    return paths
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 5
+    if len(args) >= 2 and args[0] == "--repeat" and args[1].isdigit():
+        repeat = max(1, int(args[1]))
+        args = args[2:]
+    paths = _iter_docx_paths(args or [str(_ROOT / "generated_resumes"), str(_ROOT / "resume_form.docx")])
+    if not paths or any(a.startswith("--") for a in args):
+        print(json.dumps({"error": "Usage: bench_docx_engines.py [--repeat N] [dir|file.docx ...]"}), file=sys.stderr)
+        sys.exit(1)
+
+    reference = DOCX_ENGINES[0]
+    samples: dict[str, list[float]] = {e: [] for e in DOCX_ENGINES}
+    errors = {e: 0 for e in DOCX_ENGINES}
+    files = []
+    differing = 0
+    for path in paths:
+        row = {"path": path, "engines": {}}
+        outputs = {}
+        for engine in DOCX_ENGINES:
+            times = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                out = extract_table_structure(path, engine=engine)
+                times.append((time.perf_counter() - t0) * 1000)
+            if "error" in out:
+                errors[engine] += 1
+                row["engines"][engine] = {"error": out["error"]}
+                continue
+            samples[engine] += times
+            outputs[engine] = out
+            row["engines"][engine] = {"meanMs": round(statistics.mean(times), 3)}
+        for engine in DOCX_ENGINES[1:]:
+            if reference in outputs and engine in outputs:
+                diff = _first_diff(outputs[reference], outputs[engine])
+                row["engines"][engine]["identical"] = diff is None
+                if diff:
+                    row["engines"][engine]["firstDiff"] = diff
+                    differing += 1
+        files.append(row)
+
+    summary = {}
+    for engine in DOCX_ENGINES:
+        s = samples[engine]
+        summary[engine] = {
+            "files": len(paths) - errors[engine],
+            "errors": errors[engine],
+            "meanMs": round(statistics.mean(s), 3) if s else None,
+            "p95Ms": round(_p95(s), 3) if s else None,
+        }
+    ref_mean = summary[reference]["meanMs"]
+    for engine in DOCX_ENGINES[1:]:
+        mean = summary[engine]["meanMs"]
+        summary[engine]["speedup"] = round(ref_mean / mean, 2) if ref_mean and mean else None
+    ok = differing == 0 and not any(errors.values())
+    print(json.dumps({
+        "repeat": repeat,
+        "reference": reference,
+        "identical": differing == 0,
+        "filesWithDiff": differing,
+        "summary": summary,
+        "files": files,
+    }, ensure_ascii=False, indent=2))
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+1단계 추출 엔진 비교 벤치마크 (pdf_text_engines: pdftotext 서브프로세스 vs pymupdf 인프로세스).
+
+PDF마다 엔진별 추출 시간(repeat회 평균)을 재고, 각 엔진 텍스트로 2단계(parse_pdf_resume_text)를 돌려
+첫 번째 엔진(기준) 결과와 필드 단위로 비교합니다. 기준 엔진과 결과가 다른 필드 이름을 파일별로 출력하므로
+pymupdf를 기본 엔진으로 바꾸기 전에 실제 이력서 폴더로 돌려 차이를 확인하세요.
+
+사용법:
+    python3 benchmarks/bench_extract_engines.py [--repeat N] [--engines pdftotext,pymupdf] [--pdftotext PATH] [--use-corpus-headers] <폴더|manifest.txt>
+"""
+
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import parse_pdf_resume  # noqa: E402
+from pdf_text_engines import engine_id, engine_names, extract_text  # noqa: E402
+
+
+def _p95(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 3
+    engines = ["pdftotext", "pymupdf"]
+    pdftotext_exe = None
+    use_corpus_headers = False
+    while args:
+        if args[0] == "--repeat" and len(args) >= 2 and args[1].isdigit():
+            repeat = max(1, int(args[1]))
+            args = args[2:]
+        elif args[0] == "--engines" and len(args) >= 2:
+            engines = [e for e in args[1].split(",") if e]
+            args = args[2:]
+        elif args[0] == "--pdftotext" and len(args) >= 2:
+            pdftotext_exe = args[1]
+            args = args[2:]
+        elif args[0] == "--use-corpus-headers":
+            use_corpus_headers = True
+            args = args[1:]
+        else:
+            break
+    unknown = [e for e in engines if e not in engine_names()]
+    if not args or not Path(args[0]).exists() or unknown or not engines:
+        print(json.dumps({"error": f"Usage: bench_extract_engines.py [--repeat N] [--engines {','.join(engine_names())}] [--pdftotext PATH] [--use-corpus-headers] <dir|manifest.txt>"}), file=sys.stderr)
+        sys.exit(1)
+    paths = parse_pdf_resume._iter_batch_paths(args[0])
+
+    files = []
+    samples: dict[str, list[float]] = {e: [] for e in engines}
+    errors = {e: 0 for e in engines}
+    differing = {e: 0 for e in engines[1:]}
+    for path in paths:
+        row = {"path": path, "engines": {}}
+        parsed = {}
+        for engine in engines:
+            try:
+                times = []
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    text = extract_text(path, engine, pdftotext_exe)
+                    times.append((time.perf_counter() - t0) * 1000)
+                samples[engine] += times
+                parsed[engine] = parse_pdf_resume.parse_pdf_resume_text(text, engine, use_corpus_headers)
+                row["engines"][engine] = {"meanMs": round(statistics.mean(times), 3), "chars": len(text)}
+            except Exception as e:
+                errors[engine] += 1
+                row["engines"][engine] = {"error": str(e)}
+        reference = parsed.get(engines[0])
+        for engine in engines[1:]:
+            if reference is None or engine not in parsed:
+                continue
+            fields = sorted(k for k in set(reference) | set(parsed[engine]) if reference.get(k) != parsed[engine].get(k))
+            row["engines"][engine]["diffFields"] = fields
+            differing[engine] += bool(fields)
+        files.append(row)
+
+    summary = {}
+    for engine in engines:
+        s = samples[engine]
+        summary[engine] = {
+            "engineId": engine_id(engine, pdftotext_exe),
+            "files": len(paths) - errors[engine],
+            "errors": errors[engine],
+            "meanMs": round(statistics.mean(s), 3) if s else None,
+            "p95Ms": round(_p95(s), 3) if s else None,
+        }
+        if engine in differing:
+            summary[engine]["filesWithStage2Diff"] = differing[engine]
+    print(json.dumps({"repeat": repeat, "reference": engines[0], "summary": summary, "files": files}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
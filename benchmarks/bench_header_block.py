@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+parse_header_block() 동등성 검사 + 마이크로 벤치마크.
+
+기존 구현(필드마다 전체 텍스트 search, 이름 후보 패턴 4개 finditer)을 reference로 두고
+현재 구현(라벨 위치를 한 번 훑어 모은 뒤 필드 패턴은 자기 라벨 위치에서만 match)과 basicInfo 가 같은지 확인합니다.
+
+입력:
+  - 인자로 1단계 원문(*.stage1_raw.txt, *_pdftotext.txt) 파일/폴더를 주면 파일마다 헤더(첫 두 블록)와 원문 전체
+  - 없으면 사람인 헤더 형태를 흔든 합성 블록 (라벨 공백·콜론 변형, 필드 누락·중복, 줄 합치기/나누기, 이름 앞뒤 줄바꿈,
+    "신입 신입"·"직전화번호"·"남양주" 같은 겹치는 라벨, 나의 스킬 앞뒤 이름 후보 등)
+결과가 하나라도 다르면 exit 1.
+
+사용법:
+    python3 benchmarks/bench_header_block.py [--cases N] [--repeat N] [stage1_raw.txt|폴더]
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import parse_pdf_resume  # noqa: E402
+from stage1_cache import iter_stage1_files, read_stage1_text  # noqa: E402
+
+P = parse_pdf_resume.P
+
+
+def reference_parse_header_block(block: str) -> dict:
+    """변경 전 구현 (필드마다 전체 텍스트 search, 이름 후보 finditer 4번). 결과 비교·시간 기준용."""
+    info = {}
+    text = block.replace("\n", " ")
+
+    m = P.HEADER_SUPPORT_FIELD.search(text)
+    if m:
+        info["supportField"] = m.group(1).strip()
+    m = P.HEADER_APPLICATION_DATE.search(text)
+    if m:
+        info["applicationDate"] = m.group(1).strip()
+
+    NAME_BLOCK = ("스킬", "소프트스킬", "경력", "학력", "나의", "-", "소프트스킬입니다", "입니다")
+    idx_skill = block.find("나의 스킬")
+
+    def _accept_name(word: str) -> bool:
+        if not word or word == "스킬":
+            return False
+        if any(word.startswith(x) or x in word for x in NAME_BLOCK):
+            return False
+        return bool(P.NAME_HANGUL.match(word) or P.NAME_LATIN.match(word))
+
+    candidates = []
+    for pattern in (P.NAME_BEFORE_CAREER_EOL, P.NAME_BEFORE_NEWCOMER_EOL, P.NAME_BEFORE_CAREER, P.NAME_BEFORE_NEWCOMER):
+        for m in pattern.finditer(block):
+            if idx_skill != -1 and m.start() > idx_skill:
+                continue
+            candidates.append((m.start(), m.group(1).strip()))
+    candidates.sort(key=lambda x: x[0])
+    for _, name in candidates:
+        if _accept_name(name):
+            info["name"] = name
+            break
+    if "name" not in info or not info["name"]:
+        lines = block.split("\n")
+        for i, line in enumerate(lines):
+            line_stripped = line.strip()
+            if P.HEADER_GENDER_LINE.match(line_stripped):
+                if i > 0:
+                    prev = lines[i - 1].strip()
+                    if _accept_name(prev):
+                        info["name"] = prev
+                    else:
+                        first_word = prev.split(None, 1)[0] if prev else ""
+                        if _accept_name(first_word):
+                            info["name"] = first_word
+                break
+            if P.NAME_HANGUL.match(line_stripped) or P.NAME_LATIN.match(line_stripped):
+                if _accept_name(line_stripped):
+                    info["name"] = line_stripped
+                    break
+    if "name" not in info or not info["name"]:
+        m_name = P.HEADER_NAME_LABEL.search(text)
+        if m_name and _accept_name(m_name.group(1).strip()):
+            info["name"] = m_name.group(1).strip()
+
+    m = P.HEADER_GENDER_BIRTH_AGE.search(text)
+    if m:
+        info["gender"] = m.group(1)
+        info["birthYear"] = m.group(2)
+        info["age"] = int(m.group(3))
+    if "birthYear" not in info or "age" not in info:
+        m2 = P.HEADER_BIRTH_AGE.search(text)
+        if m2:
+            if "birthYear" not in info:
+                info["birthYear"] = m2.group(1)
+            if "age" not in info:
+                try:
+                    info["age"] = int(m2.group(2))
+                except ValueError:
+                    pass
+    if "birthYear" not in info:
+        m3 = P.HEADER_BIRTH_YEAR.search(text)
+        if m3:
+            info["birthYear"] = m3.group(1)
+
+    m = P.HEADER_EMAIL.search(text)
+    if m:
+        info["email"] = m.group(1).strip()
+    m = P.HEADER_PHONE.search(text)
+    if m:
+        info["phone"] = P.WHITESPACE.sub("", m.group(1))
+    m = P.HEADER_ADDRESS_POSTAL.search(text)
+    if m:
+        info["address"] = m.group(1).strip()
+    if "address" not in info:
+        m = P.HEADER_ADDRESS_LINE.search(block)
+        if m:
+            info["address"] = m.group(1).strip()
+    if info.get("address"):
+        info["residence"] = parse_pdf_resume._classify_residence(info["address"])
+
+    m = P.TOTAL_CAREER.search(text)
+    if m:
+        info["totalCareer"] = m.group(1).strip()
+    if "totalCareer" not in info:
+        career_pos = text.find("경력")
+        if career_pos >= 0:
+            m_after = P.TOTAL_PERIOD.search(text[career_pos:])
+            if m_after:
+                info["totalCareer"] = m_after.group(1).strip()
+        if "totalCareer" not in info:
+            m = P.TOTAL_PERIOD.search(text)
+            if m:
+                info["totalCareer"] = m.group(1).strip()
+    m = P.DESIRED_SALARY.search(text)
+    if m:
+        info["desiredSalary"] = m.group(1).strip() + "만원"
+    if "desiredSalary" not in info and "회사내규에 따름" in text:
+        idx_desired = text.find("회사내규에 따름")
+        idx_last = text.find("직전 연봉")
+        if idx_desired != -1 and (idx_last == -1 or idx_desired < idx_last):
+            info["desiredSalary"] = "회사내규에 따름"
+    m = P.LAST_SALARY_SPACED.search(text)
+    if m:
+        info["lastSalary"] = m.group(1).strip() + "만원"
+    if "lastSalary" not in info:
+        m = P.LAST_SALARY.search(text)
+        if m:
+            info["lastSalary"] = m.group(1).strip() + "만원"
+    if "lastSalary" not in info:
+        m = P.LAST_SALARY_LOOSE.search(text)
+        if m:
+            info["lastSalary"] = m.group(1).strip().rstrip("원") + ("만원" if "만" in m.group(1) else "만원")
+    if "lastSalary" not in info and "회사내규에 따름" in text:
+        info["lastSalary"] = "회사내규에 따름"
+
+    return info
+
+
+# 합성 블록 재료: 정상 라벨 줄과, 라벨이 겹치거나 값이 깨진 줄
+_NAMES = ["홍길동", "김철수", "박민수", "PRASETYO", "이영", "남궁민수", "-", "스킬", "경력", "신입", "나의", "A1", "여민"]
+_LINES = [
+    "지원분야 : {field}          입사지원일 : 2026년 01월 {d:02d}일 (월)",
+    "지원분야  {field}    입사지원일  2026년 01월 {d:02d}일 (월)",
+    "지원분야:{field}입사지원일:2026.01.{d:02d} (화)",
+    "{name} 경력",
+    "{name} 신입",
+    "{name}\n경력",
+    "{name}   경력   \n",
+    "{name} 신입 신입",
+    "{name} 경력 경력 {name2}",
+    "남, {y} ({a}세)",
+    "여 ,{y}({a}세)",
+    "{y} ({a}세)",
+    "생년월일    {y}년 10월 10일",
+    "성명     {name}",
+    "이메일  {mail}@example.com     휴대폰  010-{p4}-{p4b}",
+    "이메일 없음   전화번호 02 {p4} {p4b}",
+    "휴대폰 010{p4}{p4b}  직전화번호 010-1111-2222",
+    "주소  ({zip}) 경기 시흥시 정왕동 {d}-4",
+    "주소  ({z3}-{z3b}) 서울 강남구 역삼동 {d} 경력 총 {n}년",
+    "주소 부산 해운대구 우동",
+    "주소  {zip} 남양주시 화도읍",
+    "경력 총 {n}년 {m}개월",
+    "학력 총 4년    경력    총 {n}년 {m}개월",
+    "총 {n}년 {m}개월",
+    "희망연봉  {sal}만원",
+    "희망연봉 : 회사내규에 따름",
+    "회사내규에 따름    직전 연봉 : {sal} 만원",
+    "직전 연봉 : {sal}만원",
+    "직전연봉 : 협의만",
+    "직전 연봉 : 면접 후 결정",
+    "나의 스킬",
+    "소프트스킬입니다 경력",
+    "여러 현장에서 남다른 성과 신입 교육 담당",
+    "",
+    "",
+]
+
+
+def make_header_block(seed: int) -> str:
+    """사람인 헤더 형태 합성 블록 (줄 선택·순서·공백을 seed 로 흔듦)."""
+    r = random.Random(seed)
+    values = {
+        "field": r.choice(["프레스", "금형", "설비보전", "품질관리"]),
+        "d": r.randint(1, 31),
+        "name": r.choice(_NAMES),
+        "name2": r.choice(_NAMES),
+        "y": r.choice([1975, 1991, 1998, 2003, 1940]),
+        "a": r.randint(19, 60),
+        "mail": r.choice(["hong", "kim.cs", "p_ms"]),
+        "p4": f"{r.randint(0, 9999):04d}",
+        "p4b": f"{r.randint(0, 9999):04d}",
+        "zip": f"{r.randint(10000, 99999)}",
+        "z3": f"{r.randint(100, 999)}",
+        "z3b": f"{r.randint(100, 999)}",
+        "n": r.randint(0, 30),
+        "m": r.randint(0, 11),
+        "sal": r.choice(["3,800", "4200", "2,400", "5,000"]),
+    }
+    lines = [r.choice(_LINES).format(**values) for _ in range(r.randint(3, 18))]
+    if r.random() < 0.7:
+        lines.insert(0, _LINES[r.randint(0, 2)].format(**values))
+    out = []
+    for line in lines:
+        op = r.random()
+        if op < 0.1 and out:
+            out[-1] += " " * r.randint(1, 4) + line  # 같은 줄로 합침 (-layout 열)
+        elif op < 0.15:
+            out.append("  " + line.replace(" ", "\t", 1))
+        elif op < 0.2:
+            out.append(line.replace(" ", "\n", 1))
+        else:
+            out.append(line)
+    return "\n".join(out) + r.choice(["", "\n", "   ", "\n\n"])
+
+
+def _time_ms(fn, blocks: list[str], repeat: int) -> float:
+    """repeat회 중 최소 시간 (ms, 전체 블록 1회 처리)."""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for block in blocks:
+            fn(block)
+        ms = (time.perf_counter() - t0) * 1000
+        best = ms if best is None else min(best, ms)
+    return best
+
+
+def main():
+    args = sys.argv[1:]
+    cases = 5000
+    repeat = 5
+    while args:
+        if args[0] == "--cases" and len(args) >= 2 and args[1].isdigit():
+            cases = int(args[1])
+            args = args[2:]
+        elif args[0] == "--repeat" and len(args) >= 2 and args[1].isdigit():
+            repeat = max(1, int(args[1]))
+            args = args[2:]
+        else:
+            break
+    if len(args) > 1 or (args and not Path(args[0]).exists()):
+        print(json.dumps({"error": "Usage: bench_header_block.py [--cases N] [--repeat N] [stage1_raw.txt|dir]"}), file=sys.stderr)
+        sys.exit(1)
+    if args:
+        target = Path(args[0])
+        paths = iter_stage1_files(str(target)) if target.is_dir() else [str(target)]
+        named = []
+        for path in paths:
+            text = read_stage1_text(path)[0]
+            for corpus in (False, True):
+                header = parse_pdf_resume._split_stage2_sections(text, corpus).join_blocks(2)
+                named.append((f"{Path(path).name}:header{'+corpus' if corpus else ''}", header))
+            named.append((f"{Path(path).name}:full", text))
+    else:
+        named = [(f"synthetic_{i}", make_header_block(i)) for i in range(cases)]
+
+    mismatches = []
+    for name, block in named:
+        ref = reference_parse_header_block(block)
+        cur = parse_pdf_resume.parse_header_block(block)
+        if ref != cur:
+            mismatches.append({"case": name, "reference": ref, "current": cur})
+    blocks = [block for _, block in named]
+    ref_ms = _time_ms(reference_parse_header_block, blocks, repeat)
+    cur_ms = _time_ms(parse_pdf_resume.parse_header_block, blocks, repeat)
+    print(json.dumps({
+        "cases": len(named),
+        "repeat": repeat,
+        "identical": not mismatches,
+        "mismatches": mismatches[:5],
+        "referenceMs": round(ref_ms, 3),
+        "currentMs": round(cur_ms, 3),
+        "speedup": round(ref_ms / cur_ms, 2) if cur_ms else None,
+    }, ensure_ascii=False, indent=2))
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
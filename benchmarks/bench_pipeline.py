@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파이프라인 전체 벤치마크 (DOCX 구조·이미지 추출, 2단계 섹션 분할·parse_* 함수, PDF end-to-end).
+
+케이스마다 입력 전체를 repeat회(최소 MIN_CASE_SEC초) 돌려 호출 1회당 시간(ms)의 평균/p50/p95/최대, 초당 처리 수(throughput),
+최대 RSS(MB)를 JSON으로 냅니다. 케이스는 각각 새 프로세스(spawn)에서 돌리므로 peakRssMb 는 그 케이스만의 값이고,
+prepRssMb 는 import·입력 준비가 끝난 시점의 최대 RSS입니다 (resource 모듈이 없는 Windows에서는 null).
+
+입력 (없는 쪽 케이스는 "skipped" 로 표시):
+    docx   --docx 폴더의 *.docx (기본 generated_resumes/) → extract_table_structure(python-docx / lxml / lxml+사진 / 양식 delta), extract_images_from_docx
+    pdf    --stage1 폴더의 *.stage1_raw.txt (기본 pdf_resume/debug/) → split_into_sections*, parse_* 함수, parse_pdf_resume_text
+           1단계 원문이 없으면 --pdf 폴더 PDF에서 한 번 추출해 씀 (--debug-dir 로 저장한 원문을 쓰면 1단계 도구 없이 측정)
+    form   --stage1 폴더의 *_pdftotext.txt → parse_docx_form_pdf_text, 섹션 파서(SECTION_PARSERS)
+    e2e    --pdf 폴더/manifest의 PDF (기본 pdf_resume/) → parse_pdf_resume (1단계 추출 + 2단계 + 증명사진, 캐시 없음)
+
+--out 으로 결과를 저장해 두고 다음 실행에서 --compare 로 주면 케이스별 평균/p95 변화율(%)을 붙이고,
+평균이 --threshold(기본 10%) 넘게 느려진 케이스가 있으면 exit 1 (입력 수가 다른 케이스는 비교하지 않음).
+
+사용법:
+    python3 benchmarks/bench_pipeline.py [--repeat N] [--only docx,pdf.parse_career_entries,...] [--out results.json]
+        [--docx DIR] [--stage1 DIR] [--pdf DIR|manifest.txt] [--pdftotext PATH] [--engine NAME]
+        [--compare baseline.json [--threshold PCT]]
+    python3 benchmarks/bench_pipeline.py --list
+"""
+
+import json
+import multiprocessing
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT / "scripts"))
+
+from stage1_cache import iter_stage1_files, read_stage1_text  # noqa: E402
+
+DEFAULT_CONFIG = {
+    "docx": str(_ROOT / "generated_resumes"),
+    "stage1": str(_ROOT / "pdf_resume" / "debug"),
+    "pdf": str(_ROOT / "pdf_resume"),
+    "pdftotext": None,
+    "engine": None,
+}
+
+# 케이스당 최소 측정 시간 (초). repeat회를 채운 뒤에도 이 시간이 안 됐으면 입력 전체를 더 돎
+MIN_CASE_SEC = 0.5
+
+# 2단계 parse_* 함수 → 입력 섹션 (parse_pdf_resume_text 가 넘기는 것과 같은 구간)
+PDF_PARSER_SECTIONS = (
+    ("parse_header_block", None),  # 첫 두 블록 (join_blocks(2))
+    ("parse_summary_table_from_career_block", "career_summary"),
+    ("parse_career_entries", "career_summary"),
+    ("parse_education_entries", "education_header"),
+    ("parse_certification_entries", "certifications"),
+    ("parse_employment_preference", "employment_preference"),
+    ("parse_portfolio", "portfolio"),
+)
+
+
+def _p95(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+
+
+def _peak_rss_mb():
+    """이 프로세스의 최대 RSS (MB). ru_maxrss 단위: Linux KB, macOS bytes."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+# ---------------------------------------------------------------------------
+# 입력 준비 (자식 프로세스 안에서 실행, 시간 측정 밖)
+# ---------------------------------------------------------------------------
+
+
+def _docx_inputs(config: dict) -> tuple[list, str]:
+    folder = Path(config["docx"])
+    paths = sorted(str(p) for p in folder.glob("*.docx")) if folder.is_dir() else []
+    return paths, f"docx:{folder}"
+
+
+def _stage1_files(config: dict, suffix: str) -> list[str]:
+    folder = Path(config["stage1"])
+    if not folder.is_dir():
+        return []
+    return [p for p in iter_stage1_files(str(folder)) if p.endswith(suffix)]
+
+
+def _pdf_paths(config: dict) -> list[str]:
+    import parse_pdf_resume
+
+    target = Path(config["pdf"])
+    if not target.exists():
+        return []
+    return parse_pdf_resume._iter_batch_paths(str(target))
+
+
+def _pdf_texts(config: dict) -> tuple[list[str], str]:
+    """사람인 PDF 1단계 텍스트: 저장된 원문이 있으면 그것, 없으면 PDF에서 한 번 추출."""
+    paths = _stage1_files(config, ".stage1_raw.txt")
+    if paths:
+        return [read_stage1_text(p)[0] for p in paths], f"stage1:{config['stage1']}"
+    pdfs = _pdf_paths(config)
+    if pdfs:
+        from pdf_text_engines import DEFAULT_ENGINE, extract_text
+
+        engine = config["engine"] or DEFAULT_ENGINE
+        return [extract_text(p, engine, config["pdftotext"]) for p in pdfs], f"pdf:{config['pdf']}"
+    return [], f"stage1:{config['stage1']}, pdf:{config['pdf']}"
+
+
+def _pdf_spans(config: dict) -> tuple[list, str]:
+    import parse_pdf_resume
+
+    texts, source = _pdf_texts(config)
+    return [parse_pdf_resume.split_section_spans(t) for t in texts], source
+
+
+def _form_texts(config: dict) -> tuple[list, str]:
+    paths = _stage1_files(config, "_pdftotext.txt")
+    return [read_stage1_text(p)[0] for p in paths], f"stage1:{config['stage1']}"
+
+
+# ---------------------------------------------------------------------------
+# 케이스: 이름 → (입력 준비, 준비된 입력으로 (호출 함수, 인자 목록) 만들기)
+# ---------------------------------------------------------------------------
+
+
+def _case_extract_table_structure(config):
+    from extract_resume_form_structure import extract_table_structure
+
+    paths, source = _docx_inputs(config)
+    return extract_table_structure, paths, source
+
+
+def _case_extract_table_structure_lxml(config):
+    from extract_resume_form_structure import extract_table_structure
+
+    paths, source = _docx_inputs(config)
+    return (lambda p: extract_table_structure(p, engine="lxml")), paths, source
+
+
+def _case_extract_table_structure_photo(config):
+    from extract_resume_form_structure import extract_table_structure
+
+    paths, source = _docx_inputs(config)
+    photo_dir = tempfile.mkdtemp(prefix="bench_docx_photo_")
+    return (lambda p: extract_table_structure(p, engine="lxml", photo_dir=photo_dir)), paths, source
+
+
+def _case_extract_table_structure_delta(config):
+    from extract_resume_form_structure import extract_table_structure, load_template, template_delta
+
+    paths, source = _docx_inputs(config)
+    template = load_template(str(_ROOT / "resume_form_structure.json"))
+    return (lambda p: template_delta(extract_table_structure(p, engine="lxml"), template)), paths, source
+
+
+def _case_extract_images_from_docx(config):
+    from extract_images_from_docx import extract_images_from_docx
+
+    paths, source = _docx_inputs(config)
+    out_dir = tempfile.mkdtemp(prefix="bench_images_")
+    return (lambda p: extract_images_from_docx(p, out_dir)), paths, source
+
+
+def _case_split_into_sections(config):
+    import parse_pdf_resume
+
+    texts, source = _pdf_texts(config)
+    return parse_pdf_resume.split_into_sections, texts, source
+
+
+def _case_split_into_sections_by_headers(config):
+    import parse_pdf_resume
+
+    headers = parse_pdf_resume.load_section_headers_from_corpus()
+    if not headers:
+        raise FileNotFoundError("common_headers.json not found")
+    headers = list(headers)
+    texts, source = _pdf_texts(config)
+    return (lambda t: parse_pdf_resume.split_into_sections_by_headers(t, headers)), texts, source
+
+
+def _make_pdf_parser_case(name: str, section):
+    def case(config):
+        import parse_pdf_resume
+
+        spans_list, source = _pdf_spans(config)
+        if section is None:
+            blocks = [s.join_blocks(2) for s in spans_list]
+        else:
+            blocks = [s.section(section) for s in spans_list]
+        return getattr(parse_pdf_resume, name), [b for b in blocks if b], source
+
+    return case
+
+
+def _case_parse_pdf_resume_text(config):
+    import parse_pdf_resume
+
+    texts, source = _pdf_texts(config)
+    return parse_pdf_resume.parse_pdf_resume_text, texts, source
+
+
+def _case_parse_pdf_resume(config):
+    import parse_pdf_resume
+    from pdf_text_engines import DEFAULT_ENGINE
+
+    pdfs = _pdf_paths(config)
+    photo_dir = tempfile.mkdtemp(prefix="bench_photos_")
+    engine = config["engine"] or DEFAULT_ENGINE
+
+    def run(path):
+        return parse_pdf_resume.parse_pdf_resume(path, config["pdftotext"], photo_dir=photo_dir, engine=engine)
+
+    return run, pdfs, f"pdf:{config['pdf']}"
+
+
+def _case_parse_docx_form_pdf_text(config):
+    import parse_docx_form_pdf
+
+    texts, source = _form_texts(config)
+    return parse_docx_form_pdf.parse_docx_form_pdf_text, texts, source
+
+
+def _make_form_parser_case(key: str, parser_name: str):
+    def case(config):
+        import parse_docx_form_pdf
+
+        texts, source = _form_texts(config)
+        blocks = [parse_docx_form_pdf.split_sections(t).get(key, "") for t in texts]
+        return getattr(parse_docx_form_pdf, parser_name), [b for b in blocks if b], source
+
+    return case
+
+
+def _form_parser_names() -> list[tuple[str, str]]:
+    """parse_docx_form_pdf.SECTION_PARSERS 의 (섹션 키, 함수 이름). import 실패(환경 문제)면 빈 목록."""
+    try:
+        import parse_docx_form_pdf
+    except ImportError:
+        return []
+    return [(key, parser.__name__) for key, parser in parse_docx_form_pdf.SECTION_PARSERS]
+
+
+CASES = {
+    "docx.extract_table_structure": _case_extract_table_structure,
+    "docx.extract_table_structure_lxml": _case_extract_table_structure_lxml,
+    "docx.extract_table_structure_photo": _case_extract_table_structure_photo,
+    "docx.extract_table_structure_delta": _case_extract_table_structure_delta,
+    "docx.extract_images_from_docx": _case_extract_images_from_docx,
+    "pdf.split_into_sections": _case_split_into_sections,
+    "pdf.split_into_sections_by_headers": _case_split_into_sections_by_headers,
+}
+for _name, _section in PDF_PARSER_SECTIONS:
+    CASES[f"pdf.{_name}"] = _make_pdf_parser_case(_name, _section)
+CASES["pdf.parse_pdf_resume_text"] = _case_parse_pdf_resume_text
+CASES["form.parse_docx_form_pdf_text"] = _case_parse_docx_form_pdf_text
+for _key, _parser_name in _form_parser_names():
+    CASES[f"form.{_parser_name}"] = _make_form_parser_case(_key, _parser_name)
+CASES["e2e.parse_pdf_resume"] = _case_parse_pdf_resume
+
+
+def run_case(name: str, config: dict, repeat: int) -> dict:
+    """케이스 하나 실행 (자식 프로세스). 입력 준비 후 입력 전체를 repeat회 이상 돌려 호출마다 시간 기록."""
+    try:
+        fn, inputs, source = CASES[name](config)
+    except (ImportError, OSError, SystemExit) as e:
+        # extract_* 모듈은 python-docx 가 없으면 import 시 sys.exit(1)
+        return {"skipped": f"{type(e).__name__}: {e}"}
+    if not inputs:
+        return {"skipped": f"no input ({source})"}
+    prep_rss = _peak_rss_mb()
+    samples = []
+    errors = 0
+    rounds = 0
+    started = time.perf_counter()
+    # 빠른 케이스(µs 단위 parse_*)는 repeat회만으로는 표본이 적어 비교가 흔들리므로 MIN_CASE_SEC 동안은 계속 돎
+    while rounds < repeat or time.perf_counter() - started < MIN_CASE_SEC:
+        rounds += 1
+        for item in inputs:
+            t0 = time.perf_counter()
+            try:
+                fn(item)
+            except Exception:
+                errors += 1
+            samples.append((time.perf_counter() - t0) * 1000)
+    total_sec = sum(samples) / 1000
+    return {
+        "source": source,
+        "inputs": len(inputs),
+        "rounds": rounds,
+        "calls": len(samples),
+        "errors": errors,
+        "meanMs": round(statistics.mean(samples), 3),
+        "p50Ms": round(statistics.median(samples), 3),
+        "p95Ms": round(_p95(samples), 3),
+        "maxMs": round(max(samples), 3),
+        "throughputPerSec": round(len(samples) / total_sec, 1) if total_sec else None,
+        "prepRssMb": prep_rss,
+        "peakRssMb": _peak_rss_mb(),
+    }
+
+
+def _select_cases(only) -> list[str]:
+    """--only: 케이스 이름 또는 접두(docx, pdf, form, e2e) 쉼표 목록."""
+    if not only:
+        return list(CASES)
+    return [name for name in CASES if any(name == o or name.startswith(o + ".") for o in only)]
+
+
+def compare(current: dict, baseline: dict, threshold_pct: float) -> dict:
+    """케이스별 평균/p95/throughput/peakRss 변화율(%). 평균이 threshold_pct 넘게 늘면 regression."""
+    rows = {}
+    regressions = []
+    base_cases = baseline.get("cases") or {}
+    for name, cur in current["cases"].items():
+        base = base_cases.get(name)
+        if not base or "meanMs" not in base or "meanMs" not in cur:
+            continue
+        if base.get("inputs") != cur.get("inputs"):
+            rows[name] = {"skipped": f"input count differs ({base.get('inputs')} → {cur.get('inputs')})"}
+            continue
+        row = {}
+        for key in ("meanMs", "p95Ms", "throughputPerSec", "peakRssMb"):
+            if base.get(key) and cur.get(key) is not None:
+                row[key + "DeltaPct"] = round((cur[key] - base[key]) / base[key] * 100, 1)
+        row["regression"] = row.get("meanMsDeltaPct", 0) > threshold_pct
+        if row["regression"]:
+            regressions.append(name)
+        rows[name] = row
+    return {"thresholdPct": threshold_pct, "regressions": regressions, "cases": rows}
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 3
+    only = None
+    out_path = None
+    baseline_path = None
+    threshold = 10.0
+    config = dict(DEFAULT_CONFIG)
+    while args:
+        if args[0] == "--repeat" and len(args) >= 2 and args[1].isdigit():
+            repeat = max(1, int(args[1]))
+            args = args[2:]
+        elif args[0] == "--only" and len(args) >= 2:
+            only = [o for o in args[1].split(",") if o]
+            args = args[2:]
+        elif args[0] == "--out" and len(args) >= 2:
+            out_path = args[1]
+            args = args[2:]
+        elif args[0] == "--compare" and len(args) >= 2:
+            baseline_path = args[1]
+            args = args[2:]
+        elif args[0] == "--threshold" and len(args) >= 2:
+            try:
+                threshold = float(args[1])
+            except ValueError:
+                break
+            args = args[2:]
+        elif args[0] in ("--docx", "--stage1", "--pdf", "--pdftotext", "--engine") and len(args) >= 2:
+            config[args[0][2:]] = args[1]
+            args = args[2:]
+        elif args[0] == "--list":
+            print(json.dumps(list(CASES), ensure_ascii=False, indent=2))
+            return
+        else:
+            break
+    names = _select_cases(only)
+    if args or not names or (baseline_path and not Path(baseline_path).is_file()):
+        print(json.dumps({"error": "Usage: bench_pipeline.py [--repeat N] [--only CASES] [--out FILE] [--docx DIR] [--stage1 DIR] [--pdf DIR|manifest.txt] [--pdftotext PATH] [--engine NAME] [--compare baseline.json [--threshold PCT]] | --list"}), file=sys.stderr)
+        sys.exit(1)
+
+    cases = {}
+    # 케이스마다 새 프로세스: 앞 케이스의 import·캐시·메모리가 시간과 RSS에 섞이지 않게
+    ctx = multiprocessing.get_context("spawn")
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+            cases[name] = pool.submit(run_case, name, config, repeat).result()
+
+    result = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "cases": cases,
+    }
+    if out_path:
+        Path(out_path).write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    regressed = False
+    if baseline_path:
+        baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+        result["comparison"] = compare(result, baseline, threshold)
+        regressed = bool(result["comparison"]["regressions"])
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+split_into_sections_by_headers() 마이크로 벤치마크.
+
+경력기술서·자기소개서가 긴 사람인 PDF(수백~수천 줄)에서 헤더 분할 시간을 잽니다.
+기존 구현(줄마다 모든 헤더 startswith + 헤더 적중 시 앞으로 빈 줄 재탐색)을 reference로 두고
+현재 구현(헤더 trie + 역방향 빈 줄 카운트)과 결과가 같은지 확인한 뒤 시간을 비교합니다.
+
+입력: 인자로 1단계 원문(*.stage1_raw.txt) 파일/폴더를 주면 그것을, 없으면 길이별 합성 텍스트를 사용.
+
+사용법:
+    python3 benchmarks/bench_section_split.py
+    python3 benchmarks/bench_section_split.py --repeat 50 ./debug
+"""
+
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import parse_pdf_resume  # noqa: E402
+from stage1_cache import iter_stage1_files, read_stage1_text  # noqa: E402
+
+
+def reference_split_into_sections_by_headers(full_text: str, headers):
+    """변경 전 구현 (O(줄 수 × 헤더 수) + 적중마다 빈 줄 재탐색). 결과 비교·시간 기준용."""
+    lines = full_text.split("\n")
+    use_trailing = bool(headers and len(headers) > 0 and isinstance(headers[0], dict))
+    if use_trailing:
+        sorted_headers = sorted(
+            (h for h in headers if isinstance(h, dict) and h.get("text")),
+            key=lambda h: (-len(h["text"]), h["text"]),
+        )
+    else:
+        plain = [h for h in headers if isinstance(h, str)]
+        sorted_headers = sorted(
+            ({"text": h, "trailing_min_empty_lines": 0} for h in set(plain)),
+            key=lambda h: (-len(h["text"]), h["text"]),
+        )
+    hits = []
+    for i, raw in enumerate(lines):
+        line = raw.strip()
+        if not line:
+            continue
+        for h in sorted_headers:
+            text = h["text"]
+            if not line.startswith(text):
+                continue
+            if use_trailing and h.get("trailing_min_empty_lines", 0) > 0:
+                required = h["trailing_min_empty_lines"]
+                if text.strip() == "자격/어학/수상":
+                    required = 0
+                elif text.strip() == "자격":
+                    required = min(required, 1)
+                elif text.strip() in ("학력 고등학교 졸업", "학력 고등학교", "학력"):
+                    required = 0
+                j = i + 1
+                empty_count = 0
+                while j < len(lines):
+                    if lines[j].strip():
+                        break
+                    empty_count += 1
+                    j += 1
+                if empty_count < required:
+                    continue
+            hits.append((i, text))
+            break
+    hits.sort(key=lambda x: x[0])
+    sections, blocks, block_section_names = {}, [], []
+    if not hits:
+        sections["header"] = full_text.strip()
+        blocks.append(full_text.strip())
+        block_section_names.append("header")
+        return sections, blocks, block_section_names
+    first_idx = hits[0][0]
+    if first_idx > 0:
+        header_block = "\n".join(lines[:first_idx]).strip()
+        if header_block:
+            sections["header"] = header_block
+            blocks.append(header_block)
+            block_section_names.append("header")
+    for k, (idx, header) in enumerate(hits):
+        section_name = parse_pdf_resume.CORPUS_HEADER_TO_SECTION.get(header.strip(), "unknown")
+        end_idx = hits[k + 1][0] if k + 1 < len(hits) else len(lines)
+        content = "\n".join(lines[idx:end_idx]).strip()
+        if not content:
+            continue
+        if section_name in sections:
+            sections[section_name] += "\n\n" + content
+        else:
+            sections[section_name] = content
+        blocks.append(content)
+        block_section_names.append(section_name)
+    return sections, blocks, block_section_names
+
+
+def make_long_resume_text(body_lines: int, seed: int = 0) -> str:
+    """경력기술서·자기소개서 본문이 body_lines 줄인 사람인 형태 합성 텍스트.
+    본문 중간에 헤더와 같은 단어로 시작하는 줄(빈 줄 조건 불만족)을 섞어 trailing 검사도 타게 함."""
+    r = random.Random(seed)
+    words = ["프레스", "금형", "설비", "보전", "품질", "개선", "생산", "라인", "관리", "자동화", "PLC", "공정"]
+    out = [
+        "지원분야  프레스                          입사지원일  2026년 01월 05일 (월)",
+        "",
+        "홍길동 경력",
+        "남, 1991 (34세)",
+        "이메일  hong@example.com     휴대폰  010-1234-5678",
+        "주소  (15000) 경기 시흥시 정왕동 123-4",
+        "",
+        "",
+        "경력 총 6년 3개월",
+        "",
+        "",
+        "2019.03 ~ 재직중    (주)대한정밀 생산팀    프레스 반장",
+        "2017.01 ~ 2019.02   (주)한국금형 금형팀    금형 보전",
+        "",
+        "",
+        "학력 고등학교 졸업",
+        "2007.03 ~ 2010.02   시흥고등학교   졸업",
+        "",
+        "",
+        "경력기술서",
+        "",
+    ]
+    half = body_lines // 2
+    for i in range(half):
+        if i % 9 == 8:
+            out.append("")
+        elif i % 37 == 5:
+            out.append("경력 사항 중 " + " ".join(r.choice(words) for _ in range(6)))
+        else:
+            out.append("  " + "   ".join(" ".join(r.choice(words) for _ in range(4)) for _ in range(3)))
+    out += ["", "", "자기소개서", ""]
+    for i in range(body_lines - half):
+        if i % 6 == 5:
+            out.append("")
+        elif i % 41 == 7:
+            out.append("학력 이후 " + " ".join(r.choice(words) for _ in range(8)))
+        else:
+            out.append(" ".join(r.choice(words) for _ in range(14)))
+    return "\n".join(out) + "\n"
+
+
+def _time(fn, text, headers, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(text, headers)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 20
+    if len(args) >= 2 and args[0] == "--repeat" and args[1].isdigit():
+        repeat = int(args[1])
+        args = args[2:]
+    headers = parse_pdf_resume.load_section_headers_from_corpus()
+    if not headers:
+        print(json.dumps({"error": "common_headers.json not found"}), file=sys.stderr)
+        sys.exit(1)
+    headers = list(headers)
+    if args:
+        target = Path(args[0])
+        paths = iter_stage1_files(str(target)) if target.is_dir() else [str(target)]
+        cases = [(Path(p).name, read_stage1_text(p)[0]) for p in paths]
+    else:
+        cases = [(f"synthetic_{n}_lines", make_long_resume_text(n, n)) for n in (200, 1000, 5000, 20000)]
+
+    results = []
+    for name, text in cases:
+        ref = reference_split_into_sections_by_headers(text, headers)
+        cur = parse_pdf_resume.split_into_sections_by_headers(text, headers)
+        ref_ms = _time(reference_split_into_sections_by_headers, text, headers, repeat)
+        cur_ms = _time(parse_pdf_resume.split_into_sections_by_headers, text, headers, repeat)
+        results.append({
+            "case": name,
+            "lines": text.count("\n") + 1,
+            "headers": len(headers),
+            "identical": ref == cur,
+            "referenceMeanMs": round(statistics.mean(ref_ms), 3),
+            "currentMeanMs": round(statistics.mean(cur_ms), 3),
+            "speedup": round(statistics.mean(ref_ms) / statistics.mean(cur_ms), 2) if statistics.mean(cur_ms) else None,
+        })
+    print(json.dumps({"repeat": repeat, "results": results}, ensure_ascii=False, indent=2))
+    if not all(r["identical"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
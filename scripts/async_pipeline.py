@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+1단계(pdftotext)와 2단계(섹션 분할·parse_*)를 겹쳐 돌리는 asyncio 일괄 파싱 파이프라인 (NDJSON).
+
+parse_pdf_resume.py --batch 는 파일마다 한 워커 프로세스에서 pdftotext → 2단계를 차례로 돌리므로,
+pdftotext 를 기다리는 동안 그 워커의 2단계 자리가 비고 반대도 마찬가지입니다. 여기서는
+  - 추출: asyncio.create_subprocess_exec 로 pdftotext 를 동시에 최대 --extract-concurrency 개까지 실행
+  - 큐: 추출된 텍스트를 크기 --queue-size 인 asyncio.Queue 에 넣음. 가득 차면 추출 쪽이 기다림 (backpressure, 메모리 상한)
+  - 파싱: --parse-workers 개의 소비자가 큐에서 꺼내 ProcessPoolExecutor 에서 2단계 실행
+끝나는 순서대로 한 줄씩 {"path", "result"|"error", "latencyMs": {extract, queue, parse, total}} 을 출력하고,
+마지막 줄 {"summary": {..., extractMsTotal, parseMsTotal}} 로 두 단계 합 대비 실제 경과 시간을 비교할 수 있습니다.
+
+pdftotext 엔진만 비동기 서브프로세스로 돌리고, 다른 엔진(pymupdf)은 스레드에서 extract_text 를 부릅니다.
+--stage1-cache 가 있으면 같은 내용의 PDF는 pdftotext 를 건너뜀 (캐시 조회·저장은 이벤트 루프 스레드에서만).
+증명사진·--debug-dir 은 지원하지 않으므로 필요하면 parse_pdf_resume.py --batch 를 쓰세요.
+
+사용법:
+    python3 scripts/async_pipeline.py [--pdftotext PATH] [--engine pdftotext|pymupdf] [--type pdf_resume|docx_form_pdf|auto]
+        [--use-corpus-headers] [--stage1-cache DB] [--extract-concurrency N] [--parse-workers N] [--queue-size N]
+        <폴더|manifest.txt>
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, TextIO
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from pdf_preflight import PdfPreflightError, error_fields, failure_code, kill_group, pdftotext_timeout, preflight  # noqa: E402
+from pdf_text_engines import DEFAULT_ENGINE, engine_names  # noqa: E402
+
+PARSE_TYPES = ("pdf_resume", "docx_form_pdf", "auto")
+
+
+def _parse_text_job(text: str, parse_type: str, engine: str, use_corpus_headers: bool, base_name: str) -> tuple[dict, float]:
+    """프로세스 풀 작업 단위: 1단계 텍스트 → 2단계 결과, 파싱 시간(ms). 예외는 그대로 올림."""
+    started = time.perf_counter()
+    if parse_type == "docx_form_pdf":
+        import parse_docx_form_pdf
+
+        result = parse_docx_form_pdf.parse_docx_form_pdf_text(text)
+    elif parse_type == "auto":
+        import pdf_format_router
+
+        result = pdf_format_router.parse_any_pdf_text(text, engine, use_corpus_headers)
+    else:
+        import parse_pdf_resume
+
+        result = parse_pdf_resume.parse_pdf_resume_text(text, engine, use_corpus_headers, base_name=base_name)
+    return result, (time.perf_counter() - started) * 1000
+
+
+async def extract_pdftotext_async(pdf_path: str, pdftotext_exe: Optional[str] = None) -> str:
+    """pdftotext -layout 을 비동기 서브프로세스로 실행 (_run_pdftotext 와 같은 사전 검사·인자·디코딩·제한 시간).
+    시간 초과면 프로세스 그룹째 죽임. 실패는 PdfPreflightError."""
+    info = await asyncio.to_thread(preflight, pdf_path)
+    timeout = pdftotext_timeout(info)
+    kwargs = {"start_new_session": True} if os.name == "posix" else {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    proc = await asyncio.create_subprocess_exec(
+        pdftotext_exe or "pdftotext", "-layout", "-enc", "UTF-8", pdf_path, "-",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        **kwargs,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        await asyncio.to_thread(kill_group, proc)
+        await proc.wait()
+        raise PdfPreflightError("timeout", f"{os.path.basename(pdftotext_exe or 'pdftotext')} timed out after {timeout}s")
+    if proc.returncode != 0:
+        raise PdfPreflightError(
+            failure_code(info),
+            f"pdftotext failed: {(stderr or stdout).decode('utf-8', errors='replace')}",
+        )
+    return stdout.decode("utf-8", errors="replace")
+
+
+async def run_pipeline(
+    paths: list[str],
+    pdftotext_exe: Optional[str] = None,
+    engine: str = DEFAULT_ENGINE,
+    parse_type: str = "pdf_resume",
+    use_corpus_headers: bool = False,
+    stage1_cache=None,
+    extract_concurrency: Optional[int] = None,
+    parse_workers: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    out: Optional[TextIO] = None,
+) -> dict:
+    """paths 를 추출·파싱하며 끝나는 순서대로 NDJSON 출력, 마지막 줄 summary 출력 후 summary 반환."""
+    out = out or sys.stdout
+    cpus = os.cpu_count() or 1
+    extract_concurrency = max(1, extract_concurrency or cpus)
+    parse_workers = max(1, min(parse_workers or cpus, len(paths) or 1))
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size or 2 * parse_workers))
+    limit = asyncio.Semaphore(extract_concurrency)
+    loop = asyncio.get_running_loop()
+    counts = {"ok": 0, "errors": 0}
+    totals = {"extractMsTotal": 0.0, "parseMsTotal": 0.0}
+    started = time.perf_counter()
+
+    def _emit(record: dict) -> None:
+        counts["errors" if "error" in record else "ok"] += 1
+        out.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        out.flush()
+
+    async def _extract(path: str) -> None:
+        async with limit:
+            t0 = time.perf_counter()
+            try:
+                if not Path(path).exists():
+                    raise FileNotFoundError(f"File not found: {path}")
+                text = key = None
+                if stage1_cache is not None:
+                    from stage1_cache import stage1_key
+
+                    key = await asyncio.to_thread(stage1_key, path, pdftotext_exe, engine)
+                    text = stage1_cache.get(*key)
+                if text is None:
+                    if engine == "pdftotext":
+                        text = await extract_pdftotext_async(path, pdftotext_exe)
+                    else:
+                        from pdf_text_engines import extract_text
+
+                        text = await asyncio.to_thread(extract_text, path, engine, pdftotext_exe)
+                    if not text or not text.strip():
+                        raise RuntimeError(f"{engine} 추출 결과가 비어 있습니다.")
+                    if key is not None:
+                        stage1_cache.put(*key, text)
+            except Exception as e:
+                extract_ms = (time.perf_counter() - t0) * 1000
+                totals["extractMsTotal"] += extract_ms
+                _emit({"path": path, **error_fields(e), "latencyMs": {"extract": round(extract_ms, 3), "total": round(extract_ms, 3)}})
+                return
+            extract_ms = (time.perf_counter() - t0) * 1000
+            totals["extractMsTotal"] += extract_ms
+            # 큐에 들어갈 때까지 추출 자리를 잡고 있음: 메모리에 있는 텍스트 ≤ 동시 추출 수 + 큐 크기 + 파싱 워커 수
+            await queue.put((path, text, t0, extract_ms, time.perf_counter()))
+
+    async def _consume(pool: ProcessPoolExecutor) -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                queue.task_done()
+                return
+            path, text, t0, extract_ms, queued_at = item
+            submitted = time.perf_counter()
+            # 큐 대기는 파싱 성공·실패와 상관없이 기록 (실패한 파일의 지연도 같은 기준으로 비교)
+            latency = {"extract": round(extract_ms, 3), "queue": round((submitted - queued_at) * 1000, 3)}
+            try:
+                result, parse_ms = await loop.run_in_executor(
+                    pool, _parse_text_job, text, parse_type, engine, use_corpus_headers, Path(path).stem
+                )
+                totals["parseMsTotal"] += parse_ms
+                record = {"path": path, "result": result}
+                latency["parse"] = round(parse_ms, 3)
+            except Exception as e:  # 파서 예외, 워커 프로세스가 죽은 경우 등
+                record = {"path": path, "error": f"{type(e).__name__}: {e}"}
+            latency["total"] = round((time.perf_counter() - t0) * 1000, 3)
+            record["latencyMs"] = latency
+            _emit(record)
+            queue.task_done()
+
+    with ProcessPoolExecutor(max_workers=parse_workers) as pool:
+        consumers = [asyncio.create_task(_consume(pool)) for _ in range(parse_workers)]
+        await asyncio.gather(*(_extract(p) for p in paths))
+        for _ in consumers:
+            await queue.put(None)
+        await asyncio.gather(*consumers)
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "files": len(paths),
+        "ok": counts["ok"],
+        "errors": counts["errors"],
+        "extractConcurrency": extract_concurrency,
+        "parseWorkers": parse_workers,
+        "queueSize": queue.maxsize,
+        "elapsedSec": round(elapsed, 3),
+        "filesPerSec": round(len(paths) / elapsed, 2) if elapsed > 0 else None,
+        "extractMsTotal": round(totals["extractMsTotal"], 3),
+        "parseMsTotal": round(totals["parseMsTotal"], 3),
+    }
+    out.write(json.dumps({"summary": summary}, ensure_ascii=False, separators=(",", ":")) + "\n")
+    out.flush()
+    return summary
+
+
+def main():
+    args = sys.argv[1:]
+    pdftotext_exe = None
+    engine = DEFAULT_ENGINE
+    parse_type = "pdf_resume"
+    use_corpus_headers = False
+    stage1_cache_db = None
+    extract_concurrency = parse_workers = queue_size = None
+    while args:
+        if args[0] == "--pdftotext" and len(args) >= 2:
+            pdftotext_exe = args[1]
+            args = args[2:]
+        elif args[0] == "--engine" and len(args) >= 2 and args[1] in engine_names():
+            engine = args[1]
+            args = args[2:]
+        elif args[0] == "--type" and len(args) >= 2 and args[1] in PARSE_TYPES:
+            parse_type = args[1]
+            args = args[2:]
+        elif args[0] == "--use-corpus-headers":
+            use_corpus_headers = True
+            args = args[1:]
+        elif args[0] == "--stage1-cache" and len(args) >= 2:
+            stage1_cache_db = args[1]
+            args = args[2:]
+        elif args[0] == "--extract-concurrency" and len(args) >= 2 and args[1].isdigit():
+            extract_concurrency = int(args[1])
+            args = args[2:]
+        elif args[0] == "--parse-workers" and len(args) >= 2 and args[1].isdigit():
+            parse_workers = int(args[1])
+            args = args[2:]
+        elif args[0] == "--queue-size" and len(args) >= 2 and args[1].isdigit():
+            queue_size = int(args[1])
+            args = args[2:]
+        else:
+            break
+    if len(args) != 1 or not Path(args[0]).exists():
+        print(json.dumps({"error": "Usage: async_pipeline.py [--pdftotext PATH] [--engine pdftotext|pymupdf] [--type pdf_resume|docx_form_pdf|auto] [--use-corpus-headers] [--stage1-cache DB] [--extract-concurrency N] [--parse-workers N] [--queue-size N] <dir|manifest.txt>"}), file=sys.stderr)
+        sys.exit(1)
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+    from parse_pdf_resume import _iter_batch_paths
+
+    stage1_cache = None
+    if stage1_cache_db:
+        from stage1_cache import get_shared_cache
+
+        stage1_cache = get_shared_cache(stage1_cache_db)
+    summary = asyncio.run(run_pipeline(
+        _iter_batch_paths(args[0]), pdftotext_exe, engine, parse_type, use_corpus_headers, stage1_cache,
+        extract_concurrency, parse_workers, queue_size,
+    ))
+    sys.exit(0 if summary["files"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DOCX 표를 python-docx 객체 모델 없이 word/document.xml 에서 바로 읽는 lxml 헬퍼.
+extract_resume_form_structure.py --engine lxml 이 씁니다.
+
+python-docx 는 row.cells 를 읽을 때마다 병합 셀 격자를 다시 만들고(셀마다 preceding-sibling XPath),
+셀 텍스트와 이미지를 위해 cell.paragraphs 를 두 번 돌기 때문에, 여기서는
+  - lxml.etree.iterparse 로 본문 바로 아래 w:tbl 이 끝날 때마다 그 표만 처리하고 지움 (문서 전체 객체를 만들지 않음)
+  - 행마다 격자 위치(gridBefore + 앞 칸들의 gridSpan) → 셀 내용 표를 한 번 만들어, 세로 병합 계속 칸(vMerge)은
+    윗행의 같은 위치 내용을 그대로 씀
+  - 셀의 단락/런을 한 번만 돌며 텍스트와 a:blip 을 함께 모음
+결과는 python-docx 경로와 같아야 합니다 (benchmarks/bench_docx_engines.py 가 generated_resumes/*.docx 로 비교).
+  셀 텍스트 = "\\n".join(cell.paragraphs 의 p.text).strip()  (w:r, w:hyperlink/w:r 의 w:t/tab/br/cr/…)
+  셀 이미지 = 단락의 직접 w:r 아래 a:blip (embed/link id 중복 제거)
+  row.cells = 가로 병합은 gridSpan 만큼 같은 셀 반복, vMerge="continue" 는 윗행 같은 격자 위치 셀
+"""
+
+import posixpath
+from typing import Iterator
+from zipfile import ZipFile
+
+try:
+    from lxml import etree
+except ImportError:  # python-docx 의존성이라 보통 함께 설치됨
+    etree = None
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_DOCUMENT_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+
+
+def _w(tag: str) -> str:
+    return f"{{{W_NS}}}{tag}"
+
+
+W_BODY = _w("body")
+W_TBL = _w("tbl")
+W_TR = _w("tr")
+W_TC = _w("tc")
+W_P = _w("p")
+W_R = _w("r")
+W_HYPERLINK = _w("hyperlink")
+W_T = _w("t")
+W_BR = _w("br")
+W_TYPE = _w("type")
+W_VAL = _w("val")
+W_TR_PR = _w("trPr")
+W_GRID_BEFORE = _w("gridBefore")
+W_TC_PR = _w("tcPr")
+W_GRID_SPAN = _w("gridSpan")
+W_VMERGE = _w("vMerge")
+A_BLIP = f"{{{A_NS}}}blip"
+R_EMBED = f"{{{R_NS}}}embed"
+R_LINK = f"{{{R_NS}}}link"
+
+# 런 안 요소 → 텍스트 (python-docx CT_R.text 와 같음. w:t 는 내용, w:br 은 textWrapping 일 때만 줄바꿈)
+_RUN_CHAR = {_w("cr"): "\n", _w("noBreakHyphen"): "-", _w("ptab"): "\t", _w("tab"): "\t"}
+
+
+def _require_lxml() -> None:
+    if etree is None:
+        raise ImportError("lxml 라이브러리가 필요합니다. 설치 방법: pip3 install lxml")
+
+
+def main_document_part(zf: ZipFile) -> str:
+    """패키지 관계(_rels/.rels)의 officeDocument 대상 경로 (보통 word/document.xml)."""
+    _require_lxml()
+    try:
+        root = etree.fromstring(zf.read("_rels/.rels"))
+    except KeyError:
+        return "word/document.xml"
+    for rel in root.iterchildren(f"{{{PKG_REL_NS}}}Relationship"):
+        if rel.get("Type") == OFFICE_DOCUMENT_REL and rel.get("Target"):
+            return rel.get("Target").lstrip("/")
+    return "word/document.xml"
+
+
+def iter_body_tables(zf: ZipFile, part: str) -> Iterator:
+    """본문(w:body) 바로 아래 w:tbl 요소를 문서 순서대로 (python-docx doc.element.body 의 CT_Tbl, 중첩 표 제외).
+    다음 표를 읽기 전에 처리가 끝난 표와 그 앞 형제(단락 등)는 트리에서 지워 메모리를 일정하게 유지."""
+    _require_lxml()
+    with zf.open(part) as f:
+        for _, elem in etree.iterparse(f, events=("end",), tag=W_TBL):
+            parent = elem.getparent()
+            if parent is None or parent.tag != W_BODY:
+                continue  # 셀 안 중첩 표: python-docx 경로도 셀 텍스트·이미지에 넣지 않음
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+def _run_text(r) -> str:
+    parts = []
+    for child in r:
+        tag = child.tag
+        if tag == W_T:
+            parts.append(child.text or "")
+        elif tag == W_BR:
+            if child.get(W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            ch = _RUN_CHAR.get(tag)
+            if ch:
+                parts.append(ch)
+    return "".join(parts)
+
+
+def cell_content(tc) -> tuple[str, list[dict]]:
+    """w:tc 하나의 (텍스트, 이미지 목록). 단락·런을 한 번만 돌며 둘 다 모음."""
+    paragraphs = []
+    images = []
+    found_ids = set()
+    for p in tc.iterchildren(W_P):
+        parts = []
+        for child in p.iterchildren(W_R, W_HYPERLINK):
+            if child.tag == W_HYPERLINK:
+                parts.extend(_run_text(r) for r in child.iterchildren(W_R))
+                continue
+            parts.append(_run_text(child))
+            for blip in child.iter(A_BLIP):
+                embed_id = blip.get(R_EMBED)
+                link_id = blip.get(R_LINK)
+                img_id = embed_id or link_id
+                if img_id and img_id not in found_ids:
+                    found_ids.add(img_id)
+                    images.append({"embed_id": embed_id, "link_id": link_id, "has_image": True})
+        paragraphs.append("".join(parts))
+    return "\n".join(paragraphs).strip(), images
+
+
+def _int_val(parent, tag: str, default: int) -> int:
+    if parent is None:
+        return default
+    elem = parent.find(tag)
+    if elem is None or elem.get(W_VAL) is None:
+        return default
+    return int(elem.get(W_VAL))
+
+
+def iter_table_rows(tbl) -> Iterator[list[tuple[str, list[dict]]]]:
+    """표의 행마다 python-docx row.cells 순서의 (텍스트, 이미지 목록) 리스트.
+    가로 병합 칸은 gridSpan 만큼 반복하고, vMerge 계속 칸은 윗행 같은 격자 위치의 내용(과 그 칸의 span)을 씀."""
+    above = None  # 윗행: 격자 시작 위치 → (span, 내용)
+    for tr in tbl.iterchildren(W_TR):
+        offset = _int_val(tr.find(W_TR_PR), W_GRID_BEFORE, 0)
+        row = {}
+        cells = []
+        for tc in tr.iterchildren(W_TC):
+            tc_pr = tc.find(W_TC_PR)
+            span = _int_val(tc_pr, W_GRID_SPAN, 1)
+            vmerge = tc_pr.find(W_VMERGE) if tc_pr is not None else None
+            if vmerge is not None and vmerge.get(W_VAL, "continue") == "continue":
+                # python-docx 와 같은 오류 (윗행이 없거나 같은 격자 위치에서 시작하는 칸이 없음)
+                if above is None:
+                    raise ValueError("no tr above topmost tr in w:tbl")
+                if offset not in above:
+                    raise ValueError(f"no `tc` element at grid_offset={offset}")
+                entry = above[offset]
+            else:
+                entry = (span, cell_content(tc))
+            row[offset] = entry
+            cells.extend([entry[1]] * entry[0])
+            offset += span
+        above = row
+        yield cells
+
+
+def part_relationships(zf: ZipFile, part: str) -> dict[str, str]:
+    """파트(예: word/document.xml)의 관계 rId → ZIP 안 대상 경로 (word/_rels/document.xml.rels).
+    외부 대상(TargetMode="External")은 제외. 관계 파일이 없으면 빈 dict."""
+    _require_lxml()
+    folder, name = posixpath.split(part)
+    try:
+        root = etree.fromstring(zf.read(posixpath.join(folder, "_rels", name + ".rels")))
+    except KeyError:
+        return {}
+    rels = {}
+    for rel in root.iterchildren(f"{{{PKG_REL_NS}}}Relationship"):
+        target = rel.get("Target")
+        if not target or rel.get("TargetMode") == "External":
+            continue
+        if target.startswith("/"):
+            rels[rel.get("Id")] = target.lstrip("/")
+        else:
+            rels[rel.get("Id")] = posixpath.normpath(posixpath.join(folder, target))
+    return rels
@@ -5,14 +5,40 @@
 
 사용법:
     python3 scripts/extract_resume_form_structure.py resume_form.docx
+    python3 scripts/extract_resume_form_structure.py --profile resume_form.docx   # 결과에 단계별 시간·카운터 "_timings"
+    python3 scripts/extract_resume_form_structure.py --engine lxml resume_form.docx
+        # python-docx 객체 모델 대신 word/document.xml 을 lxml iterparse 로 바로 읽음 (docx_table_xml.py, 출력 동일)
+    python3 scripts/extract_resume_form_structure.py --engine lxml --photo-dir DIR [--photo-cell 0,2,4] resume_form.docx
+        # 같은 한 번의 실행에서 이미지→셀 매핑("image_cell_mapping")과 증명사진 한 장("photo")까지
+        # (extract_images_from_docx.py 를 따로 돌리지 않아도 됨. 사진 칸 이미지만 ZIP에서 스트리밍으로 저장)
+    python3 scripts/extract_resume_form_structure.py --delta-against resume_form_structure.json 지원자.docx
+        # 빈 양식(구조 JSON 또는 .docx)과 텍스트·이미지 상태가 다른 셀만 출력 + 양식 fingerprint (template_delta)
 """
 
 import sys
 import json
+import hashlib
 import os
+import posixpath
+import shutil
 from pathlib import Path
 from io import BytesIO
 
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가 (stage_profile import용)
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from stage_profile import NULL_PROFILER, PHOTO, dumps_profiled, get_profiler  # noqa: E402
+
+# 표 구조 추출 엔진: python-docx(기본) | lxml (docx_table_xml, 같은 JSON을 더 빠르게)
+DOCX_ENGINES = ("python-docx", "lxml")
+DEFAULT_DOCX_ENGINE = "python-docx"
+# 증명사진 칸 (테이블, 행, 셀). Electron main.ts 의 증명사진 선택 위치와 같음
+DEFAULT_PHOTO_CELL = (0, 2, 4)
+# extract_images_from_docx.py 가 저장하는 이미지 확장자
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif')
+
 # Windows에서 한글 경로 처리
 if sys.platform == 'win32':
     import locale
@@ -36,16 +62,28 @@ except ImportError:
     sys.exit(1)
 
 
-def extract_table_structure(doc_path: str) -> dict:
+def extract_table_structure(
+    doc_path: str,
+    profile: bool = False,
+    engine: str = DEFAULT_DOCX_ENGINE,
+    photo_dir: str = None,
+    photo_cell: tuple = DEFAULT_PHOTO_CELL,
+) -> dict:
     """
     DOCX 파일에서 모든 테이블과 셀의 구조를 추출
     
     Args:
         doc_path: DOCX 파일 경로 (한글/공백 포함 가능)
+        profile: True면 단계별 시간(docxOpen, extract_table_data, extract_images_from_cell)과
+            tables/rows/cells/images/chars 수를 결과의 "_timings" 에 붙임 (stage_profile)
+        engine: DOCX_ENGINES 중 하나. lxml 이면 word/document.xml 을 iterparse 로 직접 읽음 (결과 동일)
+        photo_dir: 있으면 같은 실행에서 image_cell_mapping 과 증명사진 한 장(photo)도 추가 (attach_photo)
+        photo_cell: 증명사진 칸 (table_index, row_index, cell_index)
     
     Returns:
         dict: 테이블 구조 정보
     """
+    profiler = get_profiler(profile)
     # 경로 정규화 (Windows 경로 처리)
     doc_path = os.path.normpath(doc_path)
     
@@ -89,8 +127,20 @@ def extract_table_structure(doc_path: str) -> dict:
                 "error": f"Failed to open file as ZIP (DOCX files are ZIP archives): '{doc_path}'. Error: {str(zip_error)}"
             }
         
-        # 이제 python-docx로 열기
-        doc = Document(abs_path)
+        # 이제 python-docx로 열기 (lxml 엔진은 ZIP과 본문 파트 경로만)
+        with profiler.stage("docxOpen"):
+            if engine == "lxml":
+                from docx_table_xml import main_document_part
+
+                zip_file = zipfile.ZipFile(abs_path, 'r')
+                try:
+                    document_part = main_document_part(zip_file)
+                    zip_file.getinfo(document_part)
+                except Exception:
+                    zip_file.close()
+                    raise
+            else:
+                doc = Document(abs_path)
     except FileNotFoundError:
         return {
             "error": f"File not found: '{doc_path}' (absolute path: '{os.path.abspath(doc_path)}')"
@@ -104,7 +154,7 @@ def extract_table_structure(doc_path: str) -> dict:
         error_type = type(e).__name__
         
         # "Package not found" 에러는 파일이 손상되었거나 DOCX 형식이 아닐 수 있음
-        if "Package not found" in error_detail or "BadZipFile" in error_type:
+        if "Package not found" in error_detail or "BadZipFile" in error_type or error_type == "KeyError":
             return {
                 "error": f"Failed to open DOCX file. The file may be corrupted, not a valid DOCX file, or the path contains special characters that cannot be handled. Path: '{doc_path}' (absolute: '{os.path.abspath(doc_path)}'). Error: {error_detail}"
             }
@@ -121,18 +171,105 @@ def extract_table_structure(doc_path: str) -> dict:
     # 문서의 모든 요소를 순회하면서 테이블 찾기
     table_index = 0
     
-    for element in doc.element.body:
-        if isinstance(element, CT_Tbl):
-            table = Table(element, doc)
-            table_data = extract_table_data(table, table_index)
-            result["tables"].append(table_data)
-            table_index += 1
+    if engine == "lxml":
+        from docx_table_xml import iter_body_tables
+
+        with zip_file:
+            for element in iter_body_tables(zip_file, document_part):
+                with profiler.stage("extract_table_data"):
+                    table_data = extract_table_data_xml(element, table_index, profiler)
+                result["tables"].append(table_data)
+                table_index += 1
+            if photo_dir:
+                # 같은 ZIP 핸들로 관계 파일과 사진 한 장만 읽음
+                with profiler.stage(PHOTO):
+                    attach_photo(result, zip_file, document_part, photo_dir, photo_cell)
+    else:
+        for element in doc.element.body:
+            if isinstance(element, CT_Tbl):
+                table = Table(element, doc)
+                with profiler.stage("extract_table_data"):
+                    table_data = extract_table_data(table, table_index, profiler)
+                result["tables"].append(table_data)
+                table_index += 1
+        if photo_dir:
+            from docx_table_xml import main_document_part
+
+            with profiler.stage(PHOTO), zipfile.ZipFile(abs_path, 'r') as zip_file:
+                attach_photo(result, zip_file, main_document_part(zip_file), photo_dir, photo_cell)
     
     result["total_tables"] = table_index
+    if profiler.enabled:
+        profiler.count("tables", table_index)
+        result["_timings"] = profiler.to_dict()
     
     return result
 
 
+def attach_photo(structure: dict, zip_file, document_part: str, photo_dir: str, photo_cell: tuple = DEFAULT_PHOTO_CELL) -> None:
+    """
+    표 구조의 셀 이미지(embed_id)로 이미지→셀 매핑을 만들고 증명사진 한 장만 photo_dir 에 저장
+    
+    extract_images_from_docx.py 는 문서를 python-docx 로 다시 열고 word/media/* 를 모두 읽어 저장하지만,
+    여기서는 이미 만든 표 구조의 셀 이미지와 word/_rels/document.xml.rels 만 보고 사진 한 장만 ZIP에서 복사합니다.
+    사진 선택은 Electron(main.ts)과 같음: photo_cell 칸에 있는 이미지, 없으면 word/media/ 의 첫 이미지.
+    
+    Args:
+        structure: extract_table_structure 결과 (tables). image_cell_mapping, photo 키를 추가함
+        zip_file: 열려 있는 DOCX ZipFile
+        document_part: 본문 파트 경로 (docx_table_xml.main_document_part)
+        photo_dir: 사진을 저장할 디렉토리 (없으면 생성)
+        photo_cell: 증명사진 칸 (table_index, row_index, cell_index)
+    """
+    from docx_table_xml import part_relationships
+
+    rels = part_relationships(zip_file, document_part)
+    media_dir = posixpath.join(posixpath.dirname(document_part), "media") + "/"
+    # 파일명 → 셀 위치 목록 (extract_images_from_docx 의 image_cell_mapping 과 같은 형태)
+    mapping = {}
+    members = {}
+    for table in structure["tables"]:
+        for row in table["rows"]:
+            for cell in row["cells"]:
+                for image in cell["images"]:
+                    member = rels.get(image["embed_id"])
+                    if not member or not member.startswith(media_dir):
+                        continue
+                    filename = posixpath.basename(member)
+                    members[filename] = member
+                    mapping.setdefault(filename, []).append(dict(cell["position"]))
+    structure["image_cell_mapping"] = mapping
+
+    wanted = dict(zip(("table_index", "row_index", "cell_index"), photo_cell))
+    member = None
+    for filename, positions in mapping.items():
+        if filename.lower().endswith(IMAGE_EXTENSIONS) and wanted in positions:
+            member = members[filename]
+            break
+    in_photo_cell = member is not None
+    if member is None:
+        member = next(
+            (n for n in zip_file.namelist() if n.startswith(media_dir) and n.lower().endswith(IMAGE_EXTENSIONS)),
+            None,
+        )
+    if member is None:
+        structure["photo"] = None
+        return
+    filename = posixpath.basename(member)
+    os.makedirs(photo_dir, exist_ok=True)
+    output_path = os.path.join(photo_dir, filename)
+    with zip_file.open(member) as src, open(output_path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    structure["photo"] = {
+        "original_path": member,
+        "filename": filename,
+        "output_path": output_path,
+        "size": zip_file.getinfo(member).file_size,
+        "cell_positions": mapping.get(filename, []),
+        "in_photo_cell": in_photo_cell,
+    }
+
+
 def extract_images_from_cell(cell) -> list:
     """
     셀에서 이미지 추출
@@ -166,17 +303,19 @@ def extract_images_from_cell(cell) -> list:
     return images
 
 
-def extract_table_data(table: Table, table_index: int) -> dict:
+def extract_table_data(table: Table, table_index: int, profiler=None) -> dict:
     """
     테이블에서 모든 행과 셀 데이터 추출
     
     Args:
         table: docx Table 객체
         table_index: 테이블 인덱스
+        profiler: stage_profile.StageProfiler (셀 이미지 탐색 시간·행/셀/이미지/글자 수 기록, 없으면 기록 안 함)
         
     Returns:
         dict: 테이블 데이터
     """
+    profiler = profiler or NULL_PROFILER
     table_data = {
         "table_index": table_index,
         "row_count": len(table.rows),
@@ -196,29 +335,146 @@ def extract_table_data(table: Table, table_index: int) -> dict:
             cell_text = cell_text.strip()
             
             # 셀 내 이미지 추출
-            images = extract_images_from_cell(cell)
+            with profiler.stage("extract_images_from_cell"):
+                images = extract_images_from_cell(cell)
+            if profiler.enabled:
+                profiler.count("cells", 1)
+                profiler.count("images", len(images))
+                profiler.count("chars", len(cell_text))
             
-            cell_data = {
-                "cell_index": cell_idx,
-                "text": cell_text,
-                "is_empty": len(cell_text) == 0 and len(images) == 0,
-                "has_image": len(images) > 0,
-                "image_count": len(images),
-                "images": images,
-                "position": {
-                    "table_index": table_index,
-                    "row_index": row_idx,
-                    "cell_index": cell_idx
-                }
-            }
-            
-            row_data["cells"].append(cell_data)
+            row_data["cells"].append(make_cell_data(cell_text, images, table_index, row_idx, cell_idx))
         
         table_data["rows"].append(row_data)
     
+    profiler.count("rows", len(table_data["rows"]))
     return table_data
 
 
+def make_cell_data(cell_text: str, images: list, table_index: int, row_idx: int, cell_idx: int) -> dict:
+    """셀 하나의 출력 dict (docxParser.ts 가 읽는 형태). 두 엔진이 같은 키 순서로 만들도록 공용."""
+    return {
+        "cell_index": cell_idx,
+        "text": cell_text,
+        "is_empty": len(cell_text) == 0 and len(images) == 0,
+        "has_image": len(images) > 0,
+        "image_count": len(images),
+        "images": images,
+        "position": {
+            "table_index": table_index,
+            "row_index": row_idx,
+            "cell_index": cell_idx
+        }
+    }
+
+
+def extract_table_data_xml(tbl, table_index: int, profiler=None) -> dict:
+    """
+    extract_table_data 의 lxml 버전: w:tbl 요소에서 같은 테이블 데이터 추출 (docx_table_xml.iter_table_rows)
+    
+    Args:
+        tbl: lxml w:tbl 요소
+        table_index: 테이블 인덱스
+        profiler: stage_profile.StageProfiler (행/셀/이미지/글자 수 기록, 없으면 기록 안 함)
+        
+    Returns:
+        dict: 테이블 데이터
+    """
+    from docx_table_xml import iter_table_rows
+
+    profiler = profiler or NULL_PROFILER
+    rows = []
+    for row_idx, cells in enumerate(iter_table_rows(tbl)):
+        row_cells = []
+        for cell_idx, (cell_text, images) in enumerate(cells):
+            # 병합 칸은 같은 내용이 반복되므로 이미지 dict 는 셀마다 새로 만듦 (python-docx 경로와 같게)
+            images = [dict(image) for image in images]
+            if profiler.enabled:
+                profiler.count("cells", 1)
+                profiler.count("images", len(images))
+                profiler.count("chars", len(cell_text))
+            row_cells.append(make_cell_data(cell_text, images, table_index, row_idx, cell_idx))
+        rows.append({"row_index": row_idx, "cell_count": len(row_cells), "cells": row_cells})
+    profiler.count("rows", len(rows))
+    return {"table_index": table_index, "row_count": len(rows), "rows": rows}
+
+
+def _cell_state(cell: dict) -> tuple:
+    """양식 비교용 셀 상태 (텍스트, 이미지 수). 이미지 rId 는 문서마다 달라서 비교하지 않음."""
+    return (cell["text"], cell["image_count"])
+
+
+def template_fingerprint(template: dict) -> str:
+    """양식 구조의 해시: 표·행·셀 배치와 셀 상태. 양식 DOCX가 바뀌면 달라짐 (stage1_cache.stage2_fingerprint 와 같은 16자리)."""
+    payload = json.dumps(
+        [[[_cell_state(cell) for cell in row["cells"]] for row in table["rows"]] for table in template["tables"]],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def load_template(template_path: str, engine: str = DEFAULT_DOCX_ENGINE) -> dict:
+    """--delta-against 양식: 구조 JSON(resume_form_structure.json) 또는 빈 양식 .docx (그 자리에서 추출).
+    실패하면 {"error": ...}."""
+    if template_path.lower().endswith(".docx"):
+        return extract_table_structure(template_path, engine=engine)
+    try:
+        with open(template_path, "r", encoding="utf-8") as f:
+            template = json.load(f)
+    except (OSError, ValueError) as e:
+        return {"error": f"Failed to read template structure '{template_path}': {e}"}
+    if not isinstance(template, dict) or not isinstance(template.get("tables"), list):
+        return {"error": f"Template structure '{template_path}' has no tables"}
+    return template
+
+
+def template_delta(structure: dict, template: dict) -> dict:
+    """
+    extract_table_structure 결과에서 양식과 텍스트·이미지 상태가 다른 셀만 남긴 출력
+    
+    양식에 없는 위치(행이 늘어난 경우)는 빈 셀로 보고 비교하므로, 내용이 있는 셀만 들어갑니다.
+    결과: file_path, total_tables, delta: true,
+          template: {file_path, fingerprint}  (양식이 바뀌었는지 Electron 쪽 매핑이 확인할 때 사용)
+          shape: 표마다 행별 셀 수  (행 수·병합으로 늘어난 셀 수 확인용)
+          cells: [{table_index, row_index, cell_index, text, is_empty, image_count, images(있을 때만)}]
+    image_cell_mapping / photo / _timings 가 있으면 그대로 옮김.
+    """
+    template_cells = {}
+    for table in template["tables"]:
+        for row in table["rows"]:
+            for cell in row["cells"]:
+                position = cell["position"]
+                key = (position["table_index"], position["row_index"], position["cell_index"])
+                template_cells[key] = _cell_state(cell)
+    cells = []
+    for table in structure["tables"]:
+        for row in table["rows"]:
+            for cell in row["cells"]:
+                position = cell["position"]
+                key = (position["table_index"], position["row_index"], position["cell_index"])
+                if _cell_state(cell) == template_cells.get(key, ("", 0)):
+                    continue
+                changed = dict(position)
+                changed["text"] = cell["text"]
+                changed["is_empty"] = cell["is_empty"]
+                changed["image_count"] = cell["image_count"]
+                if cell["images"]:
+                    changed["images"] = cell["images"]
+                cells.append(changed)
+    result = {
+        "file_path": structure["file_path"],
+        "total_tables": structure["total_tables"],
+        "delta": True,
+        "template": {"file_path": template.get("file_path"), "fingerprint": template_fingerprint(template)},
+        "shape": [[row["cell_count"] for row in table["rows"]] for table in structure["tables"]],
+        "cells": cells,
+    }
+    for key in ("image_cell_mapping", "photo", "_timings"):
+        if key in structure:
+            result[key] = structure[key]
+    return result
+
+
 def print_structure_summary(structure: dict, file=sys.stdout):
     """
     구조 정보를 읽기 쉬운 형식으로 출력
@@ -296,15 +552,47 @@ def save_json_output(structure: dict, output_path: str = "resume_form_structure.
     print(f"\n\n구조 정보가 {output_path}에 저장되었습니다.")
 
 
+def _parse_photo_cell(value: str):
+    """'0,2,4' → (0, 2, 4). 형식이 맞지 않으면 None."""
+    parts = value.split(",")
+    if len(parts) != 3 or not all(p.strip().isdigit() for p in parts):
+        return None
+    return tuple(int(p) for p in parts)
+
+
 def main():
-    if len(sys.argv) < 2:
-        error_msg = json.dumps({"error": "Usage: python3 scripts/extract_resume_form_structure.py <docx_file>"})
+    args = sys.argv[1:]
+    profile = False
+    engine = DEFAULT_DOCX_ENGINE
+    photo_dir = None
+    photo_cell = DEFAULT_PHOTO_CELL
+    delta_against = None
+    while args:
+        if args[0] == "--profile":
+            profile = True
+            args = args[1:]
+        elif args[0] == "--engine" and len(args) >= 2 and args[1] in DOCX_ENGINES:
+            engine = args[1]
+            args = args[2:]
+        elif args[0] == "--photo-dir" and len(args) >= 2:
+            photo_dir = args[1]
+            args = args[2:]
+        elif args[0] == "--photo-cell" and len(args) >= 2 and _parse_photo_cell(args[1]):
+            photo_cell = _parse_photo_cell(args[1])
+            args = args[2:]
+        elif args[0] == "--delta-against" and len(args) >= 2:
+            delta_against = args[1]
+            args = args[2:]
+        else:
+            break
+    if not args:
+        error_msg = json.dumps({"error": "Usage: python3 scripts/extract_resume_form_structure.py [--profile] [--engine python-docx|lxml] [--photo-dir DIR [--photo-cell T,R,C]] [--delta-against TEMPLATE.json|.docx] <docx_file>"})
         print(error_msg, file=sys.stderr)
         sys.exit(1)
     
     # Windows에서 한글 경로 처리
     # sys.argv는 이미 올바른 인코딩으로 받아오지만, 안전을 위해 명시적으로 처리
-    docx_path = sys.argv[1]
+    docx_path = args[0]
     
     # 경로 정규화 및 절대 경로 변환
     # Windows에서 한글 경로를 올바르게 처리하기 위해
@@ -325,7 +613,7 @@ def main():
     
     try:
         # 구조 추출
-        structure = extract_table_structure(docx_path)
+        structure = extract_table_structure(docx_path, profile, engine, photo_dir, photo_cell)
         
         # 에러가 있으면 stderr로 출력하고 종료
         if "error" in structure:
@@ -333,13 +621,22 @@ def main():
             print(error_msg, file=sys.stderr)
             sys.exit(1)
         
+        if delta_against:
+            template = load_template(delta_against, engine)
+            if "error" in template:
+                print(json.dumps(template, ensure_ascii=False), file=sys.stderr)
+                sys.exit(1)
+            if os.getenv('VERBOSE') == '1':
+                print_structure_summary(structure, file=sys.stderr)
+            structure = template_delta(structure, template)
+        
         # JSON만 출력 (stdout으로 출력하여 Node.js에서 파싱 가능하도록)
         # stderr로는 요약 정보 출력 (선택적)
-        json_output = json.dumps(structure, ensure_ascii=False, indent=2)
+        json_output = dumps_profiled(structure, structure.get("_timings"), ensure_ascii=False, indent=2)
         print(json_output)
         
         # stderr로 요약 정보 출력 (선택적, 디버깅용)
-        if os.getenv('VERBOSE') == '1':
+        if os.getenv('VERBOSE') == '1' and not delta_against:
             print_structure_summary(structure, file=sys.stderr)
         
     except Exception as e:
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이력서 폴더 매니페스트 스캐너: 폴더를 os.scandir 로 한 번 훑고 파일 내용 해시를 스레드 풀로 계산해
+매니페스트(경로, 크기, mtime, inode, SHA-256)를 저장하고, 이전 매니페스트와 비교해 추가/변경/삭제/이름 변경을 나눕니다.
+
+Electron get-docx-files(readdirSync) + load-cache(파일마다 statSync, 경로 표기 4가지로 조회)를 대신해,
+네트워크 공유 폴더의 수천 개 파일도 한 번에 처리하고 이름만 바뀐 같은 파일을 알아봅니다.
+  - 크기·mtime·inode 가 이전 매니페스트와 같으면 해시를 다시 계산하지 않음 (reused)
+  - 해시: hashlib 은 큰 버퍼를 처리할 때 GIL을 놓으므로 ThreadPoolExecutor 로 병렬. MMAP_THRESHOLD 이상은 mmap 으로 통째로 넘김
+  - toParse: 이전 매니페스트 어디에도 없던 내용(SHA-256)만, 같은 내용은 한 경로만 → 파서로 보낼 목록
+  - duplicateOf: toParse 에서 빠진 추가/변경 경로 → 같은 내용의 현재 경로, hashes: 경로 → SHA-256
+    (경로로 결과를 찾는 쪽(main.ts load-cache)이 빠진 경로의 결과를 같은 내용의 경로나 result_store 에서 가져오도록)
+매니페스트 경로는 폴더 기준 상대 경로로 저장하므로 폴더를 복사해도 비교가 유지됩니다.
+
+사용법:
+    python3 scripts/folder_manifest.py [--type docx|pdf] [--recursive] [--workers N] [--manifest PATH] [--write] <폴더>
+    python3 scripts/folder_manifest.py [--type docx|pdf] [--recursive] [--manifest PATH] --commit [--failed <파일>]... <폴더>
+      --type: docx = .docx(~$ 임시파일 제외) + .pdf (자체이력서폼, 기본), pdf = *_이력서.pdf (사람인)
+      --manifest: 기본 <폴더>/.career-fit-manifest[.pdf][.recursive].json (설정별로 따로 저장,
+                  documentType/recursive 가 다른 매니페스트는 비어 있는 것으로 봄)
+      스캔은 매니페스트를 바로 갱신하지 않고 <매니페스트>.pending 에 둠. 파싱 결과를 저장한 뒤 --commit 으로 반영
+      --commit: .pending 을 매니페스트로 바꿈. --failed 로 준 파일(과 같은 내용)은 이전 상태로 두어 다음 스캔에서 다시 toParse
+      --write: 스캔하면서 바로 매니페스트 갱신 (파싱과 묶지 않고 비교만 할 때)
+    출력: {root, manifestPath, committed, files, hashed, reused, unreadable, elapsedMs, added, changed, removed, renamed, unchanged, toParse,
+           duplicateOf, hashes}
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from stage1_cache import sha256_file  # noqa: E402
+
+MANIFEST_NAME = ".career-fit-manifest.json"
+MANIFEST_VERSION = 1
+DOCUMENT_TYPES = ("docx", "pdf")
+# 이 크기 이상은 mmap 으로 읽어 한 번에 해시 (작은 파일은 mmap 준비 비용이 더 큼)
+MMAP_THRESHOLD = 8 * 1024 * 1024
+# 네트워크 공유에서는 I/O 대기가 대부분이라 CPU 수보다 넉넉하게
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def is_resume_file(name: str, document_type: str = "docx") -> bool:
+    """main.ts get-docx-files 와 같은 파일 선택."""
+    lower = name.lower()
+    if document_type == "pdf":
+        return lower.endswith(".pdf") and name[:-4].endswith("_이력서")
+    if lower.endswith(".docx"):
+        return not name.startswith("~$")
+    return lower.endswith(".pdf")
+
+
+def scan_folder(root: str, document_type: str = "docx", recursive: bool = False) -> list[dict]:
+    """os.scandir 로 한 번 훑어 이력서 파일의 {path(root 기준 상대, '/' 구분), size, mtime_ns, inode} 목록 (경로순)."""
+    entries = []
+    pending = [root]
+    while pending:
+        folder = pending.pop()
+        try:
+            it = os.scandir(folder)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        if recursive and not entry.name.startswith("."):
+                            pending.append(entry.path)
+                        continue
+                    if not entry.is_file() or not is_resume_file(entry.name, document_type):
+                        continue
+                    st = entry.stat()
+                    inode = entry.inode()
+                except OSError:
+                    continue
+                entries.append({
+                    "path": os.path.relpath(entry.path, root).replace(os.sep, "/"),
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "inode": inode,
+                })
+    entries.sort(key=lambda e: e["path"])
+    return entries
+
+
+def hash_file(path: str, size: Optional[int] = None) -> str:
+    """파일 SHA-256. MMAP_THRESHOLD 이상은 mmap 전체를 한 번에 넘김 (GIL 없이 해시)."""
+    if size is None:
+        size = os.path.getsize(path)
+    if size < MMAP_THRESHOLD:
+        return sha256_file(path)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return hashlib.sha256(mm).hexdigest()
+
+
+def manifest_name(document_type: str = "docx", recursive: bool = False) -> str:
+    """설정별 기본 매니페스트 파일 이름. 같은 폴더를 docx / pdf, 하위 폴더 포함 여부를 바꿔 훑어도 서로 덮어쓰지 않음."""
+    stem, ext = os.path.splitext(MANIFEST_NAME)
+    if document_type != "docx":
+        stem += "." + document_type
+    if recursive:
+        stem += ".recursive"
+    return stem + ext
+
+
+def load_manifest(manifest_path: str, document_type: str = "docx", recursive: bool = False) -> dict:
+    """이전 매니페스트 (없거나 읽을 수 없거나 documentType/recursive 가 다르면 빈 매니페스트)."""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"entries": []}
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {"entries": []}
+    if (manifest.get("documentType"), manifest.get("recursive")) != (document_type, recursive):
+        # 다른 파일 선택으로 만든 매니페스트와 비교하면 전부 removed / added 로 나옴
+        return {"entries": []}
+    return manifest
+
+
+def build_manifest(root: str, previous: dict, document_type: str = "docx", recursive: bool = False,
+                   workers: int = DEFAULT_WORKERS) -> tuple[dict, dict]:
+    """새 매니페스트와 통계 {files, hashed, reused, unreadable}. 크기·mtime·inode 가 이전과 같은 파일은 이전 해시를 씀.
+    해시하지 못한 파일(스캔 뒤 지워지거나 잠김)은 매니페스트에서 빼고 unreadable 로만 셈."""
+    entries = scan_folder(root, document_type, recursive)
+    known = {e["path"]: e for e in previous.get("entries", [])}
+    todo = []
+    for entry in entries:
+        old = known.get(entry["path"])
+        if old and (old["size"], old["mtime_ns"], old["inode"]) == (entry["size"], entry["mtime_ns"], entry["inode"]):
+            entry["sha256"] = old["sha256"]
+        else:
+            todo.append(entry)
+    if todo:
+        def _hash(entry: dict) -> Optional[str]:
+            try:
+                return hash_file(os.path.join(root, entry["path"]), entry["size"])
+            except OSError:
+                return None  # 스캔 뒤 지워지거나 잠긴 파일
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for entry, sha in zip(todo, pool.map(_hash, todo)):
+                entry["sha256"] = sha
+    unreadable = sum(1 for e in todo if not e["sha256"])
+    entries = [e for e in entries if e["sha256"]]
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "root": root,
+        "documentType": document_type,
+        "recursive": recursive,
+        "createdAt": time.time(),
+        "entries": entries,
+    }
+    hashed = len(todo) - unreadable
+    return manifest, {"files": len(entries), "hashed": hashed, "reused": len(entries) - hashed, "unreadable": unreadable}
+
+
+def diff_manifests(previous: dict, current: dict) -> dict:
+    """경로 기준 비교: added / changed / removed / renamed({from, to}) 경로 목록과 unchanged 개수, toParse, duplicateOf.
+    삭제된 경로와 추가된 경로의 내용이 같으면 이름 변경으로 묶고, toParse 에는 이전에 없던 내용만 한 경로씩 넣음.
+    added/changed 중 toParse 에서 빠진 경로는 duplicateOf 에 같은 내용을 가진 현재 경로(결과를 가져올 곳)를 적음.
+    같은 내용을 가진 현재 경로가 없으면(이전에 삭제된 파일의 내용) toParse 에 넣음."""
+    old = {e["path"]: e["sha256"] for e in previous.get("entries", [])}
+    new = {e["path"]: e["sha256"] for e in current["entries"]}
+    changed = [p for p in new if p in old and old[p] != new[p]]
+    unchanged = sum(1 for p in new if old.get(p) == new[p])
+    added = [p for p in new if p not in old]
+    removed = [p for p in old if p not in new]
+    removed_by_sha = {}
+    for path in removed:
+        removed_by_sha.setdefault(old[path], []).append(path)
+    renamed = []
+    for path in list(added):
+        sources = removed_by_sha.get(new[path])
+        if sources:
+            renamed.append({"from": sources.pop(0), "to": path})
+            added.remove(path)
+    moved = {r["from"] for r in renamed}
+    removed = [p for p in removed if p not in moved]
+    seen = set(old.values())
+    to_parse = []
+    skipped = []
+    for path in added + changed:
+        if new[path] not in seen:
+            seen.add(new[path])
+            to_parse.append(path)
+        else:
+            skipped.append(path)
+    # 내용별 대표 경로: 이번에 파싱할 경로, 그다음 그대로이거나 이름만 바뀐 경로 (건너뛴 경로끼리는 가리키지 않음)
+    holders = {}
+    skipped_set = set(skipped)
+    for path in to_parse + sorted(p for p in new if p not in skipped_set):
+        holders.setdefault(new[path], path)
+    duplicate_of = {}
+    for path in skipped:
+        holder = holders.get(new[path])
+        if holder is None:
+            holders[new[path]] = path
+            to_parse.append(path)
+        else:
+            duplicate_of[path] = holder
+    return {
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+        "renamed": renamed,
+        "unchanged": unchanged,
+        "toParse": to_parse,
+        "duplicateOf": duplicate_of,
+    }
+
+
+def write_manifest(manifest: dict, manifest_path: str) -> None:
+    """임시 파일에 쓴 뒤 교체 (중간에 끊겨도 이전 매니페스트가 남도록)."""
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, manifest_path)
+
+
+def pending_path(manifest_path: str) -> str:
+    """스캔 결과를 파싱이 끝날 때까지 두는 파일 (commit_manifest 가 매니페스트로 바꿈)."""
+    return manifest_path + ".pending"
+
+
+def scan_and_diff(root: str, document_type: str = "docx", recursive: bool = False, workers: int = DEFAULT_WORKERS,
+                  manifest_path: Optional[str] = None, write: bool = False) -> dict:
+    """폴더 스캔 + 이전 매니페스트와 비교. 출력 경로는 절대 경로.
+    매니페스트는 바로 갱신하지 않고 <매니페스트>.pending 에 둠 → 파싱 결과를 저장한 뒤 commit_manifest.
+    (먼저 갱신하면 파싱이 취소·실패한 파일이 다음 스캔에서 unchanged 가 되어 다시 toParse 에 오지 않음)
+    write=True 이면 바로 매니페스트를 갱신 (파싱과 묶지 않고 비교만 할 때)."""
+    started = time.perf_counter()
+    root = os.path.abspath(root)
+    manifest_path = manifest_path or os.path.join(root, manifest_name(document_type, recursive))
+    previous = load_manifest(manifest_path, document_type, recursive)
+    current, counts = build_manifest(root, previous, document_type, recursive, workers)
+    diff = diff_manifests(previous, current)
+    write_manifest(current, manifest_path if write else pending_path(manifest_path))
+
+    def _abs(path: str) -> str:
+        return os.path.join(root, *path.split("/"))
+
+    result = {"root": root, "manifestPath": manifest_path, "committed": write}
+    result.update(counts)
+    result["elapsedMs"] = round((time.perf_counter() - started) * 1000, 3)
+    for key in ("added", "changed", "removed", "toParse"):
+        result[key] = [_abs(p) for p in diff[key]]
+    result["renamed"] = [{"from": _abs(r["from"]), "to": _abs(r["to"])} for r in diff["renamed"]]
+    result["unchanged"] = diff["unchanged"]
+    result["duplicateOf"] = {_abs(p): _abs(q) for p, q in diff["duplicateOf"].items()}
+    result["hashes"] = {_abs(e["path"]): e["sha256"] for e in current["entries"]}
+    return result
+
+
+def commit_manifest(root: str, document_type: str = "docx", recursive: bool = False,
+                    manifest_path: Optional[str] = None, failed: Iterable[str] = ()) -> dict:
+    """파싱 결과를 저장한 뒤 호출: 마지막 scan_and_diff 의 .pending 을 매니페스트로 바꿈.
+    failed(파싱 실패·취소된 경로, 절대 또는 폴더 기준 상대)와 같은 내용의 항목은 이전 매니페스트 항목으로 되돌려
+    (이전에 없던 경로면 빼서) 다음 스캔에서 다시 toParse 에 오게 함."""
+    root = os.path.abspath(root)
+    manifest_path = manifest_path or os.path.join(root, manifest_name(document_type, recursive))
+    pending = load_manifest(pending_path(manifest_path), document_type, recursive)
+    if not pending.get("entries") and not os.path.exists(pending_path(manifest_path)):
+        raise FileNotFoundError(f"No pending scan to commit: {pending_path(manifest_path)}")
+    failed_paths = {os.path.relpath(os.path.join(root, p), root).replace(os.sep, "/") for p in failed}
+    failed_shas = {e["sha256"] for e in pending["entries"] if e["path"] in failed_paths}
+    previous = {e["path"]: e for e in load_manifest(manifest_path, document_type, recursive)["entries"]}
+    entries = []
+    reverted = 0
+    for entry in pending["entries"]:
+        if entry["sha256"] in failed_shas:
+            reverted += 1
+            entry = previous.get(entry["path"])
+            if entry is None:
+                continue
+        entries.append(entry)
+    pending["entries"] = entries
+    write_manifest(pending, manifest_path)
+    os.remove(pending_path(manifest_path))
+    return {"root": root, "manifestPath": manifest_path, "files": len(entries), "reverted": reverted}
+
+
+def main():
+    args = sys.argv[1:]
+    document_type = "docx"
+    recursive = False
+    workers = DEFAULT_WORKERS
+    manifest_path = None
+    write = False
+    commit = False
+    failed = []
+    while args:
+        if args[0] == "--type" and len(args) >= 2 and args[1] in DOCUMENT_TYPES:
+            document_type = args[1]
+            args = args[2:]
+        elif args[0] == "--recursive":
+            recursive = True
+            args = args[1:]
+        elif args[0] == "--workers" and len(args) >= 2 and args[1].isdigit() and int(args[1]) > 0:
+            workers = int(args[1])
+            args = args[2:]
+        elif args[0] == "--manifest" and len(args) >= 2:
+            manifest_path = args[1]
+            args = args[2:]
+        elif args[0] == "--write":
+            write = True
+            args = args[1:]
+        elif args[0] == "--commit":
+            commit = True
+            args = args[1:]
+        elif args[0] == "--failed" and len(args) >= 2:
+            failed.append(args[1])
+            args = args[2:]
+        else:
+            break
+    if len(args) != 1 or not os.path.isdir(args[0]):
+        print(json.dumps({"error": "Usage: folder_manifest.py [--type docx|pdf] [--recursive] [--workers N] [--manifest PATH] [--write | --commit [--failed <file>]...] <folder>"}), file=sys.stderr)
+        sys.exit(1)
+    try:
+        if commit:
+            result = commit_manifest(args[0], document_type, recursive, manifest_path, failed)
+        else:
+            result = scan_and_diff(args[0], document_type, recursive, workers, manifest_path, write)
+    except OSError as e:
+        print(json.dumps({"error": str(e)}, ensure_ascii=False), file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pdftotext -layout 텍스트의 줄 레코드 (2단계 파서 공용).
+
+텍스트를 한 번만 줄 단위로 나눠 LayoutLine(원문 줄, strip 결과, 들여쓰기, 빈 줄 여부, 줄 앞 YYYY.MM)을 만들고,
+섹션 분할과 parse_* 함수들이 같은 레코드를 나눠 씁니다. 칸(2개 이상 공백으로 나눈 셀)은 처음 꺼낼 때 한 번만 계산합니다.
+파서마다 line.strip() / re.split(r"\\s{2,}", ...) / 날짜 접두 검사를 반복하지 않기 위한 것으로,
+레코드 기반 결과는 기존 문자열 기반 처리와 글자 단위로 같아야 합니다.
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional, Union
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from regex_registry import PatternRegistry  # noqa: E402
+
+P = PatternRegistry("layout_lines")
+P.add("DATE_PREFIX", r"\d{4}\.\d{2}")
+# 표 칸 구분 (2개 이상 공백)
+P.add("SPACES_2", r"\s{2,}")
+
+
+class LayoutLine:
+    """-layout 텍스트 한 줄. raw: 원문 줄, text: raw.strip(), indent: 앞 공백 수, blank: 공백뿐인 줄,
+    date: text가 YYYY.MM 으로 시작하면 그 7글자 (아니면 None)."""
+
+    __slots__ = ("raw", "text", "indent", "blank", "date", "_cells")
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        text = raw.strip()
+        self.text = text
+        self.blank = not text
+        # text[0]은 공백이 아니므로 raw에서 처음 나오는 위치가 곧 들여쓰기 폭
+        self.indent = raw.index(text[0]) if text else len(raw)
+        # 대부분의 줄은 5번째 글자가 '.'이 아니므로 정규식까지 가지 않음
+        self.date: Optional[str] = text[:7] if len(text) >= 7 and text[4] == "." and P.DATE_PREFIX.match(text) else None
+        self._cells: Optional[list[str]] = None
+
+    def __repr__(self) -> str:
+        return f"LayoutLine({self.raw!r})"
+
+    @property
+    def cells(self) -> list[str]:
+        """text를 2개 이상 공백으로 나눈 칸 목록 (빈 줄은 [""]). 처음 접근할 때 한 번 계산."""
+        if self._cells is None:
+            self._cells = P.SPACES_2.split(self.text)
+        return self._cells
+
+    def split_from(self, pos: int = 0, maxsplit: int = 0) -> list[str]:
+        """text[pos:] 를 칸으로 나눔 (날짜 두 개 뒤 나머지처럼 정규식 그룹 시작부터). pos=0·maxsplit=0 이면 cells."""
+        if not pos and not maxsplit:
+            return self.cells
+        return P.SPACES_2.split(self.text[pos:], maxsplit)
+
+
+def tokenize_layout(text: str) -> list[LayoutLine]:
+    """텍스트를 줄 레코드 목록으로 (text.split("\\n") 과 줄 수·순서가 같음)."""
+    return [LayoutLine(raw) for raw in text.split("\n")]
+
+
+def as_layout_lines(block: Union[str, list[LayoutLine]]) -> list[LayoutLine]:
+    """파서 입력 정규화: 문자열이면 토큰화, 이미 레코드 목록이면 그대로."""
+    return tokenize_layout(block) if isinstance(block, str) else block
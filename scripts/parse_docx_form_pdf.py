@@ -8,33 +8,57 @@ DOCX 파서와 동일한 applicationData 형식(flat key)으로 출력합니다.
 사용법:
     python3 scripts/parse_docx_form_pdf.py <pdf_path>
     python3 scripts/parse_docx_form_pdf.py --text <pdftotext_output.txt>   # 이미 추출된 텍스트 사용
+    python3 scripts/parse_docx_form_pdf.py --profile <pdf_path>             # 결과에 단계별 시간·카운터 "_timings" (stage_profile.py)
+    python3 scripts/parse_docx_form_pdf.py [--pdftotext PATH] --serve       # 상주 워커 (parse_worker.py)
+    python3 scripts/parse_docx_form_pdf.py --from-stage1 <_pdftotext.txt|폴더|cache.db> [--stale-only] [--all]
+        # 저장된 1단계 텍스트로 2단계만 다시 실행 (--debug-dir 의 *_pdftotext.txt 또는 --stage1-cache DB)
 
 의존: pdftotext (poppler-utils)
 """
 
 import re
 import json
-import subprocess
 import sys
 from pathlib import Path
 from typing import Optional
 
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가 (stage1_cache 등 import용)
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from layout_lines import LayoutLine, as_layout_lines  # noqa: E402
+from pdf_preflight import error_fields  # noqa: E402
+from regex_registry import PatternRegistry  # noqa: E402
+from stage_profile import NULL_PROFILER, SEGMENTATION, STAGE1, dumps_profiled, get_profiler  # noqa: E402
+
+# 2단계 정규식은 모두 여기 등록 (함수 안에서 re.match(문자열, ...) 금지 — regex_registry.py check)
+P = PatternRegistry("docx_form_pdf")
+
 
 # --- pdftotext 추출 ---
-def extract_text_with_pdftotext(pdf_path: str, pdftotext_exe: Optional[str] = None) -> str:
-    cmd = [pdftotext_exe or "pdftotext", "-layout", "-enc", "UTF-8", pdf_path, "-"]
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
-        timeout=30,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"pdftotext failed: {result.stderr or result.stdout}")
-    return result.stdout or ""
+def extract_text_with_pdftotext(
+    pdf_path: str, pdftotext_exe: Optional[str] = None, cache=None, cache_key: Optional[tuple[str, str]] = None
+) -> str:
+    """pdftotext -layout 추출. cache(stage1_cache.Stage1Cache)가 있으면 parse_pdf_resume과 같은 키로 조회/저장."""
+    digest = engine_id = None
+    if cache is not None:
+        from stage1_cache import stage1_key
 
+        digest, engine_id = cache_key or stage1_key(pdf_path, pdftotext_exe)
+        cached = cache.get(digest, engine_id)
+        if cached is not None:
+            return cached
+    from pdf_text_engines import extract_with_pdftotext
+
+    text = extract_with_pdftotext(pdf_path, pdftotext_exe)  # 사전 검사·크기 비례 제한 시간 (pdf_preflight)
+    if cache is not None and text.strip():
+        cache.put(digest, engine_id, text)
+    return text
+
+
+# 2단계 규칙(섹션 마커·parse_* 함수)을 바꿔 결과가 달라지면 올릴 것. 캐시된 2단계 결과의 stale 판단에 사용.
+PARSER_VERSION = "2"
 
 # --- 섹션 분할 (자체 폼 고정 헤더) ---
 SECTION_MARKERS = [
@@ -86,58 +110,77 @@ def split_sections(text: str) -> dict[str, str]:
 
 
 # --- 기본 인적사항 ---
+P.add("BASIC_SUPPORT_FIELD", r"지원분야\s+([^\n]+)")
+P.add("BASIC_DESIRED_SALARY", r"희망연봉\s+(\d+)\s*\(?만원\)?")
+P.add("BASIC_DESIRED_SALARY_LOOSE", r"희망연봉\s+(\d+)\s*")
+P.add("BASIC_NAME_HANGUL", r"\(한글\)\s*([^\s(]+(?:\s+[^\s(]+)*)\s*\(한문\)")
+P.add("BASIC_NAME_ENGLISH", r"\(영문\)\s*([A-Za-z\s]+?)(?:\s*$|\n)")
+P.add("BASIC_BIRTH_DATE", r"생년월일\s+(\d{4}년\s*\d{1,2}월\s*\d{1,2}일)")
+P.add("BASIC_BIRTH_DATE_DOTTED", r"생년월일\s+(\d{4}\.\d{1,2}\.\d{1,2})")
+P.add("BASIC_EMAIL", r"e-mail\s*(\S+@\S+)", re.IGNORECASE)
+P.add("BASIC_ADDRESS", r"현\s*주\s*소\s*([^\n]+?)(?=연\s*락|$)")
+P.add("BASIC_ADDRESS_LINE", r"현\s*주\s*소\s*([^\n]+)")
+P.add("BASIC_PHONE", r"연\s*락\s*처\s*([0-9.\-\s]+)")
+P.add("BASIC_MILITARY", r"병역사항\s*(\S+)")
+P.add("WHITESPACE", r"\s+")
+# 표 셀 구분(2개 이상 공백)·날짜로 시작하는 줄 판정은 layout_lines.LayoutLine(cells / date)
+# YYYY.MM  YYYY.MM  나머지 (학력·경력·경력기술서 공통) / 경력기술서 다음 회사 블록 시작
+P.add("DATE_PAIR_LINE", r"(\d{4}\.\d{2})\s+(\d{4}\.\d{2})\s+(.+)")
+P.add("DATE_PAIR_START", r"^\d{4}\.\d{2}\s+\d{4}\.\d{2}")
+
+
 def parse_basic(section: str) -> dict:
     out = {}
     if not section:
         return out
     text = section.replace("\n", " ")
     # 지원분야: 같은 줄에 "지원분야            공무, 시설관리"
-    m = re.search(r"지원분야\s+([^\n]+)", section)
+    m = P.BASIC_SUPPORT_FIELD.search(section)
     if m:
-        out["supportField"] = re.sub(r"\s+", " ", m.group(1)).strip()
+        out["supportField"] = P.WHITESPACE.sub(" ", m.group(1)).strip()
 
-    m = re.search(r"희망연봉\s+(\d+)\s*\(?만원\)?", section)
+    m = P.BASIC_DESIRED_SALARY.search(section)
     if m:
         out["desiredSalary"] = m.group(1).strip() + " (만원)"
     if "desiredSalary" not in out:
-        m = re.search(r"희망연봉\s+(\d+)\s*", section)
+        m = P.BASIC_DESIRED_SALARY_LOOSE.search(section)
         if m:
             out["desiredSalary"] = m.group(1).strip() + " (만원)"
 
     # (한글) 이름 (한문) ... (영문) ...
-    m = re.search(r"\(한글\)\s*([^\s(]+(?:\s+[^\s(]+)*)\s*\(한문\)", section)
+    m = P.BASIC_NAME_HANGUL.search(section)
     if m:
         name = m.group(1).strip()
-        out["name"] = re.sub(r"\s+", " ", name)
-    m = re.search(r"\(영문\)\s*([A-Za-z\s]+?)(?:\s*$|\n)", section)
+        out["name"] = P.WHITESPACE.sub(" ", name)
+    m = P.BASIC_NAME_ENGLISH.search(section)
     if m:
         out["nameEnglish"] = m.group(1).strip()
 
-    m = re.search(r"생년월일\s+(\d{4}년\s*\d{1,2}월\s*\d{1,2}일)", section)
+    m = P.BASIC_BIRTH_DATE.search(section)
     if m:
         out["birthDate"] = m.group(1).strip()
     if "birthDate" not in out:
-        m = re.search(r"생년월일\s+(\d{4}\.\d{1,2}\.\d{1,2})", section)
+        m = P.BASIC_BIRTH_DATE_DOTTED.search(section)
         if m:
             out["birthDate"] = m.group(1).strip()
 
-    m = re.search(r"e-mail\s*(\S+@\S+)", section, re.IGNORECASE)
+    m = P.BASIC_EMAIL.search(section)
     if m:
         out["email"] = m.group(1).strip()
 
-    m = re.search(r"현\s*주\s*소\s*([^\n]+?)(?=연\s*락|$)", section)
+    m = P.BASIC_ADDRESS.search(section)
     if m:
-        out["address"] = re.sub(r"\s+", " ", m.group(1)).strip()
+        out["address"] = P.WHITESPACE.sub(" ", m.group(1)).strip()
     if "address" not in out:
-        m = re.search(r"현\s*주\s*소\s*([^\n]+)", section)
+        m = P.BASIC_ADDRESS_LINE.search(section)
         if m:
-            out["address"] = re.sub(r"\s+", " ", m.group(1)).strip()
+            out["address"] = P.WHITESPACE.sub(" ", m.group(1)).strip()
 
-    m = re.search(r"연\s*락\s*처\s*([0-9.\-\s]+)", section)
+    m = P.BASIC_PHONE.search(section)
     if m:
-        out["phone"] = re.sub(r"\s+", "", m.group(1).strip())
+        out["phone"] = P.WHITESPACE.sub("", m.group(1).strip())
 
-    m = re.search(r"병역사항\s*(\S+)", section)
+    m = P.BASIC_MILITARY.search(section)
     if m:
         out["militaryService"] = m.group(1).strip()
 
@@ -157,28 +200,40 @@ def parse_basic(section: str) -> dict:
 
 
 # --- 학력 (입학년월 졸업년월 학교명 전공 학점 소재지 졸업구분) ---
-EDU_ROW_RE = re.compile(
-    r"^(\d{4}\.\d{2})\s+(\d{4}\.\d{2})\s+(.+?)\s+([^\s/]+(?:\s+[^\s/]+)*?)\s+([\d.]+\s*/\s*[\d.]+|/)\s+(\S+)\s+(졸업|재학|휴학|중퇴)",
+# 학교명은 첫 단어, 전공은 '/' 없는 단어들 (이전의 '(.+?)\s+' 뒤 중첩 반복은 분할 경우의 수만큼 역추적)
+EDU_ROW_RE = P.add(
+    "EDU_ROW",
+    r"^(\d{4}\.\d{2})\s+(\d{4}\.\d{2})\s+(\S+)\s+([^\s/]+(?:\s+[^\s/]+)*?)\s+([\d.]+\s*/\s*[\d.]+|/)\s+(\S+)\s+(졸업|재학|휴학|중퇴)",
     re.MULTILINE,
 )
 
 
-def parse_education(section: str) -> dict:
+# YYYY.MM  YYYY.MM  학교명  전공  학점  소재지  졸업구분 (칸 사이 2개 이상 공백)
+# 칸 = 한 칸 공백으로만 이어진 단어들 (EDU_CELL). 학교명은 한 칸, 전공은 학점 칸 앞까지의 칸들이라 칸 경계가 하나로 정해져
+# 줄 길이에 선형 (이전의 '(.+?)\s{2,}(.+?)\s{2,}' 는 2칸 공백이 많은 줄에서 세제곱 역추적)
+EDU_CELL = r"\S+(?:\s\S+)*"
+P.add(
+    "EDU_ROW_INLINE",
+    rf"(\d{{4}}\.\d{{2}})\s+(\d{{4}}\.\d{{2}})\s+({EDU_CELL})\s{{2,}}({EDU_CELL}(?:\s{{2,}}{EDU_CELL})*?)\s{{2,}}([\d.]+\s*/\s*[\d.]+|/)\s+(\S+)\s+(졸업|재학|휴학|중퇴)",
+)
+
+
+def parse_education(section: str | list[LayoutLine]) -> dict:
     out = {}
     if not section:
         return out
     edu_index = 1
-    for line in section.split("\n"):
-        line = line.strip()
-        if not line or "입학년월" in line or "졸업년월" in line:
+    for record in as_layout_lines(section):
+        line = record.text
+        # 날짜로 시작하지 않는 줄(빈 줄·표 머리글 포함)은 아래 두 패턴 모두 맞지 않음
+        if not record.date or "입학년월" in line or "졸업년월" in line:
             continue
         # YYYY.MM  YYYY.MM  학교명  전공  학점  소재지  졸업구분
-        m = re.match(r"(\d{4}\.\d{2})\s+(\d{4}\.\d{2})\s+(.+?)\s{2,}(.+?)\s{2,}([\d.]+\s*/\s*[\d.]+|/)\s+(\S+)\s+(졸업|재학|휴학|중퇴)", line)
+        m = P.EDU_ROW_INLINE.match(line)
         if not m:
-            m = re.match(r"(\d{4}\.\d{2})\s+(\d{4}\.\d{2})\s+(.+)", line)
+            m = P.DATE_PAIR_LINE.match(line)
             if m:
-                rest = m.group(3)
-                parts = re.split(r"\s{2,}", rest, maxsplit=4)
+                parts = record.split_from(m.start(3), maxsplit=4)
                 if len(parts) >= 4:
                     school = parts[0].strip()
                     if school in ("대학원", "대학교", "고등학교") and len(parts) == 1:
@@ -220,21 +275,20 @@ def parse_education(section: str) -> dict:
 
 
 # --- 경력 (입사년월 퇴사년월 회사명 근무부서 직위 연봉 이직사유) ---
-def parse_career(section: str) -> dict:
+def parse_career(section: str | list[LayoutLine]) -> dict:
     out = {}
     if not section:
         return out
     career_index = 1
-    lines = section.split("\n")
-    for i, line in enumerate(lines):
-        line_stripped = line.strip()
-        if not line_stripped or "입사년월" in line_stripped or "퇴사년월" in line_stripped:
+    for record in as_layout_lines(section):
+        line_stripped = record.text
+        if not record.date or "입사년월" in line_stripped or "퇴사년월" in line_stripped:
             continue
-        m = re.match(r"(\d{4}\.\d{2})\s+(\d{4}\.\d{2})\s+(.+)", line_stripped)
+        m = P.DATE_PAIR_LINE.match(line_stripped)
         if not m:
             continue
-        start_date, end_date, rest = m.groups()
-        parts = re.split(r"\s{2,}", rest.strip(), maxsplit=5)
+        start_date, end_date = m.group(1), m.group(2)
+        parts = record.split_from(m.start(3), maxsplit=5)
         if len(parts) < 3:
             continue
         company = parts[0].strip()
@@ -258,16 +312,17 @@ def parse_career(section: str) -> dict:
 
 
 # --- 자격/어학/수상 (테이블 3에 해당하는 복합 섹션) ---
-def parse_cert_lang_award(section: str) -> dict:
+def parse_cert_lang_award(section: str | list[LayoutLine]) -> dict:
     out = {}
     if not section:
         return out
-    lines = [ln.strip() for ln in section.split("\n") if ln.strip()]
+    records = [record for record in as_layout_lines(section) if not record.blank]
     cert_index = 1
     lang_index = 1
     award_index = 1
     in_award_section = False
-    for i, line in enumerate(lines):
+    for record in records:
+        line = record.text
         if "수상명" in line and "수상기관" in line:
             in_award_section = True
             continue
@@ -277,8 +332,8 @@ def parse_cert_lang_award(section: str) -> dict:
         if "해외연수국가" in line:
             continue
         if in_award_section:
-            parts = re.split(r"\s{2,}", line, maxsplit=2)
-            if len(parts) >= 2 and not re.match(r"^\d{4}\.\d{2}", line):
+            parts = record.split_from(0, maxsplit=2)
+            if len(parts) >= 2 and not record.date:
                 name = parts[0].strip() if len(parts) > 0 else ""
                 org = parts[1].strip() if len(parts) > 1 else ""
                 detail = parts[2].strip() if len(parts) > 2 else ""
@@ -290,9 +345,9 @@ def parse_cert_lang_award(section: str) -> dict:
                     if award_index > 3:
                         break
             continue
-        if re.match(r"^\d{4}\.\d{2}", line):
+        if record.date:
             continue
-        parts = re.split(r"\s{2,}", line)
+        parts = record.cells
         if len(parts) >= 3:
             a, b, c = parts[0].strip(), parts[1].strip(), parts[2].strip()
             if not a and not b and not c:
@@ -319,18 +374,20 @@ def parse_cert_lang_award(section: str) -> dict:
 # --- 자기소개서 (4개 블록) ---
 # PDF에서는 "  자기소개     본문...", "  지원동기     본문..." 처럼 줄 시작에 라벨+본문이 옴
 SELF_INTRO_LABELS = ["자기소개", "지원동기", "성과목표", "장래포부"]
-SELF_INTRO_HEADER_RE = re.compile(r"^\s{2,}(자기소개|지원동기|성과목표|장래포부)\s{2,}(.*)$")
+SELF_INTRO_HEADER_RE = P.add("SELF_INTRO_HEADER", r"^\s{2,}(자기소개|지원동기|성과목표|장래포부)\s{2,}(.*)$")
+# 앞 공백은 공백 구간 처음에서만 시작 (공백이 긴 줄에서 위치마다 끝까지 다시 훑지 않음)
+P.add("SELF_INTRO_LIMIT_NOTE", r"(?:(?<!\s)\s+)?\(700자이내\)\s*")
 
 
-def parse_self_intro(section: str) -> dict:
+def parse_self_intro(section: str | list[LayoutLine]) -> dict:
     out = {}
     if not section:
         return out
-    lines = section.split("\n")
-    # 라벨이 있는 줄 인덱스와 라벨명 (달성경험은 성과목표와 같이 취급)
+    lines = as_layout_lines(section)
+    # 라벨이 있는 줄 인덱스와 라벨명 (달성경험은 성과목표와 같이 취급). 라벨 줄은 2칸 이상 들여쓰기
     block_starts = []
     for i, line in enumerate(lines):
-        m = SELF_INTRO_HEADER_RE.match(line)
+        m = P.SELF_INTRO_HEADER.match(line.raw) if line.indent >= 2 else None
         if m:
             block_starts.append((i, m.group(1), m.group(2).strip()))
     if not block_starts:
@@ -352,27 +409,27 @@ def parse_self_intro(section: str) -> dict:
                 break
         parts = [same_line_content] if same_line_content else []
         for k in range(start_i + 1, end_i):
-            parts.append(lines[k].strip())
+            parts.append(lines[k].text)
         block = " ".join(p for p in parts if p).strip()
-        block = re.sub(r"\s*\(700자이내\)\s*", " ", block).strip()
+        block = P.SELF_INTRO_LIMIT_NOTE.sub(" ", block).strip()
         out[f"selfIntroduction{idx + 1}"] = block[:2000]
     return out
 
 
 # --- 경력기술서 (회사별 블록 + 상세내용) ---
-def parse_career_detail(section: str) -> dict:
+def parse_career_detail(section: str | list[LayoutLine]) -> dict:
     out = {}
     if not section:
         return out
-    lines = section.split("\n")
+    lines = as_layout_lines(section)
     detail_index = 1
     i = 0
     while i < len(lines) and detail_index <= 4:
         line = lines[i]
-        m = re.match(r"(\d{4}\.\d{2})\s+(\d{4}\.\d{2})\s+(.+)", line.strip())
+        m = P.DATE_PAIR_LINE.match(line.text) if line.date else None
         if m:
-            start_date, end_date, rest = m.groups()
-            parts = re.split(r"\s{2,}", rest.strip(), maxsplit=5)
+            start_date, end_date = m.group(1), m.group(2)
+            parts = line.split_from(m.start(3), maxsplit=5)
             out[f"careerDetailStartDate{detail_index}"] = start_date
             out[f"careerDetailEndDate{detail_index}"] = end_date
             if parts:
@@ -388,12 +445,12 @@ def parse_career_detail(section: str) -> dict:
             i += 1
             detail_lines = []
             while i < len(lines):
-                if re.match(r"^\d{4}\.\d{2}\s+\d{4}\.\d{2}", lines[i].strip()):
+                if lines[i].date and P.DATE_PAIR_START.match(lines[i].text):
                     break
-                if "상세내용" in lines[i] or "담당업무" in lines[i]:
+                if "상세내용" in lines[i].raw or "담당업무" in lines[i].raw:
                     i += 1
                     continue
-                detail_lines.append(lines[i].strip())
+                detail_lines.append(lines[i].text)
                 i += 1
             out[f"careerDetailDescription{detail_index}"] = "\n".join(detail_lines).strip()[:5000]
             detail_index += 1
@@ -402,24 +459,84 @@ def parse_career_detail(section: str) -> dict:
     return out
 
 
-def parse_docx_form_pdf_text(text: str) -> dict:
-    """pdftotext로 추출한 텍스트를 applicationData 형식(flat key)으로 파싱."""
-    sections = split_sections(text)
+# 섹션 키 → 파서 (parse_docx_form_pdf_text 호출 순서)
+SECTION_PARSERS = (
+    ("basic", parse_basic),
+    ("education", parse_education),
+    ("career", parse_career),
+    ("cert_lang_award", parse_cert_lang_award),
+    ("self_intro", parse_self_intro),
+    ("career_detail", parse_career_detail),
+)
+
+
+def parse_docx_form_pdf_text(text: str, profiler=None) -> dict:
+    """pdftotext로 추출한 텍스트를 applicationData 형식(flat key)으로 파싱.
+    profiler(stage_profile.StageProfiler)가 있으면 섹션 분할·parse_* 함수별 시간과 chars/lines/sections 수를 기록."""
+    profiler = profiler or NULL_PROFILER
+    with profiler.stage(SEGMENTATION):
+        sections = split_sections(text)
+    if profiler.enabled:
+        profiler.count("chars", len(text))
+        profiler.count("lines", text.count("\n") + 1)
+        profiler.count("sections", len(sections))
     app = {}
-    app.update(parse_basic(sections.get("basic", "")))
-    app.update(parse_education(sections.get("education", "")))
-    app.update(parse_career(sections.get("career", "")))
-    app.update(parse_cert_lang_award(sections.get("cert_lang_award", "")))
-    app.update(parse_self_intro(sections.get("self_intro", "")))
-    app.update(parse_career_detail(sections.get("career_detail", "")))
+    # 표 섹션 파서는 각자 구간을 한 번 줄 레코드(layout_lines)로 토큰화해 씀 (줄마다 strip·칸 분리·날짜 검사 한 번)
+    for key, parser in SECTION_PARSERS:
+        with profiler.stage(parser.__name__):
+            app.update(parser(sections.get(key, "")))
     return app
 
 
+def stage2_fingerprint() -> str:
+    """2단계 결과 fingerprint: PARSER_VERSION + 섹션 마커/자기소개 라벨. 바뀌면 캐시된 결과는 stale."""
+    from stage1_cache import stage2_fingerprint as _fingerprint
+
+    return _fingerprint(
+        "docx_form_pdf", PARSER_VERSION, {"sectionMarkers": SECTION_MARKERS, "selfIntroLabels": SELF_INTRO_LABELS}
+    )
+
+
+def parse_docx_form_pdf(pdf_path: str, pdftotext_exe: Optional[str] = None, cache=None, profile: bool = False) -> dict:
+    """PDF 경로로 추출+파싱. cache가 있으면 fingerprint가 같은 2단계 결과를 그대로 반환.
+    profile=True 이면 단계별 시간·카운터를 결과의 "_timings" 에 붙임 (캐시에는 저장하지 않음)."""
+    profiler = get_profiler(profile)
+    if cache is None:
+        with profiler.stage(STAGE1):
+            text = extract_text_with_pdftotext(pdf_path, pdftotext_exe)
+        data = parse_docx_form_pdf_text(text, profiler)
+    else:
+        from stage1_cache import stage1_key
+
+        with profiler.stage("cacheLookup"):
+            cache_key = stage1_key(pdf_path, pdftotext_exe)
+            fingerprint = stage2_fingerprint()
+            data = cache.get_result(*cache_key, "docx_form_pdf", fingerprint)
+        if data is None:
+            with profiler.stage(STAGE1):
+                text = extract_text_with_pdftotext(pdf_path, pdftotext_exe, cache, cache_key)
+            data = parse_docx_form_pdf_text(text, profiler)
+            with profiler.stage("cacheStore"):
+                cache.put_result(*cache_key, "docx_form_pdf", fingerprint, data)
+        else:
+            profiler.count("stage2CacheHit", 1)
+    if profiler.enabled:
+        data["_timings"] = profiler.to_dict()
+    return data
+
+
 def main():
     args = sys.argv[1:]
     pdftotext_exe = None
     text_path = None
     debug_dir = None
+    serve = False
+    stage1_cache_db = None
+    stage1_cache_max_bytes = None
+    from_stage1 = None
+    stale_only = False
+    all_entries = False
+    profile = False
     while args:
         if args[0] == "--pdftotext" and len(args) >= 3:
             pdftotext_exe = args[1]
@@ -430,18 +547,89 @@ def main():
         elif args[0] == "--debug-dir" and len(args) >= 2:
             debug_dir = args[1]
             args = args[2:]
+        elif args[0] == "--serve":
+            serve = True
+            args = args[1:]
+        elif args[0] == "--stage1-cache" and len(args) >= 2:
+            stage1_cache_db = args[1]
+            args = args[2:]
+        elif args[0] == "--stage1-cache-max-mb" and len(args) >= 2 and args[1].isdigit():
+            stage1_cache_max_bytes = int(args[1]) * 1024 * 1024
+            args = args[2:]
+        elif args[0] == "--from-stage1" and len(args) >= 2:
+            from_stage1 = args[1]
+            args = args[2:]
+        elif args[0] == "--stale-only":
+            stale_only = True
+            args = args[1:]
+        elif args[0] == "--all":
+            all_entries = True
+            args = args[1:]
+        elif args[0] == "--profile":
+            profile = True
+            args = args[1:]
         else:
             break
+    if serve:
+        # 상주 워커 모드: stdin JSON Lines 요청 → stdout 한 줄 결과 (parse_worker.py 참고)
+        from parse_worker import main as worker_main
+        sys.argv = [sys.argv[0], "--type", "docx_form_pdf"]
+        if pdftotext_exe:
+            sys.argv += ["--pdftotext", pdftotext_exe]
+        if stage1_cache_db:
+            sys.argv += ["--stage1-cache", stage1_cache_db]
+        if stage1_cache_max_bytes:
+            sys.argv += ["--stage1-cache-max-mb", str(stage1_cache_max_bytes // (1024 * 1024))]
+        if profile:
+            sys.argv.append("--profile")
+        worker_main()
+        return
+    if from_stage1:
+        from stage1_cache import is_cache_db, read_stage1_text, reparse_stage2
+
+        if Path(from_stage1).is_dir() or is_cache_db(from_stage1):
+            summary = reparse_stage2(
+                from_stage1,
+                "docx_form_pdf",
+                stage2_fingerprint(),
+                lambda text, engine, base: parse_docx_form_pdf_text(text),
+                sys.stdout,
+                stale_only,
+                all_entries,
+            )
+            sys.exit(1 if summary["errors"] else 0)
+        if not Path(from_stage1).exists():
+            print(json.dumps({"error": f"File not found: {from_stage1}"}))
+            sys.exit(1)
+        # 단일 파일은 --text 와 같되 '# engine:' 머리줄(*.stage1_raw.txt)을 떼어 냄
+        text_path = from_stage1
     if not args and not text_path:
-        print(json.dumps({"error": "Usage: parse_docx_form_pdf.py [--pdftotext PATH] [--text <txt>] [--debug-dir DIR] <pdf_path>"}))
+        print(json.dumps({"error": "Usage: parse_docx_form_pdf.py [--pdftotext PATH] [--text <txt>] [--debug-dir DIR] [--stage1-cache DB [--stage1-cache-max-mb N]] [--profile] [--serve] [--from-stage1 <txt|dir|cache.db> [--stale-only] [--all]] <pdf_path>"}))
         sys.exit(1)
     pdf_path = args[0] if args else None
+    profiler = get_profiler(profile)
     try:
-        if text_path:
-            with open(text_path, "r", encoding="utf-8") as f:
-                text = f.read()
+        if from_stage1:
+            from stage1_cache import read_stage1_text
+
+            with profiler.stage(STAGE1):
+                text = read_stage1_text(text_path)[0]
+        elif text_path:
+            with profiler.stage(STAGE1):
+                with open(text_path, "r", encoding="utf-8") as f:
+                    text = f.read()
         elif pdf_path and Path(pdf_path).exists():
-            text = extract_text_with_pdftotext(pdf_path, pdftotext_exe)
+            cache = None
+            if stage1_cache_db:
+                from stage1_cache import DEFAULT_MAX_BYTES, get_shared_cache
+
+                cache = get_shared_cache(stage1_cache_db, stage1_cache_max_bytes or DEFAULT_MAX_BYTES)
+            if not debug_dir:
+                data = parse_docx_form_pdf(pdf_path, pdftotext_exe, cache, profile)
+                print(dumps_profiled(data, data.get("_timings"), ensure_ascii=False, indent=2))
+                return
+            with profiler.stage(STAGE1):
+                text = extract_text_with_pdftotext(pdf_path, pdftotext_exe, cache)
         else:
             print(json.dumps({"error": f"File not found: {pdf_path}"}))
             sys.exit(1)
@@ -451,12 +639,14 @@ def main():
             base = Path(pdf_path).stem if pdf_path else Path(text_path).stem if text_path else "pdftotext"
             raw_path = Path(debug_dir) / f"{base}_pdftotext.txt"
             raw_path.write_text(text, encoding="utf-8")
-        data = parse_docx_form_pdf_text(text)
-        print(json.dumps(data, ensure_ascii=False, indent=2))
+        data = parse_docx_form_pdf_text(text, profiler)
+        if profiler.enabled:
+            data["_timings"] = profiler.to_dict()
+        print(dumps_profiled(data, data.get("_timings"), ensure_ascii=False, indent=2))
     except Exception as e:
         import traceback
         tb = traceback.format_exc()
-        print(json.dumps({"error": str(e), "traceback": tb}, ensure_ascii=False, indent=2))
+        print(json.dumps({**error_fields(e), "traceback": tb}, ensure_ascii=False, indent=2))
         sys.exit(1)
 
 
@@ -4,12 +4,12 @@
 PDF 이력서 1개를 구조 기반으로 파싱하여 JSON으로 출력하는 스크립트.
 
 파싱 3단계:
-  1단계: pdftotext(poppler) 등으로 PDF → raw 텍스트 추출
+  1단계: pdftotext(poppler) 또는 PyMuPDF(--engine pymupdf, pdf_text_engines.py)로 PDF → raw 텍스트 추출
   2단계: 정규/섹션 분할로 블록·섹션 식별 후 basicInfo/careers/education 등 파싱
   3단계: (Electron 쪽) 파싱 결과를 DOCX와 동일한 applicationData·resumeText 형태로 재매핑
 
 비교 관측용: --debug-dir DIR 지정 시 해당 폴더에 다음 파일을 저장합니다.
-  <basename>.stage1_raw.txt   : 1단계 추출 원문 (첫 줄에 # engine: pdftotext)
+  <basename>.stage1_raw.txt   : 1단계 추출 원문 (첫 줄에 # engine: pdftotext|pymupdf)
   <basename>.stage1_meta.json : 1단계 메타 (engine, charCount)
   <basename>.stage2_sections.json : 2단계 중간 (blocks, sections, 블록별 할당 섹션명)
   (2단계 최종·3단계 결과는 Electron이 같은 폴더에 _python.json, _electron.json으로 저장)
@@ -18,34 +18,42 @@ PDF 이력서 1개를 구조 기반으로 파싱하여 JSON으로 출력하는 
     python3 scripts/parse_pdf_resume.py <pdf_path>
     python3 scripts/parse_pdf_resume.py --pdftotext /path/to/pdftotext.exe <pdf_path>
     python3 scripts/parse_pdf_resume.py [--pdftotext PATH] --debug-dir ./debug <pdf_path>
-
-의존: pdftotext (poppler).
+    python3 scripts/parse_pdf_resume.py --engine pymupdf <pdf_path>   # pdftotext 서브프로세스 없이 프로세스 안에서 추출
+    python3 scripts/parse_pdf_resume.py [--max-pages N] [--sections header,career_summary,education_header] <pdf_path>
+        # 포트폴리오가 붙은 긴 PDF: 페이지 단위로 추출하다 N페이지 / 지정 섹션이 끝나면 중단 (결과에 "partial")
+    python3 scripts/parse_pdf_resume.py [--batch] --fields basicInfo,careers,education <pdf_path|폴더>
+        # 목록 화면용: 요청한 결과 키만 파싱 (필요한 섹션이 끝나면 추출 중단, 증명사진·나머지 parse_* 생략, 결과에 "partial")
+    python3 scripts/parse_pdf_resume.py --profile <pdf_path>   # 결과에 단계별 시간·카운터 "_timings" (stage_profile.py)
+    python3 scripts/parse_pdf_resume.py [--pdftotext PATH] [--use-corpus-headers] --serve   # 상주 워커 (parse_worker.py)
+    python3 scripts/parse_pdf_resume.py [옵션] --batch [--workers N] <폴더|manifest.txt>    # 병렬 일괄 파싱 (NDJSON)
+    python3 scripts/parse_pdf_resume.py --stage1-cache cache.db <pdf_path>   # 1단계 텍스트 캐시 (stage1_cache.py)
+    python3 scripts/parse_pdf_resume.py [--use-corpus-headers] --from-stage1 <stage1_raw.txt|폴더|cache.db> [--stale-only] [--all]
+        # pdftotext 없이 저장된 1단계 텍스트로 2단계만 다시 실행 (헤더 설정·parse_* 규칙 변경 후 재파싱)
+
+의존: pdftotext (poppler). --engine pymupdf 는 PyMuPDF.
 """
 
+import bisect
+import heapq
 import sys
 import re
 import json
-import subprocess
 from pathlib import Path
 from typing import Optional
 
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가 (stage1_cache 등 import용)
+    sys.path.insert(0, _SCRIPTS_DIR)
 
-def _extract_with_pdftotext(pdf_path: str, pdftotext_exe: Optional[str] = None) -> str:
-    """pdftotext -layout 로 텍스트 추출 (poppler 필요). pdftotext_exe가 있으면 해당 실행 파일 사용."""
-    cmd = [pdftotext_exe or "pdftotext", "-layout", "-enc", "UTF-8", pdf_path, "-"]
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        encoding='utf-8',
-        errors='replace',  # 인코딩 오류 시 대체 문자로 처리
-        timeout=30,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"pdftotext failed: {result.stderr or result.stdout}")
-    return result.stdout or ""
-
+from layout_lines import LayoutLine, as_layout_lines  # noqa: E402
+from pdf_preflight import error_fields  # noqa: E402
+from pdf_text_engines import DEFAULT_ENGINE, engine_names, extract_text, import_fitz, iter_page_texts, known_page_count  # noqa: E402
+from regex_registry import PatternRegistry  # noqa: E402
+from stage_profile import NULL_PROFILER, PHOTO, SEGMENTATION, STAGE1, dumps_profiled, get_profiler  # noqa: E402
 
+# 2단계 정규식은 모두 여기 등록 (함수 안에서 re.match(문자열, ...) 금지 — regex_registry.py check)
+P = PatternRegistry("pdf_resume")
 
 
 # 이력서 증명사진 표준 크기 (px)
@@ -53,52 +61,234 @@ PROFILE_PHOTO_WIDTH = 100
 PROFILE_PHOTO_HEIGHT = 140
 
 
-def _extract_profile_image_from_pdf(pdf_path: str, photo_dir: str) -> Optional[str]:
-    """PDF에서 100x140 크기 이미지(증명사진)만 찾아 photo_dir에 저장. 저장된 파일명 반환, 없으면 None.
-    PyMuPDF(fitz) 사용. 100x140이 없으면 추출하지 않음."""
+def _open_pdf_document(pdf_path: str):
+    """PyMuPDF로 PDF를 한 번 열어 반환 (텍스트·페이지 메타·증명사진이 공유). PyMuPDF가 없거나 열 수 없으면 None."""
     try:
-        import fitz
-    except ImportError:
+        return import_fitz().open(pdf_path)
+    except Exception:
         return None
-    Path(photo_dir).mkdir(parents=True, exist_ok=True)
-    try:
-        doc = fitz.open(pdf_path)
+
+
+def _scan_pdf_pages(doc) -> tuple[list[dict], list[int]]:
+    """페이지를 한 번 돌며 페이지 메타(크기·이미지 수)와 증명사진 후보 xref(페이지 순, 중복 제외)를 수집.
+    후보는 get_images(full=True) 튜플 (xref, smask, width, height, ...)의 크기로만 고르며 이미지를 디코딩하지 않음."""
+    pages = []
+    photo_xrefs = []
+    for page in doc:
+        images = page.get_images(full=True)
+        pages.append({
+            "page": page.number + 1,
+            "width": round(page.rect.width, 1),
+            "height": round(page.rect.height, 1),
+            "images": len(images),
+        })
+        for img in images:
+            if img[2] == PROFILE_PHOTO_WIDTH and img[3] == PROFILE_PHOTO_HEIGHT and img[0] not in photo_xrefs:
+                photo_xrefs.append(img[0])
+    return pages, photo_xrefs
+
+
+def _save_profile_image(doc, xrefs: list[int], photo_dir: str) -> Optional[str]:
+    """후보 xref를 차례로 디코딩해 처음 읽히는 증명사진 크기 이미지를 photo_dir/profile.<ext> 로 저장.
+    디코딩에 실패하거나 데이터가 없는 후보는 건너뜀. 저장된 파일명 반환, 없으면 None."""
+    for xref in xrefs:
         try:
-            for page in doc:
-                image_list = page.get_images(full=True)
-                for img in image_list:
-                    xref = img[0]
-                    base = doc.extract_image(xref)
-                    if not base or not base.get("image"):
-                        continue
-                    width = base.get("width", 0)
-                    height = base.get("height", 0)
-                    if width != PROFILE_PHOTO_WIDTH or height != PROFILE_PHOTO_HEIGHT:
-                        continue
-                    ext = base.get("ext", "png").lower()
-                    if ext not in ("png", "jpg", "jpeg", "gif", "bmp"):
-                        ext = "png"
-                    out_name = f"profile.{ext}"
-                    out_path = Path(photo_dir) / out_name
-                    out_path.write_bytes(base["image"])
-                    return out_name
-        finally:
-            doc.close()
-    except Exception:
-        pass
+            base = doc.extract_image(xref)
+        except Exception:
+            continue
+        if not base or not base.get("image"):
+            continue
+        if (base.get("width", 0), base.get("height", 0)) != (PROFILE_PHOTO_WIDTH, PROFILE_PHOTO_HEIGHT):
+            continue
+        ext = base.get("ext", "png").lower()
+        if ext not in ("png", "jpg", "jpeg", "gif", "bmp"):
+            ext = "png"
+        try:
+            Path(photo_dir).mkdir(parents=True, exist_ok=True)
+            out_name = f"profile.{ext}"
+            (Path(photo_dir) / out_name).write_bytes(base["image"])
+        except OSError:
+            return None
+        return out_name
     return None
 
 
 def extract_text_with_layout(
-    pdf_path: str, pdftotext_exe: Optional[str] = None
+    pdf_path: str,
+    pdftotext_exe: Optional[str] = None,
+    cache=None,
+    cache_key: Optional[tuple[str, str]] = None,
+    engine: str = DEFAULT_ENGINE,
+    doc=None,
 ) -> tuple[str, str]:
-    """pdftotext(poppler)로 PDF 텍스트 추출. 반환: (추출된_문자열, 'pdftotext')."""
-    text = _extract_with_pdftotext(pdf_path, pdftotext_exe)
+    """engine(pdf_text_engines: pdftotext | pymupdf)으로 PDF 텍스트 추출. 반환: (추출된_문자열, 엔진 이름).
+    cache(stage1_cache.Stage1Cache)가 있으면 PDF 내용 SHA-256 + 엔진 식별자(버전 포함)로 조회해, 있으면 추출하지 않음.
+    cache_key(stage1_key() 결과)를 넘기면 해시를 다시 계산하지 않음. doc(이미 연 PyMuPDF 문서)은 pymupdf 엔진이 재사용."""
+    digest = engine_id = None
+    if cache is not None:
+        from stage1_cache import stage1_key
+
+        digest, engine_id = cache_key or stage1_key(pdf_path, pdftotext_exe, engine)
+        cached = cache.get(digest, engine_id)
+        if cached is not None:
+            return (cached, engine)
+    text = extract_text(pdf_path, engine, pdftotext_exe, doc)
     if not text or not text.strip():
-        raise RuntimeError("pdftotext 추출 결과가 비어 있습니다.")
-    return (text, "pdftotext")
+        raise RuntimeError(f"{engine} 추출 결과가 비어 있습니다.")
+    if cache is not None:
+        cache.put(digest, engine_id, text)
+    return (text, engine)
+
+
+class _SectionStopScan:
+    """extract_text_until_sections 의 멈춤 판단. 페이지마다 새로 완성된 줄만 이어서 블록·헤더로 나눔
+    (_split_stage2_sections 와 같은 규칙이지만 읽은 텍스트 전체를 페이지마다 다시 나누지 않음).
+    지정한 섹션이 모두 나왔고, 마지막 지정 섹션 블록 뒤에 헤더 라벨로 알아본 다른 섹션이 시작됐을 때만 멈춤
+    (꼬리말·모르는 블록 뒤에서 지정 섹션이 다음 페이지로 이어질 수 있으므로 그런 블록으로는 멈추지 않음).
+    블록 이름은 확정된 것만 봄: 빈 줄 기준은 블록이 닫혔을 때(열린 블록은 처음 줄들이 다 왔을 때 헤더 라벨만),
+    헤더 기준은 그 줄 뒤에 비어 있지 않은 줄이 왔을 때 (뒤따르는 빈 줄 수 조건이 정해짐)."""
+
+    MIN_EMPTY_LINES = 3  # split_section_spans 의 블록 경계
+    FIRST_LINES = 5  # _identify_section_name 이 헤더 라벨을 찾는 줄 수
+
+    def __init__(self, wanted, use_corpus_headers: bool = False):
+        self.wanted = set(wanted)
+        self.seen: set[str] = set()
+        self.blocks = 0
+        self.follower = False  # 마지막 지정 섹션 블록 뒤에 헤더로 알아본 다른 섹션이 있는지
+        self.tail = ""  # 줄바꿈이 아직 안 온 마지막 줄 (다음 페이지 첫 줄과 이어짐)
+        headers = _stage2_corpus_headers(use_corpus_headers)
+        self.trie = _compile_header_trie(headers)[0] if headers else None
+        # 빈 줄 기준 상태
+        self.empty_run = 0
+        self.block_lines: Optional[list[str]] = None
+        self.block_first = self.block_last = None  # 열린 블록에서 처음·마지막으로 비어 있지 않은 줄 번호
+        self.open_name: Optional[str] = None  # 열린 블록의 헤더 라벨 섹션 (처음 줄들이 다 왔을 때만)
+        # 헤더 기준 상태
+        self.prev_line: Optional[str] = None
+        self.empty_after = 0
+        self.before_first_hit = False
+
+    def feed(self, page_text: str) -> bool:
+        """페이지 텍스트를 더하고, 멈춰도 되면 True."""
+        lines = (self.tail + page_text).split("\n")
+        self.tail = lines.pop()
+        step = self._line_by_header if self.trie is not None else self._line_by_blank
+        for line in lines:
+            step(line)
+        if not self.wanted.issubset(self.seen):
+            return False
+        return self.follower or (self.open_name is not None and self.open_name not in self.wanted)
+
+    def _note(self, name: str, recognised: bool) -> None:
+        self.blocks += 1
+        self.seen.add(name)
+        if name in self.wanted:
+            self.follower = False
+        elif recognised:
+            self.follower = True
+
+    def _line_by_blank(self, line: str) -> None:
+        if not line.strip():
+            self.empty_run += 1
+            if self.empty_run >= self.MIN_EMPTY_LINES:
+                if self.block_lines is not None:
+                    self._close_block()
+                self.empty_run = 0
+                return
+        else:
+            self.empty_run = 0
+        if self.block_lines is None:
+            self.block_lines = []
+        self.block_lines.append(line)
+        if line.strip():
+            self.block_last = len(self.block_lines) - 1
+            if self.block_first is None:
+                self.block_first = self.block_last
+        # 처음 FIRST_LINES 줄 뒤에 비어 있지 않은 줄이 와야 블록 끝 strip 에 영향받지 않고 확정
+        if (
+            self.blocks and self.open_name is None and self.block_first is not None
+            and self.block_last - self.block_first >= self.FIRST_LINES
+        ):
+            first = self.block_lines[self.block_first : self.block_first + self.FIRST_LINES]
+            self.open_name = _header_section_name("\n".join(first).lstrip())
+
+    def _close_block(self) -> None:
+        block = "\n".join(self.block_lines).strip()
+        self.block_lines = self.block_first = self.block_last = self.open_name = None
+        name = _identify_section_name(block) if block else "empty"
+        recognised = bool(block) and _header_section_name("\n".join(block.split("\n")[: self.FIRST_LINES])) is not None
+        if self.blocks == 0:
+            if name == "unknown":
+                name = "header"
+            if block:
+                self.seen.add("header")  # 첫 블록은 항상 header 섹션에도 들어감
+        self._note(name, recognised)
+
+    def _line_by_header(self, line: str) -> None:
+        stripped = line.strip()
+        if not stripped:
+            self.empty_after += 1
+            return
+        if self.prev_line is not None:
+            hit = _header_hit(self.trie, self.prev_line, self.empty_after)
+            if hit is None:
+                self.before_first_hit = self.before_first_hit or not self.blocks
+            else:
+                if not self.blocks and self.before_first_hit:
+                    self._note("header", False)
+                name = CORPUS_HEADER_TO_SECTION.get(hit.strip(), "unknown")
+                self._note(name, name != "unknown")
+        self.prev_line = stripped
+        self.empty_after = 0
 
 
+def extract_text_until_sections(
+    pdf_path: str,
+    pdftotext_exe: Optional[str] = None,
+    engine: str = DEFAULT_ENGINE,
+    doc=None,
+    max_pages: Optional[int] = None,
+    sections: Optional[list[str]] = None,
+    use_corpus_headers: bool = False,
+    cache=None,
+    cache_key: Optional[tuple[str, str]] = None,
+) -> tuple[str, str, Optional[dict]]:
+    """페이지 단위로 1단계 추출(pdftotext -f/-l 창, pymupdf 페이지별)하며 멈출 조건을 페이지마다 확인.
+    - max_pages: 이 페이지 수까지만 추출
+    - sections: 지정한 2단계 섹션(STAGE2_SECTION_NAMES)이 모두 나오고 그 뒤에 헤더로 알아본 다른 섹션이 시작되면 중단
+      (_SectionStopScan 이 새 페이지의 줄만 이어서 나눔)
+    반환: (읽은 페이지까지의 텍스트, 엔진 이름, partial). partial은 남은 페이지를 건너뛴 경우에만
+    {"pagesRead", "pageCount"(모르면 None), "reason": "maxPages"|"sections"}.
+    cache(stage1_cache.Stage1Cache)와 cache_key 가 있으면 페이지 수(known_page_count)를 알고 그만큼 다 읽었을 때만
+    전체 텍스트로 저장 (페이지 수를 모른 채 끝난 스트림은 중간에 끊긴 텍스트일 수 있음)."""
+    wanted = set(sections or ())
+    page_count = known_page_count(pdf_path, engine, doc)
+    chunks = []
+    reason = None
+    scan = _SectionStopScan(wanted, use_corpus_headers) if wanted else None
+    for page_text in iter_page_texts(pdf_path, engine, pdftotext_exe, doc):
+        chunks.append(page_text)
+        if max_pages and len(chunks) >= max_pages:
+            reason = "maxPages"
+            break
+        if scan is not None and scan.feed(page_text):
+            reason = "sections"
+            break
+    text = "".join(chunks)
+    if not text or not text.strip():
+        raise RuntimeError(f"{engine} 추출 결과가 비어 있습니다.")
+    complete = page_count is not None and len(chunks) >= page_count
+    if complete and cache is not None:
+        cache.put(*cache_key, text)
+    if reason is None or complete:
+        return (text, engine, None)
+    return (text, engine, {"pagesRead": len(chunks), "pageCount": page_count, "reason": reason})
+
+
+# 2단계 규칙(섹션 분할·parse_* 함수)을 바꿔 결과가 달라지면 올릴 것. 캐시된 2단계 결과의 stale 판단에 사용.
+PARSER_VERSION = "2"
+
 # --- 섹션 분할 (연속 빈 줄 기준 vs 공통 헤더 리스트) ---
 SECTION_HEADERS = [
     "경력 총 ",
@@ -131,14 +321,72 @@ CORPUS_HEADER_TO_SECTION = {
     "포트폴리오": "portfolio",
 }
 
+# --sections 로 지정할 수 있는 2단계 섹션 이름 (split_into_sections* 가 블록에 붙이는 이름)
+STAGE2_SECTION_NAMES = (
+    "header",
+    "career_summary",
+    "career_detail_content",
+    "education_header",
+    "skills",
+    "certifications",
+    "employment_preference",
+    "self_introduction",
+    "portfolio",
+)
 
-def _identify_section_name(block: str) -> str:
-    """블록 내용을 보고 섹션 이름을 추론. 헤더 라벨 우선, 없으면 내용 패턴으로 판단."""
-    block_lower = block.lower()
-    lines = block.split("\n")
-    first_lines = "\n".join(lines[:5])  # 처음 5줄만 확인
-    
-    # 헤더 라벨 확인
+# --fields 로 고를 수 있는 결과 키 (출력 순서) → 그 값을 만드는 데 필요한 2단계 섹션.
+# 목록 화면처럼 일부 키만 필요하면 이 섹션들이 끝나는 페이지에서 추출을 멈추고, 요청하지 않은 키의 parse_* 는 건너뜀
+FIELD_SECTIONS = {
+    "basicInfo": ("header", "career_summary"),  # 요약 표(경력 총·희망연봉·직전 연봉)가 경력 섹션 상단에도 있음
+    "skills": ("skills",),
+    "careers": ("career_summary",),
+    "education": ("education_header",),
+    "certifications": ("certifications",),
+    "employmentPreference": ("employment_preference",),
+    "selfIntroduction": ("self_introduction",),
+    "careerDetailContent": ("career_detail_content",),
+    "profilePhotoFilename": (),  # 증명사진 (photo_dir 가 있을 때만)
+}
+OUTPUT_FIELDS = tuple(FIELD_SECTIONS)
+
+
+def fields_sections(fields: list[str]) -> list[str]:
+    """결과 키 목록에 필요한 2단계 섹션 (STAGE2_SECTION_NAMES 순서). 모르는 키는 ValueError."""
+    unknown = [name for name in fields if name not in FIELD_SECTIONS]
+    if unknown:
+        raise ValueError(f"Unknown field: {', '.join(unknown)} (expected one of {', '.join(OUTPUT_FIELDS)})")
+    needed = {section for name in fields for section in FIELD_SECTIONS[name]}
+    return [name for name in STAGE2_SECTION_NAMES if name in needed]
+
+
+# 섹션 내용 추론용 (헤더 라벨이 없을 때). 학교명 … 졸업 / 자격증명 … 합격 은 같은 줄에서 키워드 뒤에 상태가 오는지
+# _keyword_then_status 로 확인 (키워드.*상태 한 패턴은 키워드가 많은 긴 줄에서 이차 시간)
+P.add("SECTION_EDUCATION_KEYWORD", r"학교|대학교|대학|고등학교|중학교|초등학교")
+P.add("SECTION_EDUCATION_STATUS", r"졸업|재학|중퇴")
+P.add("SECTION_CAREER_HINT", r"\d{4}\.\d{2}\s*~\s*(재직중|\d{4}\.\d{2})")
+P.add("SECTION_CERT_KEYWORD", r"기능사|기사|산업기사|자격증|면허|OPIC|TOEIC|TOEFL")
+P.add("SECTION_CERT_STATUS", r"합격|취득|최종합격")
+P.add("YEAR_MONTH", r"\d{4}\.\d{2}")
+
+
+def _keyword_then_status(block: str, keyword: re.Pattern, status: re.Pattern) -> bool:
+    """어떤 줄에 keyword가 있고 같은 줄의 그 뒤에 status가 있으면 True (r"(keyword).*(status)" 검색과 같음).
+    줄마다 첫 keyword 뒤만 한 번 보므로 블록 길이에 선형."""
+    pos = 0
+    while True:
+        m = keyword.search(block, pos)
+        if not m:
+            return False
+        line_end = block.find("\n", m.end())
+        if line_end < 0:
+            line_end = len(block)
+        if status.search(block, m.end(), line_end):
+            return True
+        pos = line_end + 1
+
+
+def _header_section_name(first_lines: str) -> Optional[str]:
+    """블록 처음 몇 줄에 있는 헤더 라벨(SECTION_HEADERS)로 정한 섹션 이름. 라벨이 없으면 None."""
     for h in SECTION_HEADERS:
         if h in first_lines:
             if "경력기술서" in h:
@@ -155,33 +403,52 @@ def _identify_section_name(block: str) -> str:
                 return "portfolio"
             elif "자기소개" in h:
                 return "self_introduction"
+    return None
+
+
+def _identify_section_name(block: str) -> str:
+    """블록 내용을 보고 섹션 이름을 추론. 헤더 라벨 우선, 없으면 내용 패턴으로 판단."""
+    block_lower = block.lower()
+    lines = block.split("\n")
+    first_lines = "\n".join(lines[:5])  # 처음 5줄만 확인
+    
+    # 헤더 라벨 확인
+    name = _header_section_name(first_lines)
+    if name:
+        return name
     
     # 헤더가 없으면 내용 패턴으로 추론 (학력을 경력보다 먼저 확인: 경력 없는 이력서에서 학력 블록이 날짜만으로 경력으로 오인되는 것 방지)
     if "나의 스킬" in first_lines or "스킬" in first_lines:
         return "skills"
     # 학력 패턴: "학력" 키워드 또는 학교명 + 졸업/재학 (경력 패턴보다 먼저)
-    if "학력" in first_lines or re.search(r"(학교|대학교|대학|고등학교|중학교|초등학교).*(졸업|재학|중퇴)", block):
+    if "학력" in first_lines or _keyword_then_status(block, P.SECTION_EDUCATION_KEYWORD, P.SECTION_EDUCATION_STATUS):
         return "education_header"
     # 경력 패턴: 날짜 범위 (예: "2017.08 ~ 재직중") + 회사/직무 느낌 (학력은 날짜+학교라 여기서 제외)
-    if re.search(r"\d{4}\.\d{2}\s*~\s*(재직중|\d{4}\.\d{2})", block):
+    if P.SECTION_CAREER_HINT.search(block):
         # 학력과 겹치지 않도록: "고등학교"/"대학교"/"대학"이 있으면 학력으로 이미 위에서 처리됨. 남은 건 경력
         return "career_summary"
     # 자격증 패턴: 자격증명 + 합격/취득
-    if re.search(r"(기능사|기사|산업기사|자격증|면허|OPIC|TOEIC|TOEFL).*(합격|취득|최종합격)", block):
+    if _keyword_then_status(block, P.SECTION_CERT_KEYWORD, P.SECTION_CERT_STATUS):
         return "certifications"
     # 자기소개서 패턴: 긴 문단들
-    if len(block) > 500 and not re.search(r"\d{4}\.\d{2}", block[:200]):
+    if len(block) > 500 and not P.YEAR_MONTH.search(block[:200]):
         return "self_introduction"
     
     return "unknown"
 
 
+# common_headers.json 로드 결과 캐시: {경로: (mtime_ns, headers)}. 워커(--serve)처럼 한 프로세스에서
+# 여러 파일을 파싱할 때 매번 JSON을 다시 읽지 않도록 함. 파일이 바뀌면(mtime) 다시 읽음.
+_CORPUS_HEADERS_CACHE: dict[str, tuple[int, Optional[list[dict] | list[str]]]] = {}
+
+
 def load_section_headers_from_corpus(
     json_path: Optional[str] = None,
 ) -> Optional[list[dict] | list[str]]:
     """common_headers.json 에서 section_headers 로드.
     section_headers_with_trailing 이 있으면 [{text, trailing_min_empty_lines}, ...] 반환,
-    없으면 기존 section_headers (문자열 리스트) 반환. 없으면 None."""
+    없으면 기존 section_headers (문자열 리스트) 반환. 없으면 None.
+    같은 프로세스에서는 캐시된 리스트를 그대로 반환하므로 호출 측에서 수정하지 말 것."""
     if json_path is None:
         json_path = ""
         for base in (Path(__file__).resolve().parent.parent, Path.cwd()):
@@ -194,147 +461,266 @@ def load_section_headers_from_corpus(
                 break
     if not json_path or not Path(json_path).exists():
         return None
+    try:
+        mtime_ns = Path(json_path).stat().st_mtime_ns
+    except OSError:
+        return None
+    cached = _CORPUS_HEADERS_CACHE.get(json_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    loaded: Optional[list[dict] | list[str]] = None
     try:
         with open(json_path, "r", encoding="utf-8") as f:
             data = json.load(f)
         with_trailing = data.get("section_headers_with_trailing")
-        if with_trailing and isinstance(with_trailing, list):
-            return with_trailing
         headers = data.get("section_headers")
-        if headers and isinstance(headers, list):
-            return headers
+        if with_trailing and isinstance(with_trailing, list):
+            loaded = with_trailing
+        elif headers and isinstance(headers, list):
+            loaded = headers
     except Exception:
         pass
-    return None
-
-
-def split_into_sections_by_headers(
-    full_text: str, headers: list[dict] | list[str]
-) -> tuple[dict[str, str], list[str], list[str]]:
-    """공통 헤더 리스트로 구간 분할. 헤더 문자열 + 그 뒤 줄넘김/공백까지 하나의 패턴으로 보면
-    본문의 같은 단어(표 행 등)와 구분 가능. 반환: (sections, blocks, block_section_names)."""
-    lines = full_text.split("\n")
+    _CORPUS_HEADERS_CACHE[json_path] = (mtime_ns, loaded)
+    return loaded
+
+
+def _required_trailing_empty_lines(header: dict, use_trailing: bool) -> int:
+    """헤더 줄 뒤에 있어야 하는 최소 빈 줄 수 (표 행과 구분용)."""
+    if not use_trailing or header.get("trailing_min_empty_lines", 0) <= 0:
+        return 0
+    # 자격/어학/수상·자격: PDF에서 헤더 다음이 폼피드(\f)+날짜로 바로 오는 경우가 있어 빈 줄 0개도 인정
+    # 학력·학력 고등학교 졸업: PDF에서 "학력 고등학교 졸업" 다음에 빈 줄 없이 날짜 줄이 오는 경우가 있어 빈 줄 0개 인정
+    required = header["trailing_min_empty_lines"]
+    text = header["text"].strip()
+    if text == "자격/어학/수상":
+        required = 0
+    elif text == "자격":
+        required = min(required, 1)
+    elif text in ("학력 고등학교 졸업", "학력 고등학교", "학력"):
+        required = 0
+    return required
+
+
+# 헤더 접두사 trie 캐시: {((text, trailing), ...), use_trailing): trie}. 헤더 목록이 같으면 한 번만 만듦.
+_HEADER_TRIE_CACHE: dict[tuple, dict] = {}
+
+
+def _compile_header_trie(headers: list[dict] | list[str]) -> tuple[dict, bool]:
+    """헤더 목록 → 접두사 trie. 노드는 {문자: 자식 노드}, 헤더가 끝나는 노드에는 None 키에
+    [(헤더 텍스트, 필요한 빈 줄 수), ...] 저장. 반환: (trie, use_trailing)."""
     # 헤더가 dict 리스트면 trailing_min_empty_lines 조건 사용 (헤더+뒤 줄넘김까지 하나의 패턴)
     use_trailing = bool(
         headers and len(headers) > 0 and isinstance(headers[0], dict)
     )
     if use_trailing:
-        sorted_headers = sorted(
-            (h for h in headers if isinstance(h, dict) and h.get("text")),
-            key=lambda h: (-len(h["text"]), h["text"]),
-        )
+        items = [h for h in headers if isinstance(h, dict) and h.get("text")]
     else:
-        plain = [h for h in headers if isinstance(h, str)]
-        sorted_headers = sorted(
-            ({"text": h, "trailing_min_empty_lines": 0} for h in set(plain)),
-            key=lambda h: (-len(h["text"]), h["text"]),
-        )
+        items = [{"text": h, "trailing_min_empty_lines": 0} for h in sorted(set(h for h in headers if isinstance(h, str)))]
+    cache_key = (tuple((h["text"], h.get("trailing_min_empty_lines", 0)) for h in items), use_trailing)
+    trie = _HEADER_TRIE_CACHE.get(cache_key)
+    if trie is not None:
+        return trie, use_trailing
+    trie = {}
+    # 같은 텍스트가 여러 번 있으면 목록 순서대로 시도 (기존 정렬 (-len, text) 의 안정 정렬과 동일)
+    for h in sorted(items, key=lambda h: (-len(h["text"]), h["text"])):
+        node = trie
+        for ch in h["text"]:
+            node = node.setdefault(ch, {})
+        node.setdefault(None, []).append((h["text"], _required_trailing_empty_lines(h, use_trailing)))
+    _HEADER_TRIE_CACHE[cache_key] = trie
+    return trie, use_trailing
+
+
+class SectionSpans:
+    """2단계 섹션 분할 결과. 블록·섹션을 원문 한 벌(text) 위의 (start, end) 오프셋으로만 들고 있다가
+    파서나 JSON 출력이 필요로 할 때 문자열을 만듦 (블록마다 join, 같은 섹션 반복 시 += 복사 없음).
+    같은 이름 섹션이 여러 블록이면 꺼낼 때 "\n\n"으로 이어 붙임 (기존 dict 결과와 같은 문자열).
+    raw_lines / line_starts 는 분할 때 한 번 나눈 원문 줄과 시작 오프셋. 줄 레코드(layout_lines)는
+    section_lines()로 항목 파서에 넘기는 줄만 처음 필요할 때 만들어 두고 재사용 (자기소개서 본문 등은 만들지 않음)."""
+
+    __slots__ = ("text", "block_spans", "block_section_names", "section_spans", "raw_lines", "line_starts", "_records")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.block_spans: list[tuple[int, int]] = []
+        self.block_section_names: list[str] = []
+        self.section_spans: dict[str, list[tuple[int, int]]] = {}
+        self.raw_lines = text.split("\n")
+        # line_starts[i]: i번째 줄의 시작 오프셋 (마지막 원소 = 텍스트 끝 + 1)
+        self.line_starts = [0] * (len(self.raw_lines) + 1)
+        for i, line in enumerate(self.raw_lines):
+            self.line_starts[i + 1] = self.line_starts[i] + len(line) + 1
+        self._records: list[Optional[LayoutLine]] = [None] * len(self.raw_lines)
+
+    def strip_span(self, start: int, end: int) -> tuple[int, int]:
+        """text[start:end].strip() 에 해당하는 오프셋 (문자열을 만들지 않음)."""
+        text = self.text
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return (start, end)
+
+    def add_block(self, span: tuple[int, int], name: str) -> None:
+        self.block_spans.append(span)
+        self.block_section_names.append(name)
+
+    def add_section(self, name: str, span: tuple[int, int]) -> None:
+        self.section_spans.setdefault(name, []).append(span)
+
+    def section(self, name: str, default: str = "") -> str:
+        spans = self.section_spans.get(name)
+        if not spans:
+            return default
+        return "\n\n".join(self.text[s:e] for s, e in spans)
+
+    def span_lines(self, start: int, end: int) -> list[LayoutLine]:
+        """text[start:end].split("\n") 에 해당하는 줄 레코드. 구간 경계에서 잘린 첫/마지막 줄은 잘린 문자열로 만듦."""
+        starts = self.line_starts
+        records = self._records
+        i = bisect.bisect_right(starts, start) - 1
+        out = []
+        while i < len(records) and starts[i] <= end:
+            line_end = starts[i] + len(self.raw_lines[i])
+            if start <= starts[i] and line_end <= end:
+                if records[i] is None:
+                    records[i] = LayoutLine(self.raw_lines[i])
+                out.append(records[i])
+            else:
+                out.append(LayoutLine(self.text[max(start, starts[i]) : min(end, line_end)]))
+            i += 1
+        return out
+
+    def section_lines(self, name: str) -> list[LayoutLine]:
+        """section(name).split("\n") 에 해당하는 줄 레코드 (없는 섹션은 빈 목록)."""
+        out: list[LayoutLine] = []
+        for k, (s, e) in enumerate(self.section_spans.get(name, ())):
+            if k:
+                out.append(LayoutLine(""))  # "\n\n" 으로 이은 블록 사이의 빈 줄
+            out += self.span_lines(s, e)
+        return out
+
+    def block(self, index: int) -> str:
+        s, e = self.block_spans[index]
+        return self.text[s:e]
+
+    def join_blocks(self, stop: int, sep: str = "\n\n") -> str:
+        """앞에서부터 stop개 블록을 sep으로 이어 붙인 문자열."""
+        return sep.join(self.text[s:e] for s, e in self.block_spans[:stop])
+
+    def materialize(self) -> tuple[dict[str, str], list[str], list[str]]:
+        """기존 반환 형태 (sections, blocks, block_section_names) 로 문자열화 (디버그 출력·하위 호환용)."""
+        sections = {name: self.section(name) for name in self.section_spans}
+        blocks = [self.text[s:e] for s, e in self.block_spans]
+        return sections, blocks, list(self.block_section_names)
+
+
+def _header_hit(trie: dict, line: str, empty_after: int) -> Optional[str]:
+    """strip 한 줄이 헤더로 시작하면 그 헤더 텍스트 (긴 헤더부터, 뒤따르는 빈 줄 수 조건을 채우는 것만). 아니면 None."""
+    node = trie
+    candidates = [trie[None]] if None in trie else []
+    for ch in line:
+        node = node.get(ch)
+        if node is None:
+            break
+        if None in node:
+            candidates.append(node[None])
+    for matched in reversed(candidates):
+        hit = next((text for text, required in matched if empty_after >= required), None)
+        if hit is not None:
+            return hit
+    return None
+
+
+def split_section_spans_by_headers(full_text: str, headers: list[dict] | list[str]) -> SectionSpans:
+    """공통 헤더 리스트로 구간 분할. 헤더 문자열 + 그 뒤 줄넘김/공백까지 하나의 패턴으로 보면
+    본문의 같은 단어(표 행 등)와 구분 가능. 구간은 full_text 위 오프셋(SectionSpans)으로 반환.
+    줄마다 헤더 trie를 따라가며 접두사로 맞는 헤더를 긴 것부터 시도하고, 뒤따르는 빈 줄 수는
+    역방향 한 번으로 미리 세어 둠 (텍스트 길이에 선형)."""
+    spans = SectionSpans(full_text)
+    lines = spans.raw_lines
+    stripped = [raw.strip() for raw in lines]
+    trie, _ = _compile_header_trie(headers)
+    # empty_after[i]: i번째 줄 뒤에 이어지는 빈 줄 수
+    empty_after = [0] * len(lines)
+    for i in range(len(lines) - 2, -1, -1):
+        if not stripped[i + 1]:
+            empty_after[i] = empty_after[i + 1] + 1
     # (라인 인덱스, 매칭된 헤더 텍스트) — 한 줄에 하나만, trailing 조건 만족 시에만
     hits: list[tuple[int, str]] = []
-    for i, raw in enumerate(lines):
-        line = raw.strip()
+    for i, line in enumerate(stripped):
         if not line:
             continue
-        for h in sorted_headers:
-            text = h["text"]
-            if not line.startswith(text):
-                continue
-            if use_trailing and h.get("trailing_min_empty_lines", 0) > 0:
-                # 이 줄 뒤에 빈 줄이 최소 N개 이어지는지 확인 (표 행이면 0개)
-                # 자격/어학/수상·자격: PDF에서 헤더 다음이 폼피드(\f)+날짜로 바로 오는 경우가 있어 빈 줄 0개도 인정
-                # 학력·학력 고등학교 졸업: PDF에서 "학력 고등학교 졸업" 다음에 빈 줄 없이 날짜 줄이 오는 경우가 있어 빈 줄 0개 인정
-                required = h["trailing_min_empty_lines"]
-                if text.strip() == "자격/어학/수상":
-                    required = 0
-                elif text.strip() == "자격":
-                    required = min(required, 1)
-                elif text.strip() in ("학력 고등학교 졸업", "학력 고등학교", "학력"):
-                    required = 0
-                j = i + 1
-                empty_count = 0
-                while j < len(lines):
-                    if lines[j].strip():
-                        break
-                    empty_count += 1
-                    j += 1
-                if empty_count < required:
-                    continue
-            hits.append((i, text))
-            break
-    hits.sort(key=lambda x: x[0])
-    sections: dict[str, str] = {}
-    blocks: list[str] = []
-    block_section_names: list[str] = []
+        hit = _header_hit(trie, line, empty_after[i])
+        if hit is not None:
+            hits.append((i, hit))
     if not hits:
         # 공통 헤더가 하나도 없으면 전체를 header 로
-        sections["header"] = full_text.strip()
-        blocks.append(full_text.strip())
-        block_section_names.append("header")
-        return sections, blocks, block_section_names
+        whole = spans.strip_span(0, len(full_text))
+        spans.add_section("header", whole)
+        spans.add_block(whole, "header")
+        return spans
+    starts = spans.line_starts
     # 첫 헤더 이전 = 상단(header)
-    if hits:
-        first_idx = hits[0][0]
-        if first_idx > 0:
-            header_block = "\n".join(lines[:first_idx]).strip()
-            if header_block:
-                sections["header"] = header_block
-                blocks.append(header_block)
-                block_section_names.append("header")
+    first_idx = hits[0][0]
+    if first_idx > 0:
+        header_span = spans.strip_span(0, starts[first_idx] - 1)
+        if header_span[0] < header_span[1]:
+            spans.add_section("header", header_span)
+            spans.add_block(header_span, "header")
     for k, (idx, header) in enumerate(hits):
-        section_name = CORPUS_HEADER_TO_SECTION.get(
-            header.strip(), "unknown"
-        )
+        section_name = CORPUS_HEADER_TO_SECTION.get(header.strip(), "unknown")
         end_idx = hits[k + 1][0] if k + 1 < len(hits) else len(lines)
         # 헤더 라인 포함 (예: "경력 총 16년 9개월" 이 career_summary 에 들어가도록)
-        content_lines = lines[idx:end_idx]
-        content = "\n".join(content_lines).strip()
-        if not content:
+        content = spans.strip_span(starts[idx], starts[end_idx] - 1)
+        if content[0] == content[1]:
             continue
-        if section_name in sections:
-            sections[section_name] += "\n\n" + content
-        else:
-            sections[section_name] = content
-        blocks.append(content)
-        block_section_names.append(section_name)
-    return sections, blocks, block_section_names
+        spans.add_section(section_name, content)
+        spans.add_block(content, section_name)
+    return spans
 
 
-def split_into_sections(full_text: str):
+def split_into_sections_by_headers(
+    full_text: str, headers: list[dict] | list[str]
+) -> tuple[dict[str, str], list[str], list[str]]:
+    """split_section_spans_by_headers() 결과를 문자열로. 반환: (sections, blocks, block_section_names)."""
+    return split_section_spans_by_headers(full_text, headers).materialize()
+
+
+def split_section_spans(full_text: str) -> SectionSpans:
     """전체 텍스트를 섹션별로 나눔. 연속 빈 줄(3개 이상)을 기준으로 블록 분리.
-    반환: (sections, blocks, block_section_names). block_section_names[i]는 blocks[i]에 할당된 섹션명."""
-    sections = {}
-    block_section_names = []  # blocks와 동일 순서로 섹션명
-    lines = full_text.split("\n")
-    
-    # 연속 빈 줄 기준으로 블록 분리
-    blocks = []
-    current_block = []
-    consecutive_empty = 0
+    블록·섹션은 full_text 위 오프셋(SectionSpans)으로 반환."""
+    spans = SectionSpans(full_text)
     MIN_EMPTY_LINES = 3  # 3개 이상의 연속 빈 줄이면 섹션 경계
-    
-    for i, line in enumerate(lines):
-        is_empty = not line.strip()
-        
-        if is_empty:
+
+    # 연속 빈 줄 기준으로 블록 분리 (블록 = [시작 오프셋, 끝 오프셋), 경계가 된 빈 줄은 제외)
+    block_ranges: list[tuple[int, int]] = []
+    block_start = block_end = None
+    consecutive_empty = 0
+    for line, line_start in zip(spans.raw_lines, spans.line_starts):
+        if not line.strip():
             consecutive_empty += 1
             if consecutive_empty >= MIN_EMPTY_LINES:
                 # 연속 빈 줄이 충분히 많으면 이전 블록 저장하고 새 블록 시작
-                if current_block:
-                    blocks.append("\n".join(current_block).strip())
-                    current_block = []
+                if block_start is not None:
+                    block_ranges.append(spans.strip_span(block_start, block_end))
+                    block_start = None
                 consecutive_empty = 0
                 continue
         else:
             consecutive_empty = 0
-        
-        current_block.append(line)
-    
+
+        if block_start is None:
+            block_start = line_start
+        block_end = line_start + len(line)
+
     # 마지막 블록 추가
-    if current_block:
-        blocks.append("\n".join(current_block).strip())
-    
+    if block_start is not None:
+        block_ranges.append(spans.strip_span(block_start, block_end))
+
     # 각 블록을 섹션으로 분류
-    for idx, block in enumerate(blocks):
+    for idx, (start, end) in enumerate(block_ranges):
+        block = full_text[start:end]
         section_name = _identify_section_name(block) if block else "empty"
         # 첫 번째 블록은 header로 처리 (명확한 섹션이 아니면)
         if idx == 0 and section_name == "unknown":
@@ -342,21 +728,62 @@ def split_into_sections(full_text: str):
         # 첫 블록은 항상 basicInfo(이름/나이/주소 등) 추출용으로 header에도 넣음
         # (첫 블록이 "나의 스킬" 등으로 skills로 분류돼도 상단에 이름·생년·주소가 있음)
         if idx == 0 and block:
-            sections["header"] = block
+            spans.add_section("header", (start, end))
 
-        block_section_names.append(section_name)
+        spans.add_block((start, end), section_name)
         if not block:
             continue
         # 이미 같은 이름의 섹션이 있으면 병합 (예: 여러 경력 항목)
-        if section_name in sections:
-            sections[section_name] += "\n\n" + block
-        else:
-            sections[section_name] = block
+        spans.add_section(section_name, (start, end))
+
+    return spans
 
-    return sections, blocks, block_section_names
+
+def split_into_sections(full_text: str):
+    """split_section_spans() 결과를 문자열로.
+    반환: (sections, blocks, block_section_names). block_section_names[i]는 blocks[i]에 할당된 섹션명."""
+    return split_section_spans(full_text).materialize()
 
 
 # --- 헤더 블록에서 기본 정보 추출 ---
+P.add("HEADER_SUPPORT_FIELD", r"지원분야\s*:\s*([^\s입]+)")
+# 값 첫 글자를 공백이 아닌 글자로 고정 (공백만 길게 이어질 때 \s* 와 값이 나눠 먹으며 역추적하지 않도록)
+P.add("HEADER_APPLICATION_DATE", r"입사지원일\s*:\s*([^)\s][^)]*\))")
+P.add("NAME_HANGUL", r"^[\uac00-\ud7a3]{2,4}$")
+P.add("NAME_LATIN", r"^[A-Za-z]{2,20}$")
+# "홍길동 경력" / "PRASETYO 신입" 이름 후보 (줄 끝 또는 뒤에 공백).
+# (?<!\S): 단어 중간에서는 시작하지 않음 (결과는 같고, 공백 없는 긴 줄에서 위치마다 끝까지 다시 훑지 않음)
+P.add("NAME_BEFORE_CAREER_EOL", r"(?<!\S)([^\s]+)\s+경력\s*$", re.MULTILINE)
+P.add("NAME_BEFORE_NEWCOMER_EOL", r"(?<!\S)([^\s]+)\s+신입\s*$", re.MULTILINE)
+P.add("NAME_BEFORE_CAREER", r"(?<!\S)([^\s]+)\s+경력\s", re.MULTILINE)
+P.add("NAME_BEFORE_NEWCOMER", r"(?<!\S)([^\s]+)\s+신입\s", re.MULTILINE)
+P.add("HEADER_GENDER_LINE", r"^(남|여)\s*,\s*\d{4}")
+P.add("HEADER_NAME_LABEL", r"성명\s+([\uac00-\ud7a3A-Za-z]{2,20})(?:\s|$)")
+P.add("HEADER_GENDER_BIRTH_AGE", r"(남|여)\s*,\s*(\d{4})\s*\((\d+)세\)")
+P.add("HEADER_BIRTH_AGE", r"\b(19[5-9]\d|20[0-1]\d)\s*\((\d{1,2})세\)")
+P.add("HEADER_BIRTH_YEAR", r"생년월일\s+(\d{4})년")
+P.add("HEADER_EMAIL", r"이메일\s+(\S+@\S+)")
+P.add("HEADER_PHONE", r"(?:휴대폰|전화번호)\s+(\d{2,3}[-\s]?\d{3,4}[-\s]?\d{4})")
+# 주소: 5자리 우편 (괄호 선택) 또는 3-3 형식 (괄호 필수, 전화번호 xxx-xxxx-xxxx와 구분)
+P.add("HEADER_ADDRESS_POSTAL", r"주소\s+(?:\(?\d{5}\)?|\(\d{3}-\d{3}\))\s*([^\n]+?)(?=\s+경력\s|$)")
+P.add("HEADER_ADDRESS_LINE", r"주소\s+([^\n]+)")
+# 요약 표: 경력 총 N년 N개월 / 총 N년 N개월 / 희망연봉 / 직전 연봉 (변형 3가지)
+P.add("TOTAL_CAREER", r"경력\s*총\s*(\d+년\s*\d*개월)")
+P.add("TOTAL_PERIOD", r"총\s*(\d+년\s*\d*개월)")
+P.add("DESIRED_SALARY", r"희망연봉\s*[:\s]*([0-9,]+)\s*만원")
+P.add("LAST_SALARY_SPACED", r"직전\s*연봉\s*:\s*([0-9,]+)\s*만\s*원")
+P.add("LAST_SALARY", r"직전\s*연봉\s*:\s*([0-9,]+)\s*만원")
+P.add("LAST_SALARY_LOOSE", r"직전\s*연봉\s*:\s*([^\s원]+만원?)")
+# 헤더 라벨 한 번 훑기: 위 필드 패턴이 시작하는 글자열(라벨)의 위치를 한 번에 모으고, 필드마다 그 위치에서만 match.
+# 라벨로 시작하는 패턴은 라벨 위치들에서 차례로 match 한 첫 결과 = search 결과. 경력·신입은 이름 후보 위치에도 씀.
+# 앞보기(?=)라 겹치는 위치도 모두 나옴. 같은 위치에서 두 라벨이 맞지 않도록 서로 접두사가 아니어야 함 (남·여: 성별 줄)
+HEADER_LABELS = (
+    "지원분야", "입사지원일", "성명", "생년월일", "이메일", "휴대폰", "전화번호", "주소",
+    "경력", "신입", "총", "희망연봉", "직전", "회사내규에 따름", "남", "여",
+)
+P.add("HEADER_LABEL", "(?=(" + "|".join(HEADER_LABELS) + "))")
+
+
 def _classify_residence(address: str) -> str:
     """주소 문자열에서 거주지 분류 (서울/수도권/시흥/안산/지방)."""
     if not address or not isinstance(address, str):
@@ -373,16 +800,72 @@ def _classify_residence(address: str) -> str:
     return "지방"
 
 
+def scan_header_labels(text: str) -> dict[str, list[int]]:
+    """text 를 한 번 훑어 HEADER_LABELS 라벨별 시작 위치 목록 (앞에서부터, 겹치는 위치 포함)."""
+    positions = {label: [] for label in HEADER_LABELS}
+    for m in P.HEADER_LABEL.finditer(text):
+        positions[m.group(1)].append(m.start())
+    return positions
+
+
+def _match_at(pattern: re.Pattern, text: str, starts) -> Optional[re.Match]:
+    """starts 위치에서 차례로 pattern.match 한 첫 결과 (라벨로 시작하는 패턴이면 pattern.search(text) 와 같음)."""
+    for pos in starts:
+        m = pattern.match(text, pos)
+        if m:
+            return m
+    return None
+
+
+def _header_name_candidates(block: str, keyword_starts: list[int]) -> list[int]:
+    """"XXX 경력" / "XXX 신입" 이름 후보 단어의 시작 위치 (NAME_BEFORE_* 네 패턴 finditer 의 m.start() 집합, 앞에서부터).
+    keyword_starts: block 안 경력·신입 위치 (정렬). 키워드 바로 앞 공백(줄바꿈 포함)을 건너뛴 단어가 후보이고,
+    키워드 뒤가 공백 한 글자(NAME_BEFORE_CAREER/NEWCOMER) 또는 공백만 이어지다 줄 끝(_EOL)이어야 함.
+    finditer 는 같은 패턴의 앞 매치가 끝난 뒤부터 찾으므로, 패턴별 마지막 매치 끝 이전에서 시작하는 후보는 그 패턴으로는 안 셈."""
+    n = len(block)
+    last_end = {}  # (키워드, 줄 끝 패턴 여부) → 마지막 매치 끝
+    starts = []
+    for p in keyword_starts:
+        q = p
+        while q > 0 and block[q - 1].isspace():
+            q -= 1
+        if q == p or q == 0:
+            continue  # 키워드 앞에 공백이 없거나, 공백 앞에 단어가 없음
+        r = q
+        while r > 0 and not block[r - 1].isspace():
+            r -= 1
+        keyword = block[p : p + 2]
+        after = p + 2
+        e = after
+        while e < n and block[e].isspace():
+            e += 1
+        found = False
+        # \s*$ (MULTILINE): 뒤 공백을 가능한 한 먹은 뒤 되돌아가 줄바꿈 앞(또는 텍스트 끝)에서 끝남
+        eol_end = n if e == n else block.rfind("\n", after, e)
+        if eol_end >= 0 and r >= last_end.get((keyword, True), 0):
+            last_end[(keyword, True)] = eol_end
+            found = True
+        if e > after and r >= last_end.get((keyword, False), 0):
+            last_end[(keyword, False)] = after + 1
+            found = True
+        if found:
+            starts.append(r)
+    return starts
+
+
 def parse_header_block(block: str) -> dict:
-    """상단 블록에서 이름, 성별, 생년, 나이, 이메일, 휴대폰, 주소, 지원분야, 입사지원일, 직전연봉, 거주지 추출."""
+    """상단 블록에서 이름, 성별, 생년, 나이, 이메일, 휴대폰, 주소, 지원분야, 입사지원일, 직전연봉, 거주지 추출.
+    라벨 위치를 한 번 훑어 모은 뒤(scan_header_labels) 필드 패턴은 자기 라벨 위치에서만 match
+    (benchmarks/bench_header_block.py 가 라벨마다 search 하던 이전 구현과 결과를 비교)."""
     info = {}
-    text = block.replace("\n", " ")
+    text = block.replace("\n", " ")  # 글자 수가 같아 라벨 위치는 block 에서도 그대로
+    at = scan_header_labels(text)
 
     # 지원분야 : ... 입사지원일 : ...
-    m = re.search(r"지원분야\s*:\s*([^\s입]+)", text)
+    m = _match_at(P.HEADER_SUPPORT_FIELD, text, at["지원분야"])
     if m:
         info["supportField"] = m.group(1).strip()
-    m = re.search(r"입사지원일\s*:\s*([^)]+\))", text)
+    m = _match_at(P.HEADER_APPLICATION_DATE, text, at["입사지원일"])
     if m:
         info["applicationDate"] = m.group(1).strip()
 
@@ -395,17 +878,17 @@ def parse_header_block(block: str) -> dict:
             return False
         if any(word.startswith(x) or x in word for x in NAME_BLOCK):
             return False
-        return bool(re.match(r"^[\uac00-\ud7a3]{2,4}$", word) or re.match(r"^[A-Za-z]{2,20}$", word))
+        return bool(P.NAME_HANGUL.match(word) or P.NAME_LATIN.match(word))
 
-    # 나의 스킬 이전에 나오는 모든 "XXX 경력" / "XXX 신입" 후보를 모은 뒤, 첫 번째 유효한 이름만 사용
-    candidates = []
-    for pattern in (r"([^\s]+)\s+경력\s*$", r"([^\s]+)\s+신입\s*$", r"([^\s]+)\s+경력\s", r"([^\s]+)\s+신입\s"):
-        for m in re.finditer(pattern, block, re.MULTILINE):
-            if idx_skill != -1 and m.start() > idx_skill:
-                continue
-            candidates.append((m.start(), m.group(1).strip()))
-    candidates.sort(key=lambda x: x[0])
-    for _, name in candidates:
+    # 나의 스킬 이전에 나오는 모든 "XXX 경력" / "XXX 신입" 후보 중 앞에서부터 첫 번째 유효한 이름만 사용
+    keyword_starts = list(heapq.merge(at["경력"], at["신입"]))
+    for start in _header_name_candidates(block, keyword_starts):
+        if idx_skill != -1 and start > idx_skill:
+            break
+        end = start
+        while not block[end].isspace():
+            end += 1
+        name = block[start:end]
         if _accept_name(name):
             info["name"] = name
             break
@@ -414,7 +897,7 @@ def parse_header_block(block: str) -> dict:
         lines = block.split("\n")
         for i, line in enumerate(lines):
             line_stripped = line.strip()
-            if re.match(r"^(남|여)\s*,\s*\d{4}", line_stripped):
+            if P.HEADER_GENDER_LINE.match(line_stripped):
                 if i > 0:
                     prev = lines[i - 1].strip()
                     if _accept_name(prev):
@@ -425,25 +908,25 @@ def parse_header_block(block: str) -> dict:
                         if _accept_name(first_word):
                             info["name"] = first_word
                 break
-            if re.match(r"^[\uac00-\ud7a3]{2,4}$", line_stripped) or re.match(r"^[A-Za-z]{2,20}$", line_stripped):
+            if P.NAME_HANGUL.match(line_stripped) or P.NAME_LATIN.match(line_stripped):
                 if _accept_name(line_stripped):
                     info["name"] = line_stripped
                     break
     # 이름 폴백: 자격증 확인서 등 "성명     홍길동" 형식
     if "name" not in info or not info["name"]:
-        m_name = re.search(r"성명\s+([\uac00-\ud7a3A-Za-z]{2,20})(?:\s|$)", text)
+        m_name = _match_at(P.HEADER_NAME_LABEL, text, at["성명"])
         if m_name and _accept_name(m_name.group(1).strip()):
             info["name"] = m_name.group(1).strip()
 
     # 남/여, 1991 (34세)
-    m = re.search(r"(남|여)\s*,\s*(\d{4})\s*\((\d+)세\)", text)
+    m = _match_at(P.HEADER_GENDER_BIRTH_AGE, text, heapq.merge(at["남"], at["여"]))
     if m:
         info["gender"] = m.group(1)
         info["birthYear"] = m.group(2)
         info["age"] = int(m.group(3))
-    # 폴백: "남,"/"여," 없이 "1998 (27세)" 형태만 있는 경우 (홍순철 등)
+    # 폴백: "남,"/"여," 없이 "1998 (27세)" 형태만 있는 경우 (홍순철 등). 라벨이 없는 형식이라 search
     if "birthYear" not in info or "age" not in info:
-        m2 = re.search(r"\b(19[5-9]\d|20[0-1]\d)\s*\((\d{1,2})세\)", text)
+        m2 = P.HEADER_BIRTH_AGE.search(text)
         if m2:
             if "birthYear" not in info:
                 info["birthYear"] = m2.group(1)
@@ -454,27 +937,25 @@ def parse_header_block(block: str) -> dict:
                     pass
     # 폴백: 자격증 확인서 등 "생년월일    1999년 10월 10일" (연도만 추출, 나이는 미기재)
     if "birthYear" not in info:
-        m3 = re.search(r"생년월일\s+(\d{4})년", text)
+        m3 = _match_at(P.HEADER_BIRTH_YEAR, text, at["생년월일"])
         if m3:
             info["birthYear"] = m3.group(1)
 
     # 이메일
-    m = re.search(r"이메일\s+(\S+@\S+)", text)
+    m = _match_at(P.HEADER_EMAIL, text, at["이메일"])
     if m:
         info["email"] = m.group(1).strip()
     # 휴대폰 / 전화번호
-    m = re.search(r"(?:휴대폰|전화번호)\s+(\d{2,3}[-\s]?\d{3,4}[-\s]?\d{4})", text)
+    m = _match_at(P.HEADER_PHONE, text, heapq.merge(at["휴대폰"], at["전화번호"]))
     if m:
-        info["phone"] = re.sub(r"\s+", "", m.group(1))
+        info["phone"] = P.WHITESPACE.sub("", m.group(1))
     # 주소: 5자리 우편 (괄호 선택) 또는 3-3 형식 (괄호 필수, 전화번호 xxx-xxxx-xxxx와 구분)
-    m = re.search(
-        r"주소\s+(?:\(?\d{5}\)?|\(\d{3}-\d{3}\))\s*([^\n]+?)(?=\s+경력\s|$)", text
-    )
+    m = _match_at(P.HEADER_ADDRESS_POSTAL, text, at["주소"])
     if m:
         info["address"] = m.group(1).strip()
     # 주소 대체: "주소 " 다음 한 줄
     if "address" not in info:
-        m = re.search(r"주소\s+([^\n]+)", block)
+        m = _match_at(P.HEADER_ADDRESS_LINE, block, at["주소"])
         if m:
             info["address"] = m.group(1).strip()
     # 거주지: 주소에서 분류 (서울/수도권/시흥/안산/지방)
@@ -482,44 +963,42 @@ def parse_header_block(block: str) -> dict:
         info["residence"] = _classify_residence(info["address"])
 
     # 경력 총 N년 N개월 (표에서 학력/경력 순서가 바뀌어도 경력 열 값만 쓰기)
-    m = re.search(r"경력\s*총\s*(\d+년\s*\d*개월)", text)
+    m = _match_at(P.TOTAL_CAREER, text, at["경력"])
     if m:
         info["totalCareer"] = m.group(1).strip()
     if "totalCareer" not in info:
         # 학력 먼저인 표: "총 4년"(학력)이 "총 6년 3개월"(경력)보다 앞에 있으면, "경력" 뒤의 "총 N년"만 쓴다
-        career_pos = text.find("경력")
-        if career_pos >= 0:
-            m_after = re.search(
-                r"총\s*(\d+년\s*\d*개월)",
-                text[career_pos:],
-            )
+        if at["경력"]:
+            career_pos = at["경력"][0]
+            m_after = _match_at(P.TOTAL_PERIOD, text, (pos for pos in at["총"] if pos >= career_pos))
             if m_after:
                 info["totalCareer"] = m_after.group(1).strip()
         if "totalCareer" not in info:
-            m = re.search(r"총\s*(\d+년\s*\d*개월)", text)
+            m = _match_at(P.TOTAL_PERIOD, text, at["총"])
             if m:
                 info["totalCareer"] = m.group(1).strip()
-    m = re.search(r"희망연봉\s*[:\s]*([0-9,]+)\s*만원", text)
+    m = _match_at(P.DESIRED_SALARY, text, at["희망연봉"])
     if m:
         info["desiredSalary"] = m.group(1).strip() + "만원"
-    if "desiredSalary" not in info and "회사내규에 따름" in text:
-        idx_desired = text.find("회사내규에 따름")
-        idx_last = text.find("직전 연봉")
-        if idx_desired != -1 and (idx_last == -1 or idx_desired < idx_last):
+    company_rule = bool(at["회사내규에 따름"])
+    if "desiredSalary" not in info and company_rule:
+        idx_desired = at["회사내규에 따름"][0]
+        idx_last = next((pos for pos in at["직전"] if text.startswith("직전 연봉", pos)), -1)
+        if idx_last == -1 or idx_desired < idx_last:
             info["desiredSalary"] = "회사내규에 따름"
     # 직전 연봉: "직전 연봉 : 3,800 만원" (공백 허용)
-    m = re.search(r"직전\s*연봉\s*:\s*([0-9,]+)\s*만\s*원", text)
+    m = _match_at(P.LAST_SALARY_SPACED, text, at["직전"])
     if m:
         info["lastSalary"] = m.group(1).strip() + "만원"
     if "lastSalary" not in info:
-        m = re.search(r"직전\s*연봉\s*:\s*([0-9,]+)\s*만원", text)
+        m = _match_at(P.LAST_SALARY, text, at["직전"])
         if m:
             info["lastSalary"] = m.group(1).strip() + "만원"
     if "lastSalary" not in info:
-        m = re.search(r"직전\s*연봉\s*:\s*([^\s원]+만원?)", text)
+        m = _match_at(P.LAST_SALARY_LOOSE, text, at["직전"])
         if m:
             info["lastSalary"] = m.group(1).strip().rstrip("원") + ("만원" if "만" in m.group(1) else "만원")
-    if "lastSalary" not in info and "회사내규에 따름" in text:
+    if "lastSalary" not in info and company_rule:
         info["lastSalary"] = "회사내규에 따름"
 
     return info
@@ -530,21 +1009,21 @@ def parse_summary_table_from_career_block(block: str) -> dict:
     out = {}
     text = block.replace("\n", " ")
     # 경력 총 N년 N개월 (표에서 학력/경력 순서 바뀌어도 경력 열 값만)
-    m = re.search(r"경력\s*총\s*(\d+년\s*\d*개월)", text)
+    m = P.TOTAL_CAREER.search(text)
     if m:
         out["totalCareer"] = m.group(1).strip()
     if "totalCareer" not in out:
         career_pos = text.find("경력")
         if career_pos >= 0:
-            m_after = re.search(r"총\s*(\d+년\s*\d*개월)", text[career_pos:])
+            m_after = P.TOTAL_PERIOD.search(text[career_pos:])
             if m_after:
                 out["totalCareer"] = m_after.group(1).strip()
         if "totalCareer" not in out:
-            m = re.search(r"총\s*(\d+년\s*\d*개월)", text)
+            m = P.TOTAL_PERIOD.search(text)
             if m:
                 out["totalCareer"] = m.group(1).strip()
     # 희망연봉: 요약 표 1행(회사내규에 따름) / 2행(직전 연봉 : N만원)
-    m = re.search(r"희망연봉\s*[:\s]*([0-9,]+)\s*만원", text)
+    m = P.DESIRED_SALARY.search(text)
     if m:
         out["desiredSalary"] = m.group(1).strip() + "만원"
     if "desiredSalary" not in out and "회사내규에 따름" in text:
@@ -553,11 +1032,11 @@ def parse_summary_table_from_career_block(block: str) -> dict:
         if idx_desired != -1 and (idx_last == -1 or idx_desired < idx_last):
             out["desiredSalary"] = "회사내규에 따름"
     # 직전 연봉 (요약 표 2행, "3,800 만원"처럼 공백 허용)
-    m = re.search(r"직전\s*연봉\s*:\s*([0-9,]+)\s*만\s*원", text)
+    m = P.LAST_SALARY_SPACED.search(text)
     if m:
         out["lastSalary"] = m.group(1).strip() + "만원"
     if "lastSalary" not in out:
-        m = re.search(r"직전\s*연봉\s*:\s*([0-9,]+)\s*만원", text)
+        m = P.LAST_SALARY.search(text)
         if m:
             out["lastSalary"] = m.group(1).strip() + "만원"
     if "lastSalary" not in out and "회사내규에 따름" in text:
@@ -566,130 +1045,131 @@ def parse_summary_table_from_career_block(block: str) -> dict:
 
 
 # --- 경력 블록 파싱 (기간 회사 직무 ...) ---
-CAREER_PATTERN = re.compile(
-    r"(\d{4}\.\d{2}\s*~\s*(?:재직중|\d{4}\.\d{2}))\s+(.+?)\s+·\s+(.+?)(?:\n|$)",
-    re.DOTALL,
+# 기간  회사/부서 · 직무 (한 줄). 회사는 첫 '·' 앞까지(앞뒤 공백 제외), 직무는 줄 끝까지.
+# 예전 DOTALL '.+?' 두 개는 '·'가 없는 긴 텍스트에서 시작 위치마다 끝까지 다시 훑어 시간이 폭증했으므로 줄 안으로 한정
+P.add(
+    "CAREER_ROW",
+    r"(\d{4}\.\d{2}\s*~\s*(?:재직중|\d{4}\.\d{2}))\s+([^\s·](?:[^\n·]*[^\s·])?)\s+·\s+([^\n]+)",
 )
-
-
-def parse_career_entries(block: str) -> list:
-    """경력 요약 + 상세 블록에서 항목 리스트 추출."""
+# 기간 줄: 2017.08 ~ 재직중  회사 · 직무 / 다음 항목 시작 판정 / 근무기간 / 연봉·근무지역·퇴사사유
+P.add("CAREER_DATE_LINE", r"(\d{4}\.\d{2})\s*~\s*(재직중|\d{4}\.\d{2})\s+(.+)")
+P.add("CAREER_DATE_START", r"\d{4}\.\d{2}\s*~\s*(?:재직중|\d{4}\.\d{2})")
+P.add("CAREER_DURATION", r"^\d+개월$|^\d+년\s*\d*개월$")
+P.add("CAREER_SALARY", r"연봉\s+([^\s근]+)")
+P.add("CAREER_REGION", r"근무지역\s+([^\s퇴]+?)(?=\s*퇴사사유|\s*$)")
+P.add("CAREER_REGION_LOOSE", r"근무지역\s+(\S+)")
+P.add("CAREER_LEAVE_REASON", r"퇴사사유\s+(.+)")
+
+
+def _apply_career_pay_fields(entry: dict, line: str) -> None:
+    """한 줄에서 연봉/근무지역/퇴사사유를 찾아 entry에 덮어씀 (없는 항목은 그대로)."""
+    sm = P.CAREER_SALARY.search(line)
+    if sm:
+        entry["salary"] = sm.group(1).strip()
+    rm = P.CAREER_REGION.search(line) or P.CAREER_REGION_LOOSE.search(line)
+    if rm:
+        entry["region"] = rm.group(1).strip()
+    lm = P.CAREER_LEAVE_REASON.search(line)
+    if lm:
+        entry["leaveReason"] = lm.group(1).strip()
+
+
+def parse_career_entries(block: str | list[LayoutLine]) -> list:
+    """경력 요약 + 상세 블록에서 항목 리스트 추출. block은 문자열 또는 줄 레코드(SectionSpans.section_lines).
+
+    줄을 앞에서부터 한 번만 보는 상태 기계:
+    - 기간 줄(2017.08 ~ 재직중  회사 · 직무)이면 이전 항목을 닫고 새 항목 시작 (기간만 있고 나머지가 없는 줄은 닫기만 함)
+    - 항목 상세: "N개월"/"N년 N개월"은 근무기간, 그 밖의 비어 있지 않은 줄은 설명 (연봉으로 시작하는 줄 제외).
+      연봉/근무지역/퇴사사유가 처음 나온 줄까지가 설명이고, 그 뒤로는 다음 기간 줄까지 세 값만 찾아 덮어씀
+    - 첫 기간 줄 앞의 줄은 무시"""
     entries = []
-    # "YYYY.MM ~ 재직중" 또는 "YYYY.MM ~ YYYY.MM" 라인 찾기
-    lines = block.split("\n")
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        # 기간 패턴: 2017.08 ~ 재직중  또는  2017.05 ~ 2017.08
-        m = re.match(r"(\d{4}\.\d{2})\s*~\s*(재직중|\d{4}\.\d{2})\s+(.+)", line.strip())
-        if m:
-            start_date = m.group(1)
-            end_raw = m.group(2)
-            rest = m.group(3)
-            # 첫 번째 ' · '를 구분자로: 앞 = 회사이름/부서 통째로, 뒤 = 직무(role)
-            parts = rest.split("·", 1)
-            company = parts[0].strip() if parts else ""
-            role = parts[1].strip() if len(parts) > 1 else ""
-            # 다음 줄에 "N개월" 또는 "N년 N개월", 연봉/근무지역/퇴사사유 있을 수 있음
-            duration = ""
-            desc_lines = []
-            salary = ""
-            region = ""
-            leave_reason = ""
-            i += 1
-            while i < len(lines):
-                next_line = lines[i]
-                if re.match(r"\d{4}\.\d{2}\s*~\s*(?:재직중|\d{4}\.\d{2})", next_line.strip()):
-                    i -= 1
-                    break
-                if re.match(r"^\d+개월$|^\d+년\s*\d*개월$", next_line.strip()):
-                    duration = next_line.strip()
-                    i += 1
-                    continue
-                if next_line.strip() and not next_line.strip().startswith("연봉"):
-                    desc_lines.append(next_line.strip())
-                if "연봉" in next_line or "근무지역" in next_line or "퇴사사유" in next_line:
-                    # 현재 줄에서 연봉/근무지역/퇴사사유 추출 (이 줄을 건너뛰지 않음)
-                    sm = re.search(r"연봉\s+([^\s근]+)", next_line)
-                    if sm:
-                        salary = sm.group(1).strip()
-                    rm = re.search(r"근무지역\s+([^\s퇴]+?)(?=\s*퇴사사유|\s*$)", next_line)
-                    if not rm:
-                        rm = re.search(r"근무지역\s+(\S+)", next_line)
-                    if rm:
-                        region = rm.group(1).strip()
-                    lm = re.search(r"퇴사사유\s+(.+)", next_line)
-                    if lm:
-                        leave_reason = lm.group(1).strip()
-                    break
-                i += 1
-            description = " ".join(desc_lines) if desc_lines else ""
-            # 첫 번째 루프에서 연봉/근무지역 줄을 만나 break한 경우 salary/region은 이미 채워짐.
-            # 다음 줄들에서 추가로 있을 수 있으므로 계속 스캔.
-            while i + 1 < len(lines):
-                i += 1
-                l = lines[i]
-                if re.match(r"\d{4}\.\d{2}\s*~\s*(?:재직중|\d{4}\.\d{2})", l.strip()):
-                    i -= 1
-                    break
-                sm = re.search(r"연봉\s+([^\s근]+)", l)
-                if sm:
-                    salary = sm.group(1).strip()
-                rm = re.search(r"근무지역\s+([^\s퇴]+?)(?=\s*퇴사사유|\s*$)", l)
-                if not rm:
-                    rm = re.search(r"근무지역\s+(\S+)", l)
-                if rm:
-                    region = rm.group(1).strip()
-                lm = re.search(r"퇴사사유\s+(.+)", l)
-                if lm:
-                    leave_reason = lm.group(1).strip()
-            entries.append({
-                "startDate": start_date,
-                "endDate": "재직중" if end_raw == "재직중" else end_raw,
-                "companyNameAndDepartment": company,
-                "role": role,
-                "duration": duration,
-                "description": description,
-                "salary": salary,
-                "region": region,
-                "leaveReason": leave_reason,
-            })
-        i += 1
+    entry = None
+    desc_lines: list[str] = []
+    in_detail = False  # True: 근무기간/설명 수집 중, False: 연봉 줄 이후 (연봉/근무지역/퇴사사유만)
+    for line in as_layout_lines(block):
+        # 날짜로 시작하는 줄만 정규식 검사
+        if line.date and P.CAREER_DATE_START.match(line.text):
+            if entry is not None:
+                entry["description"] = " ".join(desc_lines)
+                entries.append(entry)
+                entry = None
+            m = P.CAREER_DATE_LINE.match(line.text)
+            if m:
+                # 첫 번째 ' · '를 구분자로: 앞 = 회사이름/부서 통째로, 뒤 = 직무(role)
+                parts = m.group(3).split("·", 1)
+                entry = {
+                    "startDate": m.group(1),
+                    "endDate": m.group(2),
+                    "companyNameAndDepartment": parts[0].strip(),
+                    "role": parts[1].strip() if len(parts) > 1 else "",
+                    "duration": "",
+                    "description": "",
+                    "salary": "",
+                    "region": "",
+                    "leaveReason": "",
+                }
+                desc_lines = []
+                in_detail = True
+            continue
+        if entry is None:
+            continue
+        # 연봉/근무지역/퇴사사유 정규식은 모두 그 단어를 포함해야 맞으므로 문자열 검사로 먼저 거름
+        text = line.text
+        has_pay = "연봉" in text or "근무지역" in text or "퇴사사유" in text
+        if in_detail:
+            # 근무기간은 '개월'로 끝나는 줄만 정규식 검사
+            if text.endswith("개월") and P.CAREER_DURATION.match(text):
+                entry["duration"] = text
+                continue
+            if not line.blank and not text.startswith("연봉"):
+                desc_lines.append(text)
+            if has_pay:
+                in_detail = False
+        if has_pay:
+            _apply_career_pay_fields(entry, line.raw)
+    if entry is not None:
+        entry["description"] = " ".join(desc_lines)
+        entries.append(entry)
     return entries
 
 
 # 학점 패턴: 3.46/4.5 또는 3.46 / 4.5 (슬래시 주변 공백 허용)
-GPA_PATTERN = re.compile(r"\d+\.\d+\s*/\s*\d+\.\d+")
+# (?<!\d): 숫자 중간에서는 시작하지 않음 (결과 같음, 긴 숫자열에서 이차 시간 방지)
+P.add("GPA", r"(?<!\d)\d+\.\d+\s*/\s*\d+\.\d+")
+# YYYY.MM ~ YYYY.MM  학교명 ... / 다음 학력 항목 시작 판정 / 폴백 시 학교 키워드
+P.add("EDU_DATE_LINE", r"(\d{4}\.\d{2})\s*~\s*(\d{4}\.\d{2})\s+(.+)")
+P.add("EDU_DATE_START", r"^\d{4}\.\d{2}\s*~\s*\d{4}\.\d{2}\s+")
+P.add("EDU_SCHOOL_KEYWORD", r"(고등학교|중학교|초등학교|대학교|대학)")
 
 
 # --- 학력 블록 ---
-def parse_education_entries(block: str) -> list:
-    """학력 섹션에서 학교·기간·학위·전공·학점(GPA) 추출. 학점은 3.46/4.5 형태."""
+def parse_education_entries(block: str | list[LayoutLine]) -> list:
+    """학력 섹션에서 학교·기간·학위·전공·학점(GPA) 추출. 학점은 3.46/4.5 형태.
+    block은 문자열 또는 줄 레코드(SectionSpans.section_lines)."""
     entries = []
-    lines = block.split("\n")
+    lines = as_layout_lines(block)
     i = 0
     while i < len(lines):
         line = lines[i]
         # YYYY.MM ~ YYYY.MM   학교명  학위  전공  [학점]
-        m = re.match(r"(\d{4}\.\d{2})\s*~\s*(\d{4}\.\d{2})\s+(.+)", line.strip())
+        m = P.EDU_DATE_LINE.match(line.text) if line.date else None
         if m:
             start_date = m.group(1)
             end_date = m.group(2)
             rest = m.group(3)
             # 같은 줄에서 학점(3.46/4.5) 추출 후 제거 (전공에 섞이지 않도록)
             gpa = ""
-            gpa_match = GPA_PATTERN.search(rest)
+            gpa_match = P.GPA.search(rest)
             if gpa_match:
                 gpa = gpa_match.group(0)
                 rest = (rest[: gpa_match.start()] + rest[gpa_match.end() :]).strip()
             # 다음 몇 줄에 학점이 있는 경우 (예: 3.46/4.5 또는 "학점 3.46/4.5", 빈 줄 건너뛰기)
             if not gpa:
-                date_line_re = re.compile(r"^\d{4}\.\d{2}\s*~\s*\d{4}\.\d{2}\s+")
                 for j in range(i + 1, min(i + 4, len(lines))):
-                    cand = lines[j].strip()
-                    if date_line_re.match(cand):
+                    cand = lines[j].text
+                    if lines[j].date and P.EDU_DATE_START.match(cand):
                         break  # 다음 학력 항목이면 중단
-                    gpa_m = GPA_PATTERN.search(cand)
+                    gpa_m = P.GPA.search(cand)
                     if gpa_m:
                         gpa = gpa_m.group(0).replace(" ", "")  # "3.46 / 4.5" → "3.46/4.5"
                         i = j  # 해당 줄까지 소비
@@ -712,7 +1192,7 @@ def parse_education_entries(block: str) -> list:
             if not degree:
                 # 이전 줄(헤더에 "학력 고등학교 졸업"이 있는 경우)
                 if i > 0:
-                    prev_line = lines[i - 1].strip()
+                    prev_line = lines[i - 1].text
                     for d in ("졸업", "재학", "휴학"):
                         if d in prev_line:
                             degree = d
@@ -720,8 +1200,8 @@ def parse_education_entries(block: str) -> list:
                 for j in range(i + 1, min(i + 3, len(lines))):
                     if degree:
                         break
-                    next_line = lines[j].strip()
-                    if re.match(r"^\d{4}\.\d{2}\s*~\s*\d{4}\.\d{2}\s+", next_line):
+                    next_line = lines[j].text
+                    if lines[j].date and P.EDU_DATE_START.match(next_line):
                         break  # 다음 학력 항목이면 중단
                     for d in ("졸업", "재학", "휴학"):
                         if d in next_line:
@@ -740,18 +1220,22 @@ def parse_education_entries(block: str) -> list:
             })
         i += 1
     # 날짜 없이 "고등학교 졸업"만 있는 블록 폴백: 항목이 없고 블록에 학교+졸업/재학이 있으면 1건 추가
-    if not entries and block.strip():
+    if not entries and not all(line.blank for line in lines):
+        # 찾는 단어에 줄바꿈이 없으므로 "단어 in 블록" == 어느 한 줄에 포함
+        def in_block(word: str) -> bool:
+            return any(word in line.raw for line in lines)
+
         degree_cand = None
         for d in ("졸업", "재학", "휴학"):
-            if d in block:
+            if in_block(d):
                 degree_cand = d
                 break
         school_cand = ""
-        for raw_line in lines:
-            line = raw_line.strip()
+        for record in lines:
+            line = record.text
             if not line or (line.startswith("학력") and len(line) < 30):
                 continue
-            if not re.search(r"(고등학교|중학교|초등학교|대학교|대학)", line) or not degree_cand:
+            if not P.EDU_SCHOOL_KEYWORD.search(line) or not degree_cand:
                 continue
             # "○○고등학교 고등학교 졸업" 또는 "고등학교 졸업" 형태: 학교명은 학교 키워드 포함 토큰만 모음
             tokens = line.replace(",", " ").split()
@@ -764,9 +1248,9 @@ def parse_education_entries(block: str) -> list:
             if parts:
                 school_cand = " ".join(parts)
                 break
-        if degree_cand and (school_cand or "고등학교" in block or "중학교" in block or "대학교" in block):
+        if degree_cand and (school_cand or in_block("고등학교") or in_block("중학교") or in_block("대학교")):
             if not school_cand:
-                school_cand = "고등학교" if "고등학교" in block else ("중학교" if "중학교" in block else "대학교")
+                school_cand = "고등학교" if in_block("고등학교") else ("중학교" if in_block("중학교") else "대학교")
             entries.append({
                 "startDate": "",
                 "endDate": "",
@@ -779,22 +1263,31 @@ def parse_education_entries(block: str) -> list:
 
 
 # --- 자격/어학/수상 ---
-def parse_certification_entries(block: str) -> list:
-    """자격증/어학/수상 라인: YYYY.MM  자격명  합격여부/등급/점수  시행처 형태만 수집."""
+P.add("CONTROL_CHARS", r"[\f\r]+")
+P.add("CERT_LINE", r"(\d{4}\.\d{2})\s+(.+?)\s+([^\d].+)$")
+P.add("CERT_ISSUER_SPLIT", r"\s{3,}|\t+")
+P.add("CERT_DATE_LINE", r"(\d{4}\.\d{2})\s+(.+)")
+
+
+def parse_certification_entries(block: str | list[LayoutLine]) -> list:
+    """자격증/어학/수상 라인: YYYY.MM  자격명  합격여부/등급/점수  시행처 형태만 수집.
+    block은 문자열 또는 줄 레코드(SectionSpans.section_lines)."""
     entries = []
-    for raw_line in block.split("\n"):
-        # 폼피드·제어문자 제거 후 한 줄로
-        line = re.sub(r"[\f\r]+", " ", raw_line).strip()
+    for record in as_layout_lines(block):
+        # 폼피드·제어문자 제거 후 한 줄로 (text는 이미 strip — 줄 안쪽 제어문자만 공백으로)
+        line = P.CONTROL_CHARS.sub(" ", record.text)
         if not line or len(line) < 5:
             continue
         # "자격/어학/수상" 헤더 라인 스킵
         if line.startswith("자격") and ("어학" in line or "수상" in line) and len(line) < 30:
             continue
         # YYYY.MM  자격명  합격여부/등급/점수  시행처 (날짜로 시작하는 라인만 자격으로 인정)
-        m = re.match(r"(\d{4}\.\d{2})\s+(.+?)\s+([^\d].+)$", line)
+        if not record.date:
+            continue
+        m = P.CERT_LINE.match(line)
         if m:
             issuer_full = m.group(3).strip()
-            issuer_parts = re.split(r"\s{3,}|\t+", issuer_full)
+            issuer_parts = P.CERT_ISSUER_SPLIT.split(issuer_full)
             if len(issuer_parts) >= 2:
                 grade_status = issuer_parts[0].strip()
                 issuer_org = " ".join(issuer_parts[1:]).strip()
@@ -809,10 +1302,10 @@ def parse_certification_entries(block: str) -> list:
             })
             continue
         # 날짜 + 자격명만 있는 라인 (합격/시행처 없음). 경력 형식(YYYY.MM ~ ...) 제외
-        m2 = re.match(r"(\d{4}\.\d{2})\s+(.+)", line)
+        m2 = P.CERT_DATE_LINE.match(line)
         if m2:
             rest = m2.group(2).strip()
-            if rest and " ~ " not in rest and not re.match(r"^\d{4}\.\d{2}", rest):
+            if rest and " ~ " not in rest and not P.YEAR_MONTH.match(rest):
                 entries.append({
                     "date": m2.group(1),
                     "name": rest,
@@ -823,19 +1316,34 @@ def parse_certification_entries(block: str) -> list:
 
 
 # --- 취업우대 (병역 등) ---
+# "병역 : 상태 … 군별/계급 … 기간" 을 한 패턴(.*?(\S+/\S+).*?)으로 잡으면 '/' 없는 긴 토큰에서 이차 역추적 →
+# 라벨·상태를 match 한 뒤 같은 줄에서 '/' 토큰(토큰 처음에서만 시작), 그 뒤 기간을 차례로 search
+P.add("MILITARY", r"병역\s*:\s*(\S+)")
+P.add("MILITARY_DETAIL", r"(?<!\S)[^\s/]+/\S+")
+P.add("MILITARY_PERIOD", r"\d{4}\.\d{2}\s*~\s*\d{4}\.\d{2}")
+
+
 def parse_employment_preference(block: str) -> dict:
     """병역 등 취업우대사항."""
     out = {}
     if "병역" in block:
-        m = re.search(r"병역\s*:\s*(\S+).*?(\S+/\S+).*?(\d{4}\.\d{2}\s*~\s*\d{4}\.\d{2})", block)
-        if m:
-            out["militaryStatus"] = m.group(1)
-            out["militaryDetail"] = m.group(2)
-            out["militaryPeriod"] = m.group(3)
+        for m in P.MILITARY.finditer(block):
+            line_end = block.find("\n", m.end())
+            line_end = len(block) if line_end < 0 else line_end
+            detail = P.MILITARY_DETAIL.search(block, m.end(), line_end)
+            period = detail and P.MILITARY_PERIOD.search(block, detail.end(), line_end)
+            if period:
+                out["militaryStatus"] = m.group(1)
+                out["militaryDetail"] = detail.group(0)
+                out["militaryPeriod"] = period.group(0)
+                break
     return out
 
 
 # --- 포트폴리오: 파일명 나열 ---
+P.add("PORTFOLIO_LABEL", r"^(포트폴리오|자격증|증명서)\s*", re.IGNORECASE)
+
+
 def parse_portfolio(block: str) -> list:
     """첨부 파일명만 추출. 라벨과 파일명이 같은 라인에 있어도 파일명만 추출."""
     names = []
@@ -847,18 +1355,18 @@ def parse_portfolio(block: str) -> list:
         if line.endswith((".jpg", ".jpeg", ".png", ".pdf", ".doc", ".docx")):
             # "포트폴리오                  운전면허증.jpg" 같은 경우 파일명만 추출
             # 라벨(포트폴리오, 자격증 등) 제거
-            parts = re.split(r"\s{3,}", line)  # 3개 이상 공백으로 분리
+            parts = P.SPACES_3.split(line)  # 3개 이상 공백으로 분리
             for part in parts:
                 part = part.strip()
                 if part.endswith((".jpg", ".jpeg", ".png", ".pdf", ".doc", ".docx")):
                     # 라벨 키워드 제거
-                    cleaned = re.sub(r"^(포트폴리오|자격증|증명서)\s*", "", part, flags=re.IGNORECASE).strip()
+                    cleaned = P.PORTFOLIO_LABEL.sub("", part).strip()
                     if cleaned:
                         names.append(cleaned)
                     break
             else:
                 # 분리되지 않았으면 전체 라인 사용 (라벨 제거)
-                cleaned = re.sub(r"^(포트폴리오|자격증|증명서)\s*", "", line, flags=re.IGNORECASE).strip()
+                cleaned = P.PORTFOLIO_LABEL.sub("", line).strip()
                 if cleaned:
                     names.append(cleaned)
     # 중복 제거
@@ -871,17 +1379,23 @@ def parse_portfolio(block: str) -> list:
     return unique_names
 
 
-def _write_debug_stage1(debug_dir: str, base_name: str, raw_text: str, engine: str) -> None:
-    """1단계(pdftotext 등 추출) 출력: raw 텍스트 + 사용 엔진."""
+def _write_debug_stage1(
+    debug_dir: str, base_name: str, raw_text: str, engine: str, pages: Optional[list[dict]] = None
+) -> None:
+    """1단계(pdftotext 등 추출) 출력: raw 텍스트 + 사용 엔진 (+ pages: 페이지별 크기·이미지 수)."""
     import os
     os.makedirs(debug_dir, exist_ok=True)
     raw_path = os.path.join(debug_dir, f"{base_name}.stage1_raw.txt")
     with open(raw_path, "w", encoding="utf-8") as f:
         f.write(f"# engine: {engine}\n")
         f.write(raw_text)
+    meta = {"engine": engine, "charCount": len(raw_text)}
+    if pages is not None:
+        meta["pageCount"] = len(pages)
+        meta["pages"] = pages
     meta_path = os.path.join(debug_dir, f"{base_name}.stage1_meta.json")
     with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump({"engine": engine, "charCount": len(raw_text)}, f, ensure_ascii=False, indent=2)
+        json.dump(meta, f, ensure_ascii=False, indent=2)
 
 
 def _write_debug_stage2(
@@ -903,104 +1417,362 @@ def _write_debug_stage2(
         json.dump(out, f, ensure_ascii=False, indent=2)
 
 
+def stage2_fingerprint(use_corpus_headers: bool = False) -> str:
+    """2단계 결과 fingerprint: PARSER_VERSION + 섹션 헤더 설정(SECTION_HEADERS, CORPUS_HEADER_TO_SECTION,
+    use_corpus_headers 이면 common_headers.json 내용). 하나라도 바뀌면 캐시된 결과는 stale."""
+    from stage1_cache import stage2_fingerprint as _fingerprint
+
+    config = {
+        "sectionHeaders": SECTION_HEADERS,
+        "corpusHeaderToSection": CORPUS_HEADER_TO_SECTION,
+        "corpusHeaders": load_section_headers_from_corpus() if use_corpus_headers else None,
+    }
+    return _fingerprint("pdf_resume", PARSER_VERSION, config)
+
+
+# 스킬 / 공통 공백 분리
+P.add("SKILLS_HEADER", r"^나의\s*스킬\s*\n?", re.MULTILINE)
+P.add("SKILLS_IN_HEADER", r"나의\s*스킬\s*\n(.+?)(?=경력\s*총|\Z)", re.DOTALL)
+P.add("WHITESPACE", r"\s+")
+P.add("SPACES_2", r"\s{2,}")
+P.add("SPACES_3", r"\s{3,}")
+
+
+def _stage2_corpus_headers(use_corpus_headers: bool = False) -> Optional[list[dict] | list[str]]:
+    """헤더 기준 분할에 쓸 공통 헤더 목록 (+경력기술서). use_corpus_headers 가 아니거나 헤더가 없으면 None."""
+    corpus_headers = load_section_headers_from_corpus() if use_corpus_headers else None
+    if not corpus_headers:
+        return None
+    # 경력기술서 섹션도 감지하도록 헤더 목록에 추가 (PDF에 해당 항목이 있으면 파싱)
+    merged_headers = list(corpus_headers)
+    if isinstance(merged_headers[0], dict):
+        if not any(h.get("text") == "경력기술서" for h in merged_headers if isinstance(h, dict)):
+            merged_headers.append({"text": "경력기술서", "trailing_min_empty_lines": 0})
+    elif isinstance(merged_headers[0], str):
+        if "경력기술서" not in merged_headers:
+            merged_headers.append("경력기술서")
+    return merged_headers
+
+
+def _split_stage2_sections(text: str, use_corpus_headers: bool = False) -> SectionSpans:
+    """2단계 섹션 분할. use_corpus_headers면 공통 헤더(+경력기술서) 기준, 아니면 연속 빈 줄 기준."""
+    merged_headers = _stage2_corpus_headers(use_corpus_headers)
+    if merged_headers:
+        return split_section_spans_by_headers(text, merged_headers)
+    return split_section_spans(text)
+
+
+def parse_pdf_resume_text(
+    text: str,
+    engine: str = "pdftotext",
+    use_corpus_headers: bool = False,
+    debug_dir: Optional[str] = None,
+    base_name: str = "resume",
+    pages: Optional[list[dict]] = None,
+    profiler=None,
+    fields: Optional[list[str]] = None,
+) -> dict:
+    """1단계 텍스트만으로 2단계 파싱 (PDF 불필요, 증명사진 제외).
+    debug_dir이 있으면 1단계(raw 텍스트, pages 메타), 2단계(섹션/블록) 중간 결과를 <base_name>.* 로 저장.
+    profiler(stage_profile.StageProfiler)가 있으면 섹션 분할·parse_* 함수별 시간과 chars/lines/blocks 수를 기록.
+    fields(OUTPUT_FIELDS 중 일부)가 있으면 그 키만 만들고 나머지 parse_* 는 실행하지 않음."""
+    profiler = profiler or NULL_PROFILER
+    with profiler.stage(SEGMENTATION):
+        sections = _split_stage2_sections(text, use_corpus_headers)
+    if profiler.enabled:
+        profiler.count("chars", len(text))
+        profiler.count("lines", len(sections.raw_lines))
+        profiler.count("blocks", len(sections.block_spans))
+        profiler.count("sections", len(sections.section_spans))
+
+    if debug_dir:
+        with profiler.stage("debugOutput"):
+            _write_debug_stage1(debug_dir, base_name, text, engine, pages)
+            materialized, blocks, block_section_names = sections.materialize()
+            _write_debug_stage2(debug_dir, base_name, blocks, block_section_names, materialized)
+    want = set(fields) if fields else set(OUTPUT_FIELDS)
+    out = {}
+    if "basicInfo" in want:
+        # basicInfo: 첫 블록만 있으면 이름/이메일/주소가 둘째 블록에 있어 빈 basic이 됨 → 첫 두 블록 합쳐서 추출
+        with profiler.stage("parse_header_block"):
+            basic = parse_header_block(sections.join_blocks(2))
+        header_block = sections.section("header")
+
+        # basicInfo 아래 요약 표(경력 총, 희망연봉, 직전 연봉)는 header 블록 또는 career 섹션 상단에 있음
+        career_block = sections.section("career_summary")
+        summary_region = header_block  # header 블록에서 요약 정보 추출
+        with profiler.stage("parse_summary_table_from_career_block"):
+            summary = parse_summary_table_from_career_block(summary_region)
+            summary.update(parse_summary_table_from_career_block(career_block))  # career 블록에도 있으면 덮어씀
+        for k, v in summary.items():
+            if v and (k not in basic or not basic.get(k)):
+                basic[k] = v
+        out["basicInfo"] = basic
+
+    # 스킬: skills 섹션에서 추출, 없으면 header에서 찾기
+    if "skills" in want:
+        with profiler.stage("skills"):
+            skills_block = sections.section("skills")
+            if skills_block:
+                # "나의 스킬" 헤더 제거하고 내용만
+                skills_text = P.SKILLS_HEADER.sub("", skills_block).strip()
+            else:
+                # 헤더 블록에서 찾기 (하위 호환)
+                skill_match = P.SKILLS_IN_HEADER.search(sections.section("header"))
+                skills_text = skill_match.group(1).strip() if skill_match else ""
+            out["skills"] = [s.strip() for s in P.SPACES_2.split(skills_text) if s.strip()]
+
+    # 항목 파서는 분할 때 만든 줄 레코드를 그대로 사용 (줄마다 strip·날짜 검사 한 번)
+    if "careers" in want:
+        with profiler.stage("parse_career_entries"):
+            out["careers"] = parse_career_entries(sections.section_lines("career_summary"))
+
+    # 학력 헤더 다음에 오는 블록에서 실제 기간 있는 라인만
+    if "education" in want:
+        with profiler.stage("parse_education_entries"):
+            out["education"] = parse_education_entries(sections.section_lines("education_header"))
+
+    if "certifications" in want:
+        with profiler.stage("parse_certification_entries"):
+            cert_lines = sections.section_lines("certifications")
+            out["certifications"] = parse_certification_entries(cert_lines) if cert_lines else []
+
+    if "employmentPreference" in want:
+        with profiler.stage("parse_employment_preference"):
+            pref_block = sections.section("employment_preference")
+            out["employmentPreference"] = parse_employment_preference(pref_block) if pref_block else {}
+
+    if "selfIntroduction" in want:
+        out["selfIntroduction"] = sections.section("self_introduction").strip()
+
+    # PDF 전용: '경력기술서' 섹션이 있으면 통째로 추출 (경력세부내용으로 전달)
+    if "careerDetailContent" in want:
+        career_detail_content = sections.section("career_detail_content").strip()
+        if career_detail_content and career_detail_content.startswith("경력기술서"):
+            first_nl = career_detail_content.find("\n")
+            if first_nl >= 0:
+                career_detail_content = career_detail_content[first_nl + 1 :].strip()
+            else:
+                career_detail_content = ""
+        if career_detail_content:
+            out["careerDetailContent"] = career_detail_content
+    return out
+
+
 def parse_pdf_resume(
     pdf_path: str,
     pdftotext_exe: Optional[str] = None,
     debug_dir: Optional[str] = None,
     use_corpus_headers: bool = False,
     photo_dir: Optional[str] = None,
+    stage1_cache=None,
+    engine: str = DEFAULT_ENGINE,
+    max_pages: Optional[int] = None,
+    sections: Optional[list[str]] = None,
+    profile: bool = False,
+    fields: Optional[list[str]] = None,
 ) -> dict:
-    """PDF 한 개를 파싱해 구조화된 dict 반환.
+    """PDF 한 개를 파싱해 구조화된 dict 반환. engine: 1단계 추출 엔진 (pdf_text_engines, 기본 pdftotext).
+    max_pages / sections 가 있으면 페이지 단위로 추출하다 조건을 채우면 멈춤 (extract_text_until_sections).
+    남은 페이지를 건너뛴 경우 결과에 "partial": {pagesRead, pageCount, reason} 이 붙고 캐시에는 저장하지 않음.
     debug_dir이 있으면 1단계(raw 텍스트), 2단계(섹션/블록) 중간 결과를 해당 폴더에 저장.
     use_corpus_headers=True 이면 common_headers.json 의 section_headers 로 구간 구분 (헤더=구간 시작).
-    참고: 같은 헤더(예: 학력)가 표와 본문에 둘 다 나오면 구간이 조기 끊길 수 있음. 기본은 연속 빈 줄 기준 분할."""
-    text, engine = extract_text_with_layout(pdf_path, pdftotext_exe)
-    corpus_headers = load_section_headers_from_corpus() if use_corpus_headers else None
-    if corpus_headers:
-        # 경력기술서 섹션도 감지하도록 헤더 목록에 추가 (PDF에 해당 항목이 있으면 파싱)
-        merged_headers = list(corpus_headers) if corpus_headers else []
-        if merged_headers and isinstance(merged_headers[0], dict):
-            if not any(h.get("text") == "경력기술서" for h in merged_headers if isinstance(h, dict)):
-                merged_headers.append({"text": "경력기술서", "trailing_min_empty_lines": 0})
-        elif merged_headers and isinstance(merged_headers[0], str):
-            if "경력기술서" not in merged_headers:
-                merged_headers.append("경력기술서")
-        sections, blocks, block_section_names = split_into_sections_by_headers(
-            text, merged_headers
-        )
-    else:
-        sections, blocks, block_section_names = split_into_sections(text)
+    stage1_cache(stage1_cache.Stage1Cache)가 있으면 같은 내용의 PDF는 1단계 추출을 건너뛰고,
+    fingerprint(stage2_fingerprint)가 같은 2단계 결과가 있으면 2단계도 건너뜀 (debug_dir 지정 시 제외).
+    참고: 같은 헤더(예: 학력)가 표와 본문에 둘 다 나오면 구간이 조기 끊길 수 있음. 기본은 연속 빈 줄 기준 분할.
+    profile=True 이면 단계별 시간·카운터를 결과의 "_timings" 에 붙임 (stage_profile, 캐시에는 저장하지 않음).
+    fields(OUTPUT_FIELDS 중 일부, 목록 화면용)가 있으면 그 키만 돌려줌: 필요한 섹션(FIELD_SECTIONS)을 sections 에 더해
+    그 섹션이 끝나면 추출을 멈추고, 나머지 parse_*·증명사진은 건너뜀. 결과에는 "partial": {..., "fields"} 가 붙고
+    캐시에는 저장하지 않음 (전체 결과가 캐시에 있으면 그 중 요청한 키만)."""
+    profiler = get_profiler(profile)
+    projected = bool(fields) and set(fields) != set(OUTPUT_FIELDS)
+    if projected:
+        sections = list(dict.fromkeys([*(sections or ()), *fields_sections(fields)])) or None
+    want_photo = bool(photo_dir) and (not projected or "profilePhotoFilename" in fields)
+    out = None
+    cache_key = fingerprint = None
+    if stage1_cache is not None:
+        from stage1_cache import stage1_key
+
+        with profiler.stage("cacheLookup"):
+            cache_key = stage1_key(pdf_path, pdftotext_exe, engine)
+            fingerprint = stage2_fingerprint(use_corpus_headers)
+            if not debug_dir:
+                out = stage1_cache.get_result(*cache_key, "pdf_resume", fingerprint)
+        if out is not None:
+            profiler.count("stage2CacheHit", 1)
+    # PDF는 한 번만 열어 (pymupdf 엔진) 텍스트·페이지 메타·증명사진에 함께 사용
+    limited = bool(max_pages or sections)
+    doc = None
+    try:
+        with profiler.stage("pdfOpen"):
+            if want_photo or (out is None and (debug_dir or limited or engine == "pymupdf")):
+                doc = _open_pdf_document(pdf_path)
+            pages, photo_xrefs = _scan_pdf_pages(doc) if doc is not None else (None, [])
+        if pages is not None:
+            profiler.count("pages", len(pages))
+        if out is None and projected and not sections:
+            out = {}  # 증명사진만 요청: 텍스트 추출·2단계 생략
+        if out is None:
+            partial = None
+            with profiler.stage(STAGE1):
+                # 페이지 제한이 있어도 전체 텍스트가 캐시에 있으면 그대로 사용 (추출 비용이 없으므로)
+                cached = stage1_cache.get(*cache_key) if limited and stage1_cache is not None else None
+                if cached is not None:
+                    text = cached
+                elif limited:
+                    text, engine, partial = extract_text_until_sections(
+                        pdf_path, pdftotext_exe, engine, doc, max_pages, sections, use_corpus_headers,
+                        stage1_cache, cache_key,
+                    )
+                else:
+                    text, engine = extract_text_with_layout(pdf_path, pdftotext_exe, stage1_cache, cache_key, engine, doc)
+            out = parse_pdf_resume_text(
+                text, engine, use_corpus_headers, debug_dir, Path(pdf_path).stem, pages, profiler,
+                fields if projected else None,
+            )
+            if partial is not None:
+                out["partial"] = partial
+            elif stage1_cache is not None and not projected:
+                with profiler.stage("cacheStore"):
+                    stage1_cache.put_result(*cache_key, "pdf_resume", fingerprint, out)
+        elif projected:
+            out = {k: v for k, v in out.items() if k in fields}
+        if projected:
+            # 요청한 키만 있는 결과 (후보를 열 때 fields 없이 다시 파싱)
+            out["partial"] = {**out.get("partial", {"reason": "fields"}), "fields": [f for f in OUTPUT_FIELDS if f in fields]}
+        # 증명사진 후보 이미지 추출 (처음 디코딩되는 한 장만 저장)
+        if want_photo and photo_xrefs:
+            with profiler.stage(PHOTO):
+                profile_filename = _save_profile_image(doc, photo_xrefs, photo_dir)
+            if profile_filename:
+                out["profilePhotoFilename"] = profile_filename
+    finally:
+        if doc is not None:
+            doc.close()
+    if profiler.enabled:
+        out["_timings"] = profiler.to_dict()
+    return out
 
-    if debug_dir:
-        base_name = Path(pdf_path).stem
-        _write_debug_stage1(debug_dir, base_name, text, engine)
-        _write_debug_stage2(debug_dir, base_name, blocks, block_section_names, sections)
-
-    # basicInfo: 첫 블록만 있으면 이름/이메일/주소가 둘째 블록에 있어 빈 basic이 됨 → 첫 두 블록 합쳐서 추출
-    header_for_basic = "\n\n".join(blocks[:2]) if len(blocks) >= 2 else (blocks[0] if blocks else "")
-    basic = parse_header_block(header_for_basic)
-    header_block = sections.get("header", "")
-
-    # basicInfo 아래 요약 표(경력 총, 희망연봉, 직전 연봉)는 header 블록 또는 career 섹션 상단에 있음
-    career_block = sections.get("career_summary", "") or ""
-    summary_region = header_block  # header 블록에서 요약 정보 추출
-    summary = parse_summary_table_from_career_block(summary_region)
-    summary.update(parse_summary_table_from_career_block(career_block))  # career 블록에도 있으면 덮어씀
-    for k, v in summary.items():
-        if v and (k not in basic or not basic.get(k)):
-            basic[k] = v
 
-    # 스킬: skills 섹션에서 추출, 없으면 header에서 찾기
-    skills_block = sections.get("skills", "")
-    if skills_block:
-        # "나의 스킬" 헤더 제거하고 내용만
-        skills_text = re.sub(r"^나의\s*스킬\s*\n?", "", skills_block, flags=re.MULTILINE).strip()
-    else:
-        # 헤더 블록에서 찾기 (하위 호환)
-        skill_match = re.search(r"나의\s*스킬\s*\n(.+?)(?=경력\s*총|\Z)", header_block, re.DOTALL)
-        skills_text = skill_match.group(1).strip() if skill_match else ""
-    skills = [s.strip() for s in re.split(r"\s{2,}", skills_text) if s.strip()]
+def _open_stage1_cache(db_path: Optional[str], max_bytes: Optional[int] = None):
+    """--stage1-cache 경로가 있으면 프로세스 공용 Stage1Cache 반환, 없으면 None."""
+    if not db_path:
+        return None
+    from stage1_cache import DEFAULT_MAX_BYTES, get_shared_cache
 
-    careers = parse_career_entries(career_block)
+    return get_shared_cache(db_path, max_bytes or DEFAULT_MAX_BYTES)
 
-    education_block = (sections.get("education_header", "") or "") + "\n" + (sections.get("education_header", "") or "")
-    # 학력 헤더 다음에 오는 블록에서 실제 기간 있는 라인만
-    edu_entries = parse_education_entries(sections.get("education_header", ""))
 
-    cert_block = sections.get("certifications", "")
-    certs = parse_certification_entries(cert_block) if cert_block else []
+def _iter_batch_paths(target: str) -> list[str]:
+    """--batch 대상: 디렉터리면 그 안의 *.pdf, 파일이면 한 줄에 경로 하나인 목록(manifest). '#' 줄은 무시."""
+    p = Path(target)
+    if p.is_dir():
+        return sorted(str(x) for x in p.iterdir() if x.is_file() and x.suffix.lower() == ".pdf")
+    paths = []
+    with open(p, "r", encoding="utf-8-sig") as f:
+        for raw in f:
+            line = raw.strip()
+            if line and not line.startswith("#"):
+                paths.append(line)
+    return paths
 
-    pref_block = sections.get("employment_preference", "")
-    employment_pref = parse_employment_preference(pref_block) if pref_block else {}
 
-    self_intro = sections.get("self_introduction", "").strip() or ""
+def _parse_for_batch(
+    pdf_path: str,
+    pdftotext_exe: Optional[str],
+    debug_dir: Optional[str],
+    use_corpus_headers: bool,
+    photo_dir: Optional[str],
+    stage1_cache_db: Optional[str] = None,
+    stage1_cache_max_bytes: Optional[int] = None,
+    engine: str = DEFAULT_ENGINE,
+    max_pages: Optional[int] = None,
+    sections: Optional[list[str]] = None,
+    profile: bool = False,
+    fields: Optional[list[str]] = None,
+) -> dict:
+    """프로세스 풀 작업 단위. 예외를 밖으로 던지지 않고 {"path", "result"} / {"path", "error"}로 돌려줌."""
+    try:
+        if not Path(pdf_path).exists():
+            return {"path": pdf_path, "error": f"File not found: {pdf_path}"}
+        # 증명사진 파일명이 profile.<ext>로 고정이므로 파일별 하위 폴더에 저장
+        file_photo_dir = str(Path(photo_dir) / Path(pdf_path).stem) if photo_dir else None
+        cache = _open_stage1_cache(stage1_cache_db, stage1_cache_max_bytes)
+        result = parse_pdf_resume(
+            pdf_path, pdftotext_exe, debug_dir, use_corpus_headers, file_photo_dir, cache, engine, max_pages, sections,
+            profile, fields,
+        )
+        return {"path": pdf_path, "result": result}
+    except Exception as e:
+        return {"path": pdf_path, **error_fields(e)}
 
-    # PDF 전용: '경력기술서' 섹션이 있으면 통째로 추출 (경력세부내용으로 전달)
-    career_detail_content = (sections.get("career_detail_content", "") or "").strip()
-    if career_detail_content and career_detail_content.startswith("경력기술서"):
-        first_nl = career_detail_content.find("\n")
-        if first_nl >= 0:
-            career_detail_content = career_detail_content[first_nl + 1 :].strip()
-        else:
-            career_detail_content = ""
 
-    out = {
-        "basicInfo": basic,
-        "skills": skills,
-        "careers": careers,
-        "education": edu_entries,
-        "certifications": certs,
-        "employmentPreference": employment_pref,
-        "selfIntroduction": self_intro,
+def run_batch(
+    target: str,
+    pdftotext_exe: Optional[str] = None,
+    debug_dir: Optional[str] = None,
+    use_corpus_headers: bool = False,
+    photo_dir: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    out=None,
+    stage1_cache_db: Optional[str] = None,
+    stage1_cache_max_bytes: Optional[int] = None,
+    engine: str = DEFAULT_ENGINE,
+    max_pages: Optional[int] = None,
+    sections: Optional[list[str]] = None,
+    profile: bool = False,
+    fields: Optional[list[str]] = None,
+) -> dict:
+    """폴더/manifest의 PDF들을 ProcessPoolExecutor로 병렬 파싱. 끝나는 순서대로 NDJSON 한 줄씩 출력하고,
+    마지막 줄에 {"summary": {files, ok, errors, elapsedSec, filesPerSec, workers}} 출력. summary dict 반환.
+    profile=True 이면 각 result에 _timings (직렬화 시간 포함) — stage_profile.py summarize 로 집계."""
+    import os
+    import time
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    out = out or sys.stdout
+    paths = _iter_batch_paths(target)
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(paths) or 1))
+    ok = 0
+    errors = 0
+    started = time.perf_counter()
+
+    def _emit(record: dict) -> None:
+        timings = record["result"].get("_timings") if isinstance(record.get("result"), dict) else None
+        out.write(dumps_profiled(record, timings, ensure_ascii=False, separators=(",", ":")) + "\n")
+        out.flush()
+
+    if paths:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    _parse_for_batch, p, pdftotext_exe, debug_dir, use_corpus_headers, photo_dir,
+                    stage1_cache_db, stage1_cache_max_bytes, engine, max_pages, sections, profile, fields,
+                ): p
+                for p in paths
+            }
+            for fut in as_completed(futures):
+                try:
+                    record = fut.result()
+                except Exception as e:  # 워커 프로세스 자체가 죽은 경우 등
+                    record = {"path": futures[fut], "error": f"{type(e).__name__}: {e}"}
+                if "error" in record:
+                    errors += 1
+                else:
+                    ok += 1
+                _emit(record)
+    elapsed = time.perf_counter() - started
+    summary = {
+        "files": len(paths),
+        "ok": ok,
+        "errors": errors,
+        "workers": workers,
+        "elapsedSec": round(elapsed, 3),
+        "filesPerSec": round(len(paths) / elapsed, 2) if elapsed > 0 else None,
     }
-    if career_detail_content:
-        out["careerDetailContent"] = career_detail_content
-    # 증명사진 후보 이미지 추출 (있으면 한 장만 저장)
-    if photo_dir:
-        profile_filename = _extract_profile_image_from_pdf(pdf_path, photo_dir)
-        if profile_filename:
-            out["profilePhotoFilename"] = profile_filename
-    return out
+    _emit({"summary": summary})
+    return summary
 
 
 def main():
@@ -1009,6 +1781,19 @@ def main():
     debug_dir = None
     use_corpus_headers = False
     photo_dir = None
+    serve = False
+    batch = False
+    max_workers = None
+    stage1_cache_db = None
+    stage1_cache_max_bytes = None
+    from_stage1 = None
+    stale_only = False
+    all_entries = False
+    engine = DEFAULT_ENGINE
+    max_pages = None
+    sections = None
+    fields = None
+    profile = False
     while args:
         if args[0] == "--pdftotext" and len(args) >= 3:
             pdftotext_exe = args[1]
@@ -1022,32 +1807,155 @@ def main():
         elif args[0] == "--photo-dir" and len(args) >= 2:
             photo_dir = args[1]
             args = args[2:]
+        elif args[0] == "--serve":
+            serve = True
+            args = args[1:]
+        elif args[0] == "--batch":
+            batch = True
+            args = args[1:]
+        elif args[0] == "--workers" and len(args) >= 2 and args[1].isdigit():
+            max_workers = int(args[1])
+            args = args[2:]
+        elif args[0] == "--stage1-cache" and len(args) >= 2:
+            stage1_cache_db = args[1]
+            args = args[2:]
+        elif args[0] == "--stage1-cache-max-mb" and len(args) >= 2 and args[1].isdigit():
+            stage1_cache_max_bytes = int(args[1]) * 1024 * 1024
+            args = args[2:]
+        elif args[0] == "--from-stage1" and len(args) >= 2:
+            from_stage1 = args[1]
+            args = args[2:]
+        elif args[0] == "--stale-only":
+            stale_only = True
+            args = args[1:]
+        elif args[0] == "--all":
+            all_entries = True
+            args = args[1:]
+        elif args[0] == "--engine" and len(args) >= 2 and args[1] in engine_names():
+            engine = args[1]
+            args = args[2:]
+        elif args[0] == "--max-pages" and len(args) >= 2 and args[1].isdigit() and int(args[1]) > 0:
+            max_pages = int(args[1])
+            args = args[2:]
+        elif args[0] == "--sections" and len(args) >= 2:
+            sections = [name.strip() for name in args[1].split(",") if name.strip()]
+            args = args[2:]
+        elif args[0] == "--fields" and len(args) >= 2:
+            fields = [name.strip() for name in args[1].split(",") if name.strip()]
+            args = args[2:]
+        elif args[0] == "--profile":
+            profile = True
+            args = args[1:]
         else:
             break
+    unknown_sections = [name for name in sections or () if name not in STAGE2_SECTION_NAMES]
+    if unknown_sections:
+        print(
+            json.dumps(
+                {"error": f"Unknown section: {', '.join(unknown_sections)} (expected one of {', '.join(STAGE2_SECTION_NAMES)})"},
+                ensure_ascii=False,
+            )
+        )
+        sys.exit(1)
+    unknown_fields = [name for name in fields or () if name not in FIELD_SECTIONS]
+    if unknown_fields:
+        print(
+            json.dumps(
+                {"error": f"Unknown field: {', '.join(unknown_fields)} (expected one of {', '.join(OUTPUT_FIELDS)})"},
+                ensure_ascii=False,
+            )
+        )
+        sys.exit(1)
+    if serve:
+        # 상주 워커 모드: stdin JSON Lines 요청 → stdout 한 줄 결과 (parse_worker.py 참고)
+        from parse_worker import main as worker_main
+        sys.argv = [sys.argv[0], "--type", "pdf_resume"]
+        if pdftotext_exe:
+            sys.argv += ["--pdftotext", pdftotext_exe]
+        if use_corpus_headers:
+            sys.argv.append("--use-corpus-headers")
+        if stage1_cache_db:
+            sys.argv += ["--stage1-cache", stage1_cache_db]
+        if stage1_cache_max_bytes:
+            sys.argv += ["--stage1-cache-max-mb", str(stage1_cache_max_bytes // (1024 * 1024))]
+        if engine != DEFAULT_ENGINE:
+            sys.argv += ["--engine", engine]
+        if max_pages:
+            sys.argv += ["--max-pages", str(max_pages)]
+        if sections:
+            sys.argv += ["--sections", ",".join(sections)]
+        if fields:
+            sys.argv += ["--fields", ",".join(fields)]
+        if profile:
+            sys.argv.append("--profile")
+        worker_main()
+        return
+    if from_stage1:
+        if not Path(from_stage1).exists():
+            print(json.dumps({"error": f"File not found: {from_stage1}"}, ensure_ascii=False))
+            sys.exit(1)
+        from stage1_cache import is_cache_db, read_stage1_text, reparse_stage2
+
+        if Path(from_stage1).is_dir() or is_cache_db(from_stage1):
+            summary = reparse_stage2(
+                from_stage1,
+                "pdf_resume",
+                stage2_fingerprint(use_corpus_headers),
+                lambda text, engine, base: parse_pdf_resume_text(text, engine, use_corpus_headers, debug_dir, base),
+                sys.stdout,
+                stale_only,
+                all_entries,
+            )
+            sys.exit(1 if summary["errors"] else 0)
+        try:
+            profiler = get_profiler(profile)
+            with profiler.stage(STAGE1):
+                text, engine, base = read_stage1_text(from_stage1)
+            data = parse_pdf_resume_text(text, engine, use_corpus_headers, debug_dir, base, profiler=profiler)
+            if profiler.enabled:
+                data["_timings"] = profiler.to_dict()
+            print(dumps_profiled(data, data.get("_timings"), ensure_ascii=False, indent=2))
+        except Exception as e:
+            import traceback
+            tb = traceback.format_exc()
+            print(json.dumps({"error": str(e), "traceback": tb}, ensure_ascii=False, indent=2))
+            sys.exit(1)
+        return
     if not args:
         print(
             json.dumps(
                 {
-                    "error": "Usage: parse_pdf_resume.py [--pdftotext PATH] [--debug-dir DIR] [--use-corpus-headers] [--photo-dir DIR] <pdf_path>"
+                    "error": "Usage: parse_pdf_resume.py [--pdftotext PATH] [--debug-dir DIR] [--use-corpus-headers] [--photo-dir DIR] [--engine pdftotext|pymupdf] [--max-pages N] [--sections a,b] [--fields a,b] [--profile] [--stage1-cache DB [--stage1-cache-max-mb N]] [--serve] [--batch [--workers N]] [--from-stage1 <txt|dir|cache.db> [--stale-only] [--all]] <pdf_path|dir|manifest>"
                 },
                 ensure_ascii=False,
                 indent=2,
             )
         )
         sys.exit(1)
+    if batch:
+        if not Path(args[0]).exists():
+            print(json.dumps({"error": f"File not found: {args[0]}"}, ensure_ascii=False))
+            sys.exit(1)
+        summary = run_batch(
+            args[0], pdftotext_exe, debug_dir, use_corpus_headers, photo_dir, max_workers,
+            stage1_cache_db=stage1_cache_db, stage1_cache_max_bytes=stage1_cache_max_bytes, engine=engine,
+            max_pages=max_pages, sections=sections, profile=profile, fields=fields,
+        )
+        sys.exit(0 if summary["files"] else 1)
     pdf_path = args[0]
     if not Path(pdf_path).exists():
         print(json.dumps({"error": f"File not found: {pdf_path}"}, ensure_ascii=False, indent=2))
         sys.exit(1)
     try:
         data = parse_pdf_resume(
-            pdf_path, pdftotext_exe, debug_dir, use_corpus_headers, photo_dir
+            pdf_path, pdftotext_exe, debug_dir, use_corpus_headers, photo_dir,
+            _open_stage1_cache(stage1_cache_db, stage1_cache_max_bytes), engine, max_pages, sections, profile, fields,
         )
-        print(json.dumps(data, ensure_ascii=False, indent=2))
+        print(dumps_profiled(data, data.get("_timings"), ensure_ascii=False, indent=2))
     except Exception as e:
         import traceback
         tb = traceback.format_exc()
-        print(json.dumps({"error": str(e), "traceback": tb}, ensure_ascii=False, indent=2))
+        print(json.dumps({**error_fields(e), "traceback": tb}, ensure_ascii=False, indent=2))
         sys.exit(1)
 
 
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이력서 파싱 상주 워커 (JSON Lines).
+
+파일마다 python + 스크립트를 새로 띄우면 인터프리터 기동·import·common_headers.json 로드가
+전체 시간의 대부분을 차지하므로, 한 프로세스를 띄워 두고 stdin으로 요청을 한 줄씩 받아
+stdout으로 결과를 한 줄씩(compact JSON) 돌려줍니다. 헤더 설정·정규식 캐시는 요청 간 재사용됩니다.
+
+요청 (한 줄 = JSON 객체 1개):
+  {"id": 1, "type": "pdf_resume", "path": "a.pdf", "photoDir": "...", "debugDir": "...", "useCorpusHeaders": true, "engine": "pymupdf"}
+  {"id": 2, "type": "docx_form_pdf", "path": "b.pdf"}
+  {"id": 3, "type": "docx_form_pdf", "text": "<pdftotext 출력>"}
+  {"id": 6, "type": "auto", "path": "c.pdf", "photoDir": "..."}   # 1단계 1회 후 형식 판별 (pdf_format_router.py)
+  {"id": 4, "type": "ping"}
+  {"id": 5, "type": "cache_stats"}        # --stage1-cache 사용 시 hit/miss 등
+  {"type": "shutdown"}
+  - type 생략 시 워커 기본값(--type, 기본 pdf_resume) 사용
+  - pdftotext 생략 시 워커 기본값(--pdftotext) 사용
+  - engine(pdf_resume 1단계 추출 엔진, pdftotext|pymupdf) 생략 시 워커 기본값(--engine, 기본 pdftotext) 사용
+  - maxPages / sections(pdf_resume 페이지 단위 조기 종료, 섹션 이름 목록) 생략 시 워커 기본값(--max-pages, --sections) 사용
+  - fields(pdf_resume 결과 키 목록, 예: ["basicInfo", "careers", "education"]) 생략 시 워커 기본값(--fields) 사용.
+    요청한 키만 파싱하고 결과에 "partial" 이 붙음 (목록 화면용, 후보를 열 때 fields 없이 다시 요청)
+  - auto 결과는 {"format", "formatScores", "data"} (data = 판별된 형식의 parse_pdf_resume / parse_docx_form_pdf 결과)
+  - profile(true면 결과에 단계별 시간 "_timings") 생략 시 워커 기본값(--profile) 사용
+
+응답 (요청 1개당 한 줄):
+  {"id": 1, "result": {...parse_pdf_resume() 결과...}}
+  {"id": 2, "error": "...", "errorCode": "not_pdf", "traceback": "..."}
+  errorCode 는 PDF 사전 검사·pdftotext 실패일 때만 (pdf_preflight.PDF_ERROR_CODES)
+
+사용법:
+    python3 scripts/parse_worker.py [--pdftotext PATH] [--use-corpus-headers] [--stage1-cache DB [--stage1-cache-max-mb N]] [--engine pdftotext|pymupdf] [--max-pages N] [--sections a,b] [--fields a,b] [--profile] [--type pdf_resume|docx_form_pdf|auto]
+    python3 scripts/parse_pdf_resume.py [--pdftotext PATH] [--use-corpus-headers] --serve
+    python3 scripts/parse_docx_form_pdf.py [--pdftotext PATH] --serve
+    python3 scripts/pdf_format_router.py [--pdftotext PATH] --serve
+"""
+
+import json
+import sys
+import traceback
+from pathlib import Path
+from typing import Optional, TextIO
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import parse_docx_form_pdf  # noqa: E402
+import parse_pdf_resume  # noqa: E402
+import pdf_format_router  # noqa: E402
+from pdf_preflight import error_fields  # noqa: E402
+from pdf_text_engines import DEFAULT_ENGINE, engine_names  # noqa: E402
+from stage_profile import dumps_profiled, get_profiler  # noqa: E402
+
+REQUEST_TYPES = ("pdf_resume", "docx_form_pdf", "auto")
+
+
+def _dumps(obj: dict) -> str:
+    """한 줄 응답용 compact JSON (줄바꿈 없음). 결과에 _timings가 있으면 직렬화 시간도 채움."""
+    result = obj.get("result")
+    timings = result.get("_timings") if isinstance(result, dict) else None
+    return dumps_profiled(obj, timings, ensure_ascii=False, separators=(",", ":"))
+
+
+def handle_request(
+    req: dict,
+    default_type: str = "pdf_resume",
+    pdftotext_exe: Optional[str] = None,
+    use_corpus_headers: bool = False,
+    stage1_cache=None,
+    engine: str = DEFAULT_ENGINE,
+    max_pages: Optional[int] = None,
+    sections: Optional[list[str]] = None,
+    profile: bool = False,
+    fields: Optional[list[str]] = None,
+) -> dict:
+    """요청 1건을 처리해 parse_pdf_resume() / parse_docx_form_pdf_text() / parse_any_pdf() 결과 dict 반환. 실패 시 예외."""
+    req_type = req.get("type") or default_type
+    exe = req.get("pdftotext") or pdftotext_exe
+    profile = bool(req.get("profile", profile))
+    if req_type == "pdf_resume":
+        pdf_path = req.get("path")
+        if not pdf_path or not Path(pdf_path).exists():
+            raise FileNotFoundError(f"File not found: {pdf_path}")
+        return parse_pdf_resume.parse_pdf_resume(
+            pdf_path,
+            exe,
+            req.get("debugDir"),
+            bool(req.get("useCorpusHeaders", use_corpus_headers)),
+            req.get("photoDir"),
+            stage1_cache,
+            req.get("engine") or engine,
+            req.get("maxPages") or max_pages,
+            req.get("sections") or sections,
+            profile,
+            req.get("fields") or fields,
+        )
+    if req_type == "docx_form_pdf":
+        text = req.get("text")
+        if text is None:
+            pdf_path = req.get("path")
+            if not pdf_path or not Path(pdf_path).exists():
+                raise FileNotFoundError(f"File not found: {pdf_path}")
+            debug_dir = req.get("debugDir")
+            if not debug_dir:
+                return parse_docx_form_pdf.parse_docx_form_pdf(pdf_path, exe, stage1_cache, profile)
+            text = parse_docx_form_pdf.extract_text_with_pdftotext(pdf_path, exe, stage1_cache)
+            Path(debug_dir).mkdir(parents=True, exist_ok=True)
+            (Path(debug_dir) / f"{Path(pdf_path).stem}_pdftotext.txt").write_text(text, encoding="utf-8")
+        profiler = get_profiler(profile)
+        data = parse_docx_form_pdf.parse_docx_form_pdf_text(text, profiler)
+        if profiler.enabled:
+            data["_timings"] = profiler.to_dict()
+        return data
+    if req_type == "auto":
+        corpus = bool(req.get("useCorpusHeaders", use_corpus_headers))
+        text = req.get("text")
+        if text is not None:
+            profiler = get_profiler(profile)
+            data = pdf_format_router.parse_any_pdf_text(text, req.get("engine") or engine, corpus, profiler)
+            if profiler.enabled:
+                data["_timings"] = profiler.to_dict()
+            return data
+        pdf_path = req.get("path")
+        if not pdf_path or not Path(pdf_path).exists():
+            raise FileNotFoundError(f"File not found: {pdf_path}")
+        return pdf_format_router.parse_any_pdf(
+            pdf_path, exe, stage1_cache, req.get("engine") or engine, corpus, req.get("photoDir"), profile
+        )
+    raise ValueError(f"Unknown request type: {req_type} (expected one of {', '.join(REQUEST_TYPES)})")
+
+
+def serve(
+    stdin: TextIO = sys.stdin,
+    stdout: TextIO = sys.stdout,
+    default_type: str = "pdf_resume",
+    pdftotext_exe: Optional[str] = None,
+    use_corpus_headers: bool = False,
+    stage1_cache=None,
+    engine: str = DEFAULT_ENGINE,
+    max_pages: Optional[int] = None,
+    sections: Optional[list[str]] = None,
+    profile: bool = False,
+    fields: Optional[list[str]] = None,
+) -> None:
+    """stdin이 닫히거나 shutdown 요청이 올 때까지 요청을 한 줄씩 처리. 요청 하나의 실패가 워커를 죽이지 않음."""
+    for raw in stdin:
+        line = raw.strip()
+        if not line:
+            continue
+        req_id = None
+        try:
+            req = json.loads(line)
+            if not isinstance(req, dict):
+                raise ValueError("request must be a JSON object")
+            req_id = req.get("id")
+            if req.get("type") == "shutdown":
+                break
+            if req.get("type") == "ping":
+                resp = {"id": req_id, "result": "pong"}
+            elif req.get("type") == "cache_stats":
+                resp = {"id": req_id, "result": stage1_cache.stats() if stage1_cache is not None else None}
+            else:
+                result = handle_request(
+                    req, default_type, pdftotext_exe, use_corpus_headers, stage1_cache, engine, max_pages, sections,
+                    profile, fields,
+                )
+                resp = {"id": req_id, "result": result}
+        except Exception as e:
+            resp = {"id": req_id, **error_fields(e), "traceback": traceback.format_exc()}
+        stdout.write(_dumps(resp) + "\n")
+        stdout.flush()
+
+
+def main():
+    args = sys.argv[1:]
+    pdftotext_exe = None
+    use_corpus_headers = False
+    default_type = "pdf_resume"
+    stage1_cache_db = None
+    stage1_cache_max_bytes = None
+    engine = DEFAULT_ENGINE
+    max_pages = None
+    sections = None
+    fields = None
+    profile = False
+    while args:
+        if args[0] == "--pdftotext" and len(args) >= 2:
+            pdftotext_exe = args[1]
+            args = args[2:]
+        elif args[0] == "--use-corpus-headers":
+            use_corpus_headers = True
+            args = args[1:]
+        elif args[0] == "--type" and len(args) >= 2 and args[1] in REQUEST_TYPES:
+            default_type = args[1]
+            args = args[2:]
+        elif args[0] == "--stage1-cache" and len(args) >= 2:
+            stage1_cache_db = args[1]
+            args = args[2:]
+        elif args[0] == "--stage1-cache-max-mb" and len(args) >= 2 and args[1].isdigit():
+            stage1_cache_max_bytes = int(args[1]) * 1024 * 1024
+            args = args[2:]
+        elif args[0] == "--engine" and len(args) >= 2 and args[1] in engine_names():
+            engine = args[1]
+            args = args[2:]
+        elif args[0] == "--max-pages" and len(args) >= 2 and args[1].isdigit() and int(args[1]) > 0:
+            max_pages = int(args[1])
+            args = args[2:]
+        elif args[0] == "--sections" and len(args) >= 2:
+            sections = [name.strip() for name in args[1].split(",") if name.strip()]
+            args = args[2:]
+        elif args[0] == "--fields" and len(args) >= 2:
+            fields = [name.strip() for name in args[1].split(",") if name.strip()]
+            args = args[2:]
+        elif args[0] == "--profile":
+            profile = True
+            args = args[1:]
+        elif args[0] == "--serve":
+            args = args[1:]
+        else:
+            print(
+                _dumps({"error": "Usage: parse_worker.py [--pdftotext PATH] [--use-corpus-headers] [--stage1-cache DB [--stage1-cache-max-mb N]] [--engine pdftotext|pymupdf] [--max-pages N] [--sections a,b] [--fields a,b] [--profile] [--type pdf_resume|docx_form_pdf|auto]"}),
+                file=sys.stderr,
+            )
+            sys.exit(1)
+    # Windows 콘솔/파이프에서도 UTF-8로 주고받음
+    for stream in (sys.stdin, sys.stdout):
+        try:
+            stream.reconfigure(encoding="utf-8")
+        except Exception:
+            pass
+    stage1_cache = None
+    if stage1_cache_db:
+        from stage1_cache import DEFAULT_MAX_BYTES, get_shared_cache
+
+        stage1_cache = get_shared_cache(stage1_cache_db, stage1_cache_max_bytes or DEFAULT_MAX_BYTES)
+    serve(
+        sys.stdin, sys.stdout, default_type, pdftotext_exe, use_corpus_headers, stage1_cache, engine, max_pages, sections,
+        profile, fields,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDF 이력서 형식 라우터: 1단계(PDF → 텍스트)를 한 번만 실행하고, 텍스트로 형식을 판별해 맞는 2단계 파서로 보냅니다.
+
+Electron이 미리 자체 폼(parse_docx_form_pdf.py)인지 사람인 PDF(parse_pdf_resume.py)인지 정하지 않아도 되도록,
+추출 결과를 등록된 형식마다 detect(text)로 점수(0~1) 매겨 가장 높은 형식의 parse 를 호출합니다.
+  docx_form_pdf : 자체 폼 고정 헤더(parse_docx_form_pdf.SECTION_MARKERS, ▣ 기본 인적사항 등) 중 나온 비율
+  pdf_resume    : 사람인 섹션 헤더(SECTION_HEADERS + common_headers.json)가 줄 맨 앞에 나온 비율
+어느 형식도 MIN_FORMAT_SCORE 에 못 미치면 DEFAULT_FORMAT 으로 파싱하고 "formatFallback": true 를 붙입니다.
+
+형식 추가: register_format(이름, detect(text) -> float, parse(text, engine, use_corpus_headers, profiler) -> dict,
+           fingerprint(use_corpus_headers) -> str, save_photo(doc, photo_dir) -> 파일명|None = None)
+detect 는 이미 추출된 텍스트만 보므로 형식이 늘어도 추출 비용은 그대로입니다 (pdftotext 1회).
+1단계 캐시 키(stage1_cache.stage1_key)와 2단계 결과 캐시(형식 이름 + fingerprint)는 각 파서를 직접 부를 때와 같아서 공유됩니다.
+
+결과: {"format": 이름, "formatScores": {이름: 점수}, "data": 해당 파서 결과} (+ "formatFallback", "profilePhotoFilename", "_timings")
+
+사용법:
+    python3 scripts/pdf_format_router.py [--pdftotext PATH] [--engine pdftotext|pymupdf] [--use-corpus-headers] [--photo-dir DIR] [--stage1-cache DB [--stage1-cache-max-mb N]] [--profile] <pdf_path>
+    python3 scripts/pdf_format_router.py --text <txt>   # 이미 추출된 텍스트(*.stage1_raw.txt / *_pdftotext.txt 등)로 판별·파싱
+    python3 scripts/pdf_format_router.py [--pdftotext PATH] [--stage1-cache DB [--stage1-cache-max-mb N]] --serve      # 상주 워커 (parse_worker.py --type auto)
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Callable, Optional
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import parse_docx_form_pdf  # noqa: E402
+import parse_pdf_resume  # noqa: E402
+from pdf_preflight import error_fields  # noqa: E402
+from pdf_text_engines import DEFAULT_ENGINE, engine_names  # noqa: E402
+from stage_profile import NULL_PROFILER, PHOTO, STAGE1, dumps_profiled, get_profiler  # noqa: E402
+
+# 어느 형식도 이 점수에 못 미치면 DEFAULT_FORMAT 으로 파싱 (기존 Electron 기본값과 같은 사람인 파서)
+MIN_FORMAT_SCORE = 0.3
+DEFAULT_FORMAT = "pdf_resume"
+
+_FORMATS: dict[str, tuple[Callable[[str], float], Callable[..., dict], Callable[[bool], str]]] = {}
+_PHOTO_SAVERS: dict[str, Callable[..., Optional[str]]] = {}
+
+
+def register_format(
+    name: str,
+    detect: Callable[[str], float],
+    parse: Callable[..., dict],
+    fingerprint: Callable[[bool], str],
+    save_photo: Optional[Callable[..., Optional[str]]] = None,
+) -> None:
+    """형식 등록. detect(text) -> 0~1 점수, parse(text, engine, use_corpus_headers, profiler) -> 결과 dict,
+    fingerprint(use_corpus_headers) -> 2단계 결과 캐시용 문자열, save_photo(doc, photo_dir) -> 저장한 파일명 (선택).
+    name 은 2단계 결과 캐시의 parser 이름으로도 쓰이므로 같은 파서를 직접 부를 때와 같게 둘 것.
+    점수가 같으면 먼저 등록된 형식이 이김."""
+    _FORMATS[name] = (detect, parse, fingerprint)
+    if save_photo is not None:
+        _PHOTO_SAVERS[name] = save_photo
+
+
+def format_names() -> list[str]:
+    return list(_FORMATS)
+
+
+def _line_heads(text: str) -> str:
+    """줄마다 앞뒤 공백을 떼고 '\\n' 으로 이은 문자열 (앞에도 '\\n'). '\\n' + 헤더 in 결과 == 헤더로 시작하는 줄이 있음."""
+    return "\n" + "\n".join(line.strip() for line in text.split("\n"))
+
+
+def detect_format(text: str) -> tuple[str, dict[str, float], bool]:
+    """등록된 형식마다 점수를 매겨 (형식 이름, {이름: 점수}, fallback 여부) 반환."""
+    scores = {name: round(float(detect(text)), 3) for name, (detect, _, _) in _FORMATS.items()}
+    best = max(scores, key=scores.get) if scores else DEFAULT_FORMAT
+    if not scores or scores[best] < MIN_FORMAT_SCORE:
+        return (DEFAULT_FORMAT, scores, True)
+    return (best, scores, False)
+
+
+def parse_any_pdf_text(
+    text: str,
+    engine: str = DEFAULT_ENGINE,
+    use_corpus_headers: bool = False,
+    profiler=None,
+    cache=None,
+    cache_key: Optional[tuple[str, str]] = None,
+) -> dict:
+    """1단계 텍스트로 형식을 판별하고 해당 파서로 파싱. cache(stage1_cache.Stage1Cache)와 cache_key(stage1_key 결과)가
+    있으면 판별된 형식의 fingerprint가 같은 2단계 결과를 그대로 씀 (각 파서를 직접 부를 때와 같은 캐시 항목)."""
+    profiler = profiler or NULL_PROFILER
+    with profiler.stage("formatDetect"):
+        name, scores, fallback = detect_format(text)
+    _, parse, fingerprint = _FORMATS[name]
+    data = None
+    if cache is not None and cache_key is not None:
+        with profiler.stage("cacheLookup"):
+            stage2_key = fingerprint(use_corpus_headers)
+            data = cache.get_result(*cache_key, name, stage2_key)
+        if data is not None:
+            profiler.count("stage2CacheHit", 1)
+    if data is None:
+        data = parse(text, engine, use_corpus_headers, profiler)
+        if cache is not None and cache_key is not None:
+            with profiler.stage("cacheStore"):
+                cache.put_result(*cache_key, name, stage2_key, data)
+    out = {"format": name, "formatScores": scores, "data": data}
+    if fallback:
+        out["formatFallback"] = True
+    return out
+
+
+def parse_any_pdf(
+    pdf_path: str,
+    pdftotext_exe: Optional[str] = None,
+    stage1_cache=None,
+    engine: str = DEFAULT_ENGINE,
+    use_corpus_headers: bool = False,
+    photo_dir: Optional[str] = None,
+    profile: bool = False,
+) -> dict:
+    """PDF 한 개를 1단계 1회 추출 → 형식 판별 → 해당 파서로 파싱. 결과 형태는 모듈 설명 참고.
+    stage1_cache 가 있으면 같은 내용의 PDF는 추출을 건너뜀. photo_dir 가 있고 판별된 형식에 save_photo 가 있으면
+    증명사진을 저장해 "profilePhotoFilename" 을 붙임. profile=True 이면 "_timings" (캐시에는 저장하지 않음)."""
+    profiler = get_profiler(profile)
+    cache_key = None
+    if stage1_cache is not None:
+        from stage1_cache import stage1_key
+
+        with profiler.stage("cacheLookup"):
+            cache_key = stage1_key(pdf_path, pdftotext_exe, engine)
+    # PDF는 한 번만 열어 (pymupdf 엔진·증명사진이 필요할 때만) 추출과 사진에 함께 사용
+    doc = None
+    try:
+        with profiler.stage("pdfOpen"):
+            if photo_dir or engine == "pymupdf":
+                doc = parse_pdf_resume._open_pdf_document(pdf_path)
+        with profiler.stage(STAGE1):
+            text, engine = parse_pdf_resume.extract_text_with_layout(
+                pdf_path, pdftotext_exe, stage1_cache, cache_key, engine, doc
+            )
+        out = parse_any_pdf_text(text, engine, use_corpus_headers, profiler, stage1_cache, cache_key)
+        save_photo = _PHOTO_SAVERS.get(out["format"])
+        if photo_dir and doc is not None and save_photo is not None:
+            with profiler.stage(PHOTO):
+                profile_filename = save_photo(doc, photo_dir)
+            if profile_filename:
+                out["profilePhotoFilename"] = profile_filename
+    finally:
+        if doc is not None:
+            doc.close()
+    if profiler.enabled:
+        out["_timings"] = profiler.to_dict()
+    return out
+
+
+# --- 기본 형식: 자체 폼 (DOCX 양식 PDF) ---
+def detect_docx_form_pdf(text: str) -> float:
+    """SECTION_MARKERS(▣ 기본 인적사항, ▣ 학력사항, 자 기 소 개 서 …) 중 텍스트에 나온 비율."""
+    markers = parse_docx_form_pdf.SECTION_MARKERS
+    return sum(1 for marker in markers if marker in text) / len(markers)
+
+
+def _parse_docx_form_pdf(text: str, engine: str, use_corpus_headers: bool, profiler) -> dict:
+    return parse_docx_form_pdf.parse_docx_form_pdf_text(text, profiler)
+
+
+# --- 기본 형식: 사람인 PDF ---
+def _saramin_headers() -> list[str]:
+    """사람인 섹션 헤더: SECTION_HEADERS + common_headers.json section_headers (중복 제거, 앞뒤 공백 제거)."""
+    headers = [h.strip() for h in parse_pdf_resume.SECTION_HEADERS]
+    for h in parse_pdf_resume.load_section_headers_from_corpus() or ():
+        text = h.get("text") if isinstance(h, dict) else h
+        if isinstance(text, str):
+            headers.append(text.strip())
+    return [h for h in dict.fromkeys(headers) if h]
+
+
+def detect_pdf_resume(text: str) -> float:
+    """사람인 섹션 헤더 중 어떤 줄의 맨 앞(들여쓰기 제외)에 나온 것의 비율."""
+    headers = _saramin_headers()
+    heads = _line_heads(text)
+    return sum(1 for h in headers if "\n" + h in heads) / len(headers)
+
+
+def _parse_pdf_resume(text: str, engine: str, use_corpus_headers: bool, profiler) -> dict:
+    return parse_pdf_resume.parse_pdf_resume_text(text, engine, use_corpus_headers, profiler=profiler)
+
+
+def _save_pdf_resume_photo(doc, photo_dir: str) -> Optional[str]:
+    _, photo_xrefs = parse_pdf_resume._scan_pdf_pages(doc)
+    return parse_pdf_resume._save_profile_image(doc, photo_xrefs, photo_dir)
+
+
+register_format(
+    "docx_form_pdf",
+    detect_docx_form_pdf,
+    _parse_docx_form_pdf,
+    lambda use_corpus_headers: parse_docx_form_pdf.stage2_fingerprint(),
+)
+register_format(
+    "pdf_resume", detect_pdf_resume, _parse_pdf_resume, parse_pdf_resume.stage2_fingerprint, _save_pdf_resume_photo
+)
+
+
+def main():
+    args = sys.argv[1:]
+    pdftotext_exe = None
+    engine = DEFAULT_ENGINE
+    use_corpus_headers = False
+    photo_dir = None
+    stage1_cache_db = None
+    stage1_cache_max_bytes = None
+    text_path = None
+    serve = False
+    profile = False
+    while args:
+        if args[0] == "--pdftotext" and len(args) >= 2:
+            pdftotext_exe = args[1]
+            args = args[2:]
+        elif args[0] == "--engine" and len(args) >= 2 and args[1] in engine_names():
+            engine = args[1]
+            args = args[2:]
+        elif args[0] == "--use-corpus-headers":
+            use_corpus_headers = True
+            args = args[1:]
+        elif args[0] == "--photo-dir" and len(args) >= 2:
+            photo_dir = args[1]
+            args = args[2:]
+        elif args[0] == "--stage1-cache" and len(args) >= 2:
+            stage1_cache_db = args[1]
+            args = args[2:]
+        elif args[0] == "--stage1-cache-max-mb" and len(args) >= 2 and args[1].isdigit():
+            stage1_cache_max_bytes = int(args[1]) * 1024 * 1024
+            args = args[2:]
+        elif args[0] == "--text" and len(args) >= 2:
+            text_path = args[1]
+            args = args[2:]
+        elif args[0] == "--serve":
+            serve = True
+            args = args[1:]
+        elif args[0] == "--profile":
+            profile = True
+            args = args[1:]
+        else:
+            break
+    if serve:
+        # 상주 워커 모드: 요청 type 생략 시 auto (parse_worker.py 참고)
+        from parse_worker import main as worker_main
+        sys.argv = [sys.argv[0], "--type", "auto", "--engine", engine]
+        if pdftotext_exe:
+            sys.argv += ["--pdftotext", pdftotext_exe]
+        if use_corpus_headers:
+            sys.argv.append("--use-corpus-headers")
+        if stage1_cache_db:
+            sys.argv += ["--stage1-cache", stage1_cache_db]
+        if stage1_cache_max_bytes:
+            sys.argv += ["--stage1-cache-max-mb", str(stage1_cache_max_bytes // (1024 * 1024))]
+        if profile:
+            sys.argv.append("--profile")
+        worker_main()
+        return
+    if len(args) != (0 if text_path else 1):
+        print(
+            json.dumps(
+                {"error": "Usage: pdf_format_router.py [--pdftotext PATH] [--engine pdftotext|pymupdf] [--use-corpus-headers] [--photo-dir DIR] [--stage1-cache DB [--stage1-cache-max-mb N]] [--profile] [--serve] [--text <txt>] <pdf_path>"},
+                ensure_ascii=False,
+            )
+        )
+        sys.exit(1)
+    target = text_path or args[0]
+    if not Path(target).exists():
+        print(json.dumps({"error": f"File not found: {target}"}, ensure_ascii=False))
+        sys.exit(1)
+    try:
+        if text_path:
+            from stage1_cache import read_stage1_text
+
+            profiler = get_profiler(profile)
+            with profiler.stage(STAGE1):
+                text, text_engine, _ = read_stage1_text(text_path)
+            data = parse_any_pdf_text(text, text_engine, use_corpus_headers, profiler)
+            if profiler.enabled:
+                data["_timings"] = profiler.to_dict()
+        else:
+            cache = None
+            if stage1_cache_db:
+                from stage1_cache import DEFAULT_MAX_BYTES, get_shared_cache
+
+                cache = get_shared_cache(stage1_cache_db, stage1_cache_max_bytes or DEFAULT_MAX_BYTES)
+            data = parse_any_pdf(args[0], pdftotext_exe, cache, engine, use_corpus_headers, photo_dir, profile)
+        print(dumps_profiled(data, data.get("_timings"), ensure_ascii=False, indent=2))
+    except Exception as e:
+        import traceback
+        tb = traceback.format_exc()
+        print(json.dumps({**error_fields(e), "traceback": tb}, ensure_ascii=False, indent=2))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
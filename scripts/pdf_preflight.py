@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pdftotext 를 띄우기 전 PDF 사전 검사 (순수 Python, 파일 앞뒤 몇십 KB만 읽음) + 크기 비례 제한 시간 + 프로세스 그룹 종료.
+
+깨진 PDF(PDF가 아닌 파일, 페이지 0개)는 pdftotext 가 복구를 시도하다 제한 시간(30초)을 다 쓰고 실패하므로,
+  - %PDF 헤더 (앞 1KB 안), 페이지 트리 (/Type /Pages 객체의 /Count 중 최대)
+를 먼저 보고 바로 PdfPreflightError(code=...) 를 냅니다. 추측으로는 실패시키지 않습니다:
+  - 압축 안 된 페이지 트리를 못 찾거나(객체 스트림 안에 있는 경우 등) 객체 스트림이 있으면 pages=None 으로 두고 poppler 에 맡김
+  - startxref / %%EOF 가 끝 TAIL_BYTES 안에 없으면(잘린 파일) poppler 가 복구할 수 있으므로 truncated=True 로 표시만 함
+  - /Encrypt 는 소유자 암호만 걸린(인쇄 제한 등) PDF도 pdftotext 로 잘 읽히므로 encrypted=True 로 표시만 함
+표시만 한 항목은 pdftotext 가 실패했을 때 오류 코드를 encrypted / truncated 로 바꾸는 데 씁니다 (failure_code).
+pdftotext 제한 시간은 페이지 수·파일 크기로 정하고(pdftotext_timeout), 시간을 넘기면 새 세션(프로세스 그룹)째 종료합니다.
+
+오류 코드 (PDF_ERROR_CODES): not_found, empty, not_pdf, truncated, zero_pages, encrypted, timeout, failed
+
+사용법:
+    python3 scripts/pdf_preflight.py <pdf_path> ...      # 파일별 {path, ok, info, timeoutSec} / {path, ok, error, errorCode}
+"""
+
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+from typing import Optional
+
+PDF_ERROR_CODES = ("not_found", "empty", "not_pdf", "truncated", "zero_pages", "encrypted", "timeout", "failed")
+# 헤더는 앞 1KB 안 어디든 허용 (PDF 명세 구현 노트와 poppler 동작)
+HEAD_BYTES = 1024
+# startxref / %%EOF / trailer 를 찾는 끝부분 크기. /Count, /Encrypt 는 앞뒤 SCAN_BYTES 에서 찾음
+TAIL_BYTES = 4096
+SCAN_BYTES = 64 * 1024
+
+# pdftotext 제한 시간 = 기본 + 페이지당 + MB당, [MIN, MAX] 로 자름. 페이지 수를 모르면 크기만 반영
+TIMEOUT_BASE_SEC = 10.0
+TIMEOUT_PER_PAGE_SEC = 0.5
+TIMEOUT_PER_MB_SEC = 2.0
+TIMEOUT_MIN_SEC = 10.0
+TIMEOUT_MAX_SEC = 120.0
+
+# 압축 안 된 간접 객체 본문. 검사 창 경계에서 잘린 객체는 endobj 가 없어 건너뜀
+_OBJECT = re.compile(rb"\d+\s+\d+\s+obj\b(.*?)\bendobj", re.S)
+_PAGES_TYPE = re.compile(rb"/Type\s*/Pages(?![A-Za-z])")
+_COUNT = re.compile(rb"/Count\s+(\d+)")
+_OBJSTM = re.compile(rb"/Type\s*/ObjStm(?![A-Za-z])")
+_ENCRYPT = re.compile(rb"/Encrypt\s*(?:\d+\s+\d+\s+R|<<)")
+
+
+class PdfPreflightError(RuntimeError):
+    """사전 검사·pdftotext 실패. code 는 PDF_ERROR_CODES 중 하나 (기존 except RuntimeError 처리와 호환)."""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def error_fields(e: Exception) -> dict:
+    """오류 출력용 {"error", "errorCode"?} (PdfPreflightError 일 때만 errorCode)."""
+    if isinstance(e, PdfPreflightError):
+        return {"error": str(e), "errorCode": e.code}
+    return {"error": str(e)}
+
+
+def _page_tree_count(data: bytes) -> Optional[int]:
+    """data 안의 압축 안 된 /Type /Pages 객체들의 /Count 중 최대 (루트 페이지 트리). 못 찾으면 None.
+    /Outlines 등 다른 객체의 /Count 는 보지 않음."""
+    counts = []
+    for m in _OBJECT.finditer(data):
+        body = m.group(1)
+        if _PAGES_TYPE.search(body):
+            count = _COUNT.search(body)
+            if count:
+                counts.append(int(count.group(1)))
+    return max(counts) if counts else None
+
+
+def preflight(pdf_path: str) -> dict:
+    """PDF 사전 검사. 통과하면 {size, pages(페이지 트리 /Count, 모르면 None), encrypted, truncated},
+    아니면 PdfPreflightError (not_found, empty, not_pdf, 확실할 때만 zero_pages)."""
+    try:
+        size = os.path.getsize(pdf_path)
+    except OSError:
+        raise PdfPreflightError("not_found", f"File not found: {pdf_path}")
+    if size == 0:
+        raise PdfPreflightError("empty", f"PDF 파일이 비어 있습니다: {pdf_path}")
+    with open(pdf_path, "rb") as f:
+        head = f.read(min(size, SCAN_BYTES))
+        if size > SCAN_BYTES:
+            f.seek(max(SCAN_BYTES, size - SCAN_BYTES))
+            tail = f.read()
+        else:
+            tail = head
+    if b"%PDF-" not in head[:HEAD_BYTES]:
+        raise PdfPreflightError("not_pdf", f"PDF 헤더(%PDF-)가 없습니다: {pdf_path}")
+    end = (tail if tail is head else head + tail)[-TAIL_BYTES:]
+    truncated = b"startxref" not in end or b"%%EOF" not in end
+    scanned = (head,) if tail is head else (head, tail)
+    counts = [c for c in (_page_tree_count(data) for data in scanned) if c is not None]
+    pages = max(counts) if counts else None
+    if any(_OBJSTM.search(data) for data in scanned):
+        # 증분 업데이트로 페이지 트리가 객체 스트림 안에 다시 정의됐을 수 있음 → 개수를 믿지 않음
+        pages = None
+    if pages == 0 and not truncated:
+        raise PdfPreflightError("zero_pages", f"PDF 페이지가 없습니다 (/Type /Pages /Count 0): {pdf_path}")
+    encrypted = bool(_ENCRYPT.search(end) or _ENCRYPT.search(head))
+    return {"size": size, "pages": pages or None, "encrypted": encrypted, "truncated": truncated}
+
+
+def failure_code(info: dict) -> str:
+    """pdftotext 가 실패했을 때의 오류 코드: 사전 검사에서 표시한 encrypted / truncated, 아니면 failed."""
+    if info.get("encrypted"):
+        return "encrypted"
+    if info.get("truncated"):
+        return "truncated"
+    return "failed"
+
+
+def pdftotext_timeout(info: Optional[dict], pages: Optional[int] = None) -> float:
+    """사전 검사 결과로 pdftotext 제한 시간(초). pages 를 주면(-f/-l 창) 그 페이지 수 기준."""
+    if not info:
+        return TIMEOUT_MAX_SEC
+    pages = pages if pages is not None else info.get("pages")
+    seconds = TIMEOUT_BASE_SEC + TIMEOUT_PER_MB_SEC * info["size"] / (1024 * 1024)
+    if pages:
+        seconds += TIMEOUT_PER_PAGE_SEC * pages
+    return round(min(TIMEOUT_MAX_SEC, max(TIMEOUT_MIN_SEC, seconds)), 1)
+
+
+def kill_group(proc) -> None:
+    """proc(subprocess.Popen 또는 asyncio Process)와 그 자식까지 종료 (POSIX: 새 세션의 프로세스 그룹, Windows: taskkill /T)."""
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True)
+    except (OSError, subprocess.SubprocessError):
+        pass
+    try:
+        proc.kill()
+    except OSError:
+        pass
+
+
+def run_group(cmd: list[str], timeout: float) -> tuple[int, str, str]:
+    """cmd 를 새 프로세스 그룹으로 실행해 (returncode, stdout, stderr) (UTF-8, 오류 글자는 대체).
+    timeout 을 넘기면 그룹째 종료하고 PdfPreflightError("timeout")."""
+    kwargs = {"start_new_session": True} if os.name == "posix" else {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding="utf-8", errors="replace", **kwargs
+    )
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        kill_group(proc)
+        proc.communicate()
+        raise PdfPreflightError("timeout", f"{os.path.basename(cmd[0])} timed out after {timeout}s")
+    return proc.returncode, stdout or "", stderr or ""
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(json.dumps({"error": "Usage: pdf_preflight.py <pdf_path> ..."}), file=sys.stderr)
+        sys.exit(1)
+    failed = False
+    for path in args:
+        try:
+            info = preflight(path)
+            record = {"path": path, "ok": True, "info": info, "timeoutSec": pdftotext_timeout(info)}
+        except PdfPreflightError as e:
+            failed = True
+            record = {"path": path, "ok": False, **error_fields(e)}
+        print(json.dumps(record, ensure_ascii=False))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+1단계(PDF → 텍스트) 추출 엔진 모음. parse_pdf_resume.extract_text_with_layout()이 이름으로 골라 씁니다.
+
+  pdftotext : poppler `pdftotext -layout` 서브프로세스 (기본, 사람인 PDF 기준으로 검증된 엔진)
+  pymupdf   : PyMuPDF(fitz)로 프로세스 안에서 추출. 단어 좌표로 -layout 과 같은 형태(열 맞춤 공백,
+              세로 간격만큼 빈 줄, 페이지 끝 \\f)를 다시 만들어 2단계 파서를 그대로 쓸 수 있게 함.
+
+엔진 추가: register_engine(이름, extract(pdf_path, pdftotext_exe, doc=None) -> str, version(pdftotext_exe) -> str)
+doc 은 호출 쪽에서 이미 연 PyMuPDF 문서 (증명사진·페이지 메타와 한 번만 열어 공유). 인프로세스 엔진만 사용합니다.
+iter_pages(pdf_path, pdftotext_exe, doc=None) 를 함께 등록하면 iter_page_texts()가 페이지 단위로 꺼내 씁니다
+(페이지마다 \\f 로 끝나는 문자열, 이어 붙이면 extract 결과와 같아야 함). 없으면 전체 텍스트를 한 번에 돌려줌.
+version 문자열은 1단계 캐시 키(stage1_cache)에 들어가므로 출력이 바뀌면 함께 바뀌어야 합니다.
+
+사용법:
+    python3 scripts/pdf_text_engines.py [--engine pdftotext|pymupdf] [--pdftotext PATH] <pdf_path>   # 추출 결과 출력
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from pdf_preflight import PdfPreflightError, failure_code, pdftotext_timeout, preflight, run_group  # noqa: E402
+
+DEFAULT_ENGINE = "pdftotext"
+
+# pymupdf 레이아웃 재구성 규칙을 바꾸면 올릴 것 (캐시 키에 포함)
+PYMUPDF_LAYOUT_VERSION = 1
+# pdftotext 페이지 단위 추출 시 서브프로세스 1회에 읽는 페이지 수 (-f/-l 창 크기)
+PDFTOTEXT_PAGE_WINDOW = 2
+# 문서 끝을 지난 -f/-l 창에 poppler 가 내는 오류 ("Wrong page range given: the first page (3) can not be ...")
+PDFTOTEXT_WRONG_PAGE_RANGE = "Wrong page range"
+
+_ENGINES: dict[str, tuple[Callable[..., str], Callable[[Optional[str]], str]]] = {}
+_PAGE_ITERATORS: dict[str, Callable[..., Iterator[str]]] = {}
+_PDFTOTEXT_VERSION_CACHE: dict[str, str] = {}
+
+
+def register_engine(
+    name: str,
+    extract: Callable[..., str],
+    version: Callable[[Optional[str]], str],
+    iter_pages: Optional[Callable[..., Iterator[str]]] = None,
+) -> None:
+    """추출 엔진 등록. extract(pdf_path, pdftotext_exe, doc=None) -> 텍스트, version(pdftotext_exe) -> 버전 문자열,
+    iter_pages(pdf_path, pdftotext_exe, doc=None) -> 페이지 텍스트 반복자 (선택)."""
+    _ENGINES[name] = (extract, version)
+    if iter_pages is not None:
+        _PAGE_ITERATORS[name] = iter_pages
+
+
+def engine_names() -> list[str]:
+    return list(_ENGINES)
+
+
+def _get_engine(name: str):
+    engine = _ENGINES.get(name)
+    if engine is None:
+        raise ValueError(f"Unknown extraction engine: {name} (expected one of {', '.join(_ENGINES)})")
+    return engine
+
+
+def engine_id(name: str = DEFAULT_ENGINE, pdftotext_exe: Optional[str] = None) -> str:
+    """캐시 키용 엔진 식별자 (예: 'pdftotext 24.02.0', 'pymupdf 1.24.0 layout1')."""
+    return f"{name} {_get_engine(name)[1](pdftotext_exe)}"
+
+
+def extract_text(pdf_path: str, engine: str = DEFAULT_ENGINE, pdftotext_exe: Optional[str] = None, doc=None) -> str:
+    """engine 이름으로 PDF 텍스트 추출. doc(이미 연 PyMuPDF 문서)이 있으면 인프로세스 엔진은 다시 열지 않음."""
+    return _get_engine(engine)[0](pdf_path, pdftotext_exe, doc)
+
+
+def iter_page_texts(
+    pdf_path: str, engine: str = DEFAULT_ENGINE, pdftotext_exe: Optional[str] = None, doc=None
+) -> Iterator[str]:
+    """페이지 텍스트를 앞에서부터 하나씩 (각각 \\f 로 끝남). 소비를 멈추면 남은 페이지는 추출하지 않음."""
+    iter_pages = _PAGE_ITERATORS.get(engine)
+    if iter_pages is None:
+        yield extract_text(pdf_path, engine, pdftotext_exe, doc)
+        return
+    yield from iter_pages(pdf_path, pdftotext_exe, doc)
+
+
+def known_page_count(pdf_path: str, engine: str = DEFAULT_ENGINE, doc=None) -> Optional[int]:
+    """iter_page_texts 가 멈출 기준으로 쓰는 페이지 수: doc 의 페이지 수, pdftotext 는 사전 검사의 페이지 트리 /Count.
+    모르면 None (끝까지 읽었는지 확인할 수 없으므로 호출 쪽은 결과를 전체 텍스트로 캐시하지 않음)."""
+    if doc is not None:
+        return doc.page_count
+    if engine == "pdftotext":
+        try:
+            return preflight(pdf_path)["pages"]
+        except PdfPreflightError:
+            return None
+    return None
+
+
+# --- pdftotext (poppler 서브프로세스) ---
+def _run_pdftotext(
+    pdf_path: str, pdftotext_exe: Optional[str] = None, page_args: tuple = (), info: Optional[dict] = None,
+    pages: Optional[int] = None,
+) -> str:
+    """pdftotext -layout 실행. info(pdf_preflight.preflight 결과)가 없으면 먼저 사전 검사해 깨진 PDF는 바로 실패.
+    제한 시간은 페이지 수(pages: -f/-l 창 크기)·파일 크기로 정하고, 넘기면 프로세스 그룹째 종료.
+    실패는 PdfPreflightError(RuntimeError, code=not_pdf|truncated|…|encrypted|timeout|failed)."""
+    if info is None:
+        info = preflight(pdf_path)
+    cmd = [pdftotext_exe or "pdftotext", "-layout", "-enc", "UTF-8", *page_args, pdf_path, "-"]
+    returncode, stdout, stderr = run_group(cmd, pdftotext_timeout(info, pages))
+    if returncode != 0:
+        # /Encrypt·잘린 끝부분은 읽기에 실패했을 때만 원인으로 봄 (소유자 암호만 있거나 poppler 가 복구하면 정상 추출됨)
+        raise PdfPreflightError(failure_code(info), f"pdftotext failed: {stderr or stdout}")
+    return stdout
+
+
+def extract_with_pdftotext(pdf_path: str, pdftotext_exe: Optional[str] = None, doc=None) -> str:
+    """pdftotext -layout 로 텍스트 추출 (poppler 필요). pdftotext_exe가 있으면 해당 실행 파일 사용. doc은 미사용."""
+    return _run_pdftotext(pdf_path, pdftotext_exe)
+
+
+def iter_pages_pdftotext(pdf_path: str, pdftotext_exe: Optional[str] = None, doc=None) -> Iterator[str]:
+    """pdftotext -f/-l 로 PDFTOTEXT_PAGE_WINDOW 페이지씩 추출해 페이지 단위로 돌려줌.
+    페이지 수는 doc(PyMuPDF 문서), 없으면 사전 검사의 페이지 트리 /Count 로 알고 멈춤. 둘 다 모르면 창이 덜 차거나
+    poppler 가 범위 밖 오류(PDFTOTEXT_WRONG_PAGE_RANGE)를 낼 때만 끝으로 보고, 다른 실패는 그대로 예외."""
+    info = preflight(pdf_path)  # 창마다 다시 검사하지 않음
+    page_count = doc.page_count if doc is not None else info["pages"]
+    first = 1
+    while page_count is None or first <= page_count:
+        last = first + PDFTOTEXT_PAGE_WINDOW - 1
+        if page_count is not None:
+            last = min(last, page_count)
+        try:
+            chunk = _run_pdftotext(pdf_path, pdftotext_exe, ("-f", str(first), "-l", str(last)), info, last - first + 1)
+        except PdfPreflightError as e:
+            if first > 1 and e.code != "timeout" and PDFTOTEXT_WRONG_PAGE_RANGE in str(e):
+                return  # 마지막 페이지 다음 창
+            raise
+        pages = chunk.split("\f")
+        for page_text in pages[:-1]:
+            yield page_text + "\f"
+        if pages[-1]:
+            yield pages[-1]  # \f 없이 끝난 마지막 페이지
+            return
+        if len(pages) - 1 < last - first + 1:
+            return
+        first = last + 1
+
+
+def pdftotext_version(pdftotext_exe: Optional[str] = None) -> str:
+    """`pdftotext -v` 첫 줄의 버전 문자열 (프로세스당 실행 파일별 1회만 실행). 알 수 없으면 'unknown'."""
+    exe = pdftotext_exe or "pdftotext"
+    if exe in _PDFTOTEXT_VERSION_CACHE:
+        return _PDFTOTEXT_VERSION_CACHE[exe]
+    version = "unknown"
+    try:
+        result = subprocess.run(
+            [exe, "-v"], capture_output=True, text=True, encoding="utf-8", errors="replace", timeout=10
+        )
+        for line in (result.stderr or result.stdout or "").splitlines():
+            if "version" in line.lower():
+                version = line.strip().split()[-1]
+                break
+    except Exception:
+        pass
+    _PDFTOTEXT_VERSION_CACHE[exe] = version
+    return version
+
+
+# --- PyMuPDF (인프로세스) ---
+def import_fitz():
+    """PyMuPDF 모듈. 1.24.3+ 는 pymupdf 이름으로 import (`import fitz`는 stdout에 사용 중단 경고를 찍어 JSON 출력을 깨뜨림).
+    설치돼 있지 않으면 ImportError."""
+    try:
+        import pymupdf
+    except ImportError:
+        import fitz as pymupdf
+    return pymupdf
+
+
+def layout_page_text(words: list) -> str:
+    """page.get_text("words") 결과 → pdftotext -layout 과 비슷한 페이지 텍스트.
+    - 세로 중심이 가까운 단어끼리 한 줄 (다단 표의 같은 행도 한 줄로 합침)
+    - 열 위치 = (x - 페이지 최소 x) / 평균 글자 폭, 앞 단어와는 최소 1칸 띄움
+    - 줄 사이 세로 간격이 기본 줄 간격의 n배면 빈 줄 n-1개"""
+    words = [w for w in words if w[4].strip()]
+    if not words:
+        return ""
+    char_w = statistics.median((w[2] - w[0]) / len(w[4]) for w in words) or 1.0
+    left = min(w[0] for w in words)
+
+    # (세로 중심, 높이, 단어 목록) 으로 줄 묶기
+    rows: list[list] = []
+    for w in sorted(words, key=lambda w: ((w[1] + w[3]) / 2, w[0])):
+        center = (w[1] + w[3]) / 2
+        height = w[3] - w[1]
+        if rows and abs(center - rows[-1][0]) <= max(height, rows[-1][1]) * 0.5:
+            rows[-1][2].append(w)
+        else:
+            rows.append([center, height, [w]])
+
+    # 기본 줄 간격: 글자 높이 이상 떨어진 인접 줄 간격 중 최솟값 (빈 줄이 많아 중앙값은 부풀려짐)
+    text_h = statistics.median(w[3] - w[1] for w in words) or 1.0
+    deltas = [b[0] - a[0] for a, b in zip(rows, rows[1:]) if b[0] - a[0] >= text_h]
+    pitch = min(deltas) if deltas else text_h * 1.2
+    out_lines = []
+    for k, (center, _, row_words) in enumerate(rows):
+        if k > 0:
+            gap_lines = round((center - rows[k - 1][0]) / pitch) - 1
+            out_lines.extend([""] * max(0, gap_lines))
+        line = ""
+        for w in sorted(row_words, key=lambda w: w[0]):
+            col = round((w[0] - left) / char_w)
+            if line:
+                col = max(col, len(line) + 1)
+            line += " " * (col - len(line)) + w[4]
+        out_lines.append(line)
+    return "\n".join(out_lines) + "\n"
+
+
+def extract_with_pymupdf(pdf_path: str, pdftotext_exe: Optional[str] = None, doc=None) -> str:
+    """PyMuPDF로 페이지별 레이아웃 텍스트를 만들어 pdftotext처럼 페이지마다 \\f 로 끝냄.
+    doc(이미 연 fitz.Document)을 넘기면 다시 열지 않음. pdftotext_exe는 인터페이스 맞춤용(미사용)."""
+    try:
+        fitz = import_fitz()
+    except ImportError:
+        raise RuntimeError("PyMuPDF가 필요합니다. 설치 방법: pip install -r requirements-pdf.txt")
+    owns_doc = doc is None
+    if owns_doc:
+        doc = fitz.open(pdf_path)
+    try:
+        return "".join(layout_page_text(page.get_text("words")) + "\f" for page in doc)
+    finally:
+        if owns_doc:
+            doc.close()
+
+
+def iter_pages_pymupdf(pdf_path: str, pdftotext_exe: Optional[str] = None, doc=None) -> Iterator[str]:
+    """extract_with_pymupdf 의 페이지 단위 버전 (읽은 페이지만 레이아웃 재구성)."""
+    try:
+        fitz = import_fitz()
+    except ImportError:
+        raise RuntimeError("PyMuPDF가 필요합니다. 설치 방법: pip install -r requirements-pdf.txt")
+    owns_doc = doc is None
+    if owns_doc:
+        doc = fitz.open(pdf_path)
+    try:
+        for page in doc:
+            yield layout_page_text(page.get_text("words")) + "\f"
+    finally:
+        if owns_doc:
+            doc.close()
+
+
+def pymupdf_version(pdftotext_exe: Optional[str] = None) -> str:
+    try:
+        fitz = import_fitz()
+    except ImportError:
+        return "unavailable"
+    return f"{fitz.VersionBind} layout{PYMUPDF_LAYOUT_VERSION}"
+
+
+register_engine("pdftotext", extract_with_pdftotext, pdftotext_version, iter_pages_pdftotext)
+register_engine("pymupdf", extract_with_pymupdf, pymupdf_version, iter_pages_pymupdf)
+
+
+def main():
+    args = sys.argv[1:]
+    engine = DEFAULT_ENGINE
+    pdftotext_exe = None
+    while args:
+        if args[0] == "--engine" and len(args) >= 2:
+            engine = args[1]
+            args = args[2:]
+        elif args[0] == "--pdftotext" and len(args) >= 2:
+            pdftotext_exe = args[1]
+            args = args[2:]
+        else:
+            break
+    if not args or engine not in _ENGINES:
+        print(json.dumps({"error": f"Usage: pdf_text_engines.py [--engine {'|'.join(_ENGINES)}] [--pdftotext PATH] <pdf_path>"}), file=sys.stderr)
+        sys.exit(1)
+    if not Path(args[0]).exists():
+        print(json.dumps({"error": f"File not found: {args[0]}"}), file=sys.stderr)
+        sys.exit(1)
+    sys.stdout.write(extract_text(args[0], engine, pdftotext_exe))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파서 정규식 복잡도 퍼즈 (catastrophic backtracking 검사).
+
+regex_registry 에 등록된 모든 패턴(parse_pdf_resume / parse_docx_form_pdf / layout_lines)에
+깨진 PDF 줄을 흉내 낸 긴 적대적 입력을 넣고, 길이를 GROWTH_FACTOR 배 늘렸을 때 시간이 얼마나 느는지 잽니다.
+입력은 패턴 안의 한글 리터럴·구분자(·, /, 2칸 공백 등)와 날짜 접두, '라벨 : 값' 접두를 반복해 만든 줄(family)이고,
+family마다 시간 증가 지수 k = log(t(큰 입력) / t(작은 입력)) / log(길이 배율) 를 계산해
+가장 나쁜 family를 패턴의 결과로 씁니다 (k≈1 선형, k≈2 이차, 그 이상은 역추적 폭발).
+호출 방식은 파서 코드에서 실제로 쓰는 메서드(P.이름.match / search / split / sub)를 AST로 찾아 그대로 씁니다.
+
+k 가 MAX_EXPONENT 를 넘고 큰 입력 시간이 MIN_MEASURABLE_MS 이상인 패턴이 있으면 exit 1.
+Electron 쪽 30s/60s 타임아웃 안에서 줄 하나가 시간을 다 쓰지 않도록, 패턴을 바꾼 뒤에는 check 와 함께 돌리세요.
+
+사용법:
+    python3 scripts/regex_complexity.py [--size N] [--max-exponent K] [--only 이름,이름]
+"""
+
+import ast
+import json
+import math
+import re
+import sys
+import time
+from pathlib import Path
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import regex_registry  # noqa: E402
+
+# 입력 길이(글자): MIN_SIZE 부터 GROWTH_FACTOR 배씩 DEFAULT_SIZE 까지 (한 줄 수천 자면 이미 깨진 PDF)
+MIN_SIZE = 128
+DEFAULT_SIZE = 8192
+GROWTH_FACTOR = 2
+# 선형 + 측정 여유. 선형 패턴도 이 길이대에서는 메모리 할당·캐시 때문에 k≈1.1~1.2 로 재지므로 1.0 에 딱 맞추지 않음.
+# 이차(k≈2)는 물론 n^1.5 같은 준이차 증가도 실패
+MAX_EXPONENT = 1.3
+# 마지막 길이에서도 이보다 빠르면 지수가 커도 무시 (타이머 해상도·캐시 잡음)
+MIN_MEASURABLE_MS = 1.0
+# 호출 한 번이 이 시간을 넘으면 더 긴 입력은 재지 않음
+CALL_BUDGET_MS = 50.0
+# 같은 입력 반복 측정 횟수 (최솟값 사용)
+TIMING_RUNS = 5
+# 지수는 마지막 길이와 이 횟수만큼 앞선 길이(GROWTH_FACTOR**EXPONENT_SPAN 배 차이)로 계산 (한 번 배율보다 잡음이 작음)
+EXPONENT_SPAN = 2
+
+# 반복 단위 (패턴에 없는 글자도 섞어 실패 경로를 타게 함)
+_BASE_ATOMS = ("a", " ", "a ", "a  ", "가 ", "가  ", "1", "1.", "1 ", "/", " /", "a/", "·", " · ", ".", "~", "@", "-", ":", "(", "\t", "a\n")
+# 날짜로 시작하는 줄 패턴이 본문까지 들어가도록 앞에 붙이는 접두
+_PREFIXES = ("", "2020.01 ", "2020.01  2020.02  ", "2020.01 ~ 2020.02 ", "2020.01 ~ 재직중 ")
+
+# 라벨 뒤 콜론·값 접두 ("병역 : 군필 aaaa…" 처럼 라벨을 지나 값 부분에서 역추적하는 경우). {}는 패턴의 한글 리터럴
+_LABEL_PREFIXES = ("{} : ", "{}: ", "{} : 값 ", "{} : 값  ")
+
+# 패턴 소스에서 한글 리터럴 뽑기 (반복 단위 후보)
+_HANGUL_LITERAL = re.compile(r"[가-힣]{2,}")
+
+
+def _pattern_methods() -> dict[tuple[str, str], set[str]]:
+    """(모듈 파일, 패턴 이름) → 파서 코드에서 쓰는 메서드 집합 (P.이름.메서드(...) 호출)."""
+    found: dict[tuple[str, str], set[str]] = {}
+    for module in regex_registry.CHECKED_MODULES:
+        tree = ast.parse((Path(_SCRIPTS_DIR) / module).read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Attribute)
+                and isinstance(node.func.value.value, ast.Name)
+                and node.func.value.value.id == "P"
+            ):
+                found.setdefault((module, node.func.value.attr), set()).add(node.func.attr)
+    return found
+
+
+def _families(pattern: str) -> list[tuple[str, str]]:
+    """(접두, 반복 단위) 목록. 반복 단위에는 패턴 안 한글 리터럴과 그 뒤 공백 변형도 넣고,
+    한글 리터럴마다 '라벨 : 값' 접두 + 기본 반복 단위 family 를 더함."""
+    atoms = list(_BASE_ATOMS)
+    words = list(dict.fromkeys(_HANGUL_LITERAL.findall(pattern)))
+    for word in words:
+        atoms += [word, word + " ", word + "  ", word + " a "]
+    families = [(prefix, atom) for prefix in _PREFIXES for atom in atoms]
+    for word in words:
+        families += [(label.format(word), atom) for label in _LABEL_PREFIXES for atom in _BASE_ATOMS]
+    return families
+
+
+def _make_line(prefix: str, atom: str, size: int) -> str:
+    return prefix + atom * max(1, (size - len(prefix)) // len(atom))
+
+
+def _call(compiled: re.Pattern, method: str):
+    if method in ("sub", "subn"):
+        return lambda s: getattr(compiled, method)("", s)
+    if method in ("match", "fullmatch", "search", "split", "findall"):
+        return getattr(compiled, method)
+    if method == "finditer":
+        return lambda s: list(compiled.finditer(s))
+    return compiled.search
+
+
+def _time_ms(fn, line: str) -> float:
+    """TIMING_RUNS회 중 최소 시간 (ms). 한 번에 CALL_BUDGET_MS를 넘으면 더 돌리지 않음."""
+    best = None
+    for _ in range(TIMING_RUNS):
+        t0 = time.perf_counter()
+        fn(line)
+        ms = (time.perf_counter() - t0) * 1000
+        best = ms if best is None else min(best, ms)
+        if ms >= CALL_BUDGET_MS:
+            break
+    return best
+
+
+def _measure_family(fn, prefix: str, atom: str, max_size: int) -> dict:
+    """길이를 MIN_SIZE부터 GROWTH_FACTOR배씩 늘리며 재고, 마지막 길이와 EXPONENT_SPAN 단계 앞 길이의 시간으로 지수 계산
+    (측정이 그보다 적으면 가장 짧은 길이와 비교). 한 번 호출이 CALL_BUDGET_MS를 넘으면 거기서 멈춤
+    (역추적 폭발 패턴도 측정 시간이 유한하도록)."""
+    size = MIN_SIZE
+    points = [(size, _time_ms(fn, _make_line(prefix, atom, size)))]
+    while points[-1][0] < max_size and points[-1][1] < CALL_BUDGET_MS:
+        size *= GROWTH_FACTOR
+        points.append((size, _time_ms(fn, _make_line(prefix, atom, size))))
+    cur = points[-1]
+    base = points[max(0, len(points) - 1 - EXPONENT_SPAN)]
+    exponent = 0.0
+    if base is not cur and base[1] > 0 and cur[1] > 0:
+        exponent = math.log(cur[1] / base[1], cur[0] / base[0])
+    return {"size": cur[0], "ms": round(cur[1], 4), "exponent": round(exponent, 2)}
+
+
+def measure_pattern(compiled: re.Pattern, methods: set[str], max_size: int, max_exponent: float = MAX_EXPONENT) -> dict:
+    """패턴 하나의 가장 나쁜 family: {method, prefix, atom, size, ms, exponent, failed}. 실패 family를 찾으면 바로 반환."""
+    worst = None
+    for method in sorted(methods or {"search"}):
+        fn = _call(compiled, method)
+        for prefix, atom in _families(compiled.pattern):
+            row = {"method": method, "prefix": prefix, "atom": atom}
+            row.update(_measure_family(fn, prefix, atom, max_size))
+            measurable = row["ms"] >= MIN_MEASURABLE_MS
+            if measurable and row["exponent"] > max_exponent:
+                # 잡음(GC·스케줄링)일 수 있으니 한 번 더 재서 둘 다 넘을 때만 실패
+                row.update(_measure_family(fn, prefix, atom, max_size))
+                row["failed"] = row["ms"] >= MIN_MEASURABLE_MS and row["exponent"] > max_exponent
+                if row["failed"]:
+                    return row
+            row["failed"] = False
+            # 측정 가능한 시간 중 지수가 가장 큰 것, 없으면 가장 느린 것
+            key = (measurable, row["exponent"] if measurable else row["ms"])
+            if worst is None or key > worst[0]:
+                worst = (key, row)
+    return worst[1]
+
+
+def run(size: int = DEFAULT_SIZE, max_exponent: float = MAX_EXPONENT, only=None) -> dict:
+    """등록된 모든 파서 패턴 측정. 결과: {ok, size, growthFactor, maxExponent, failures, patterns}."""
+    import layout_lines
+    import parse_docx_form_pdf
+    import parse_pdf_resume
+
+    registries = (
+        ("parse_pdf_resume.py", parse_pdf_resume.P),
+        ("parse_docx_form_pdf.py", parse_docx_form_pdf.P),
+        ("layout_lines.py", layout_lines.P),
+    )
+    methods = _pattern_methods()
+    rows = []
+    for module, registry in registries:
+        for name in registry.names():
+            if only and name not in only:
+                continue
+            compiled = registry._compiled[name]
+            row = {"owner": registry._owner, "name": name}
+            row.update(measure_pattern(compiled, methods.get((module, name), set()), size, max_exponent))
+            rows.append(row)
+    rows.sort(key=lambda r: (-r["failed"], -r["exponent"], -r["ms"]))
+    failures = [f"{r['owner']}.{r['name']}" for r in rows if r["failed"]]
+    return {
+        "ok": not failures,
+        "size": size,
+        "growthFactor": GROWTH_FACTOR,
+        "maxExponent": max_exponent,
+        "failures": failures,
+        "patterns": rows,
+    }
+
+
+def main():
+    args = sys.argv[1:]
+    size = DEFAULT_SIZE
+    max_exponent = MAX_EXPONENT
+    only = None
+    while args:
+        if args[0] == "--size" and len(args) >= 2 and args[1].isdigit():
+            size = max(10, int(args[1]))
+            args = args[2:]
+        elif args[0] == "--max-exponent" and len(args) >= 2:
+            try:
+                max_exponent = float(args[1])
+            except ValueError:
+                break
+            args = args[2:]
+        elif args[0] == "--only" and len(args) >= 2:
+            only = {name for name in args[1].split(",") if name}
+            args = args[2:]
+        else:
+            break
+    if args:
+        print(json.dumps({"error": "Usage: regex_complexity.py [--size N] [--max-exponent K] [--only NAME,NAME]"}), file=sys.stderr)
+        sys.exit(1)
+    report = run(size, max_exponent, only)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    sys.exit(0 if report["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+2단계 파서(parse_pdf_resume / parse_docx_form_pdf / layout_lines)가 쓰는 정규식 레지스트리.
+
+파서 모듈은 import 시 한 번 PatternRegistry.add()로 이름 붙인 패턴을 컴파일해 두고,
+함수 안에서는 P.이름.match(...) 처럼 속성으로만 꺼내 씁니다 (줄 단위 루프 안에서 re.match(문자열, ...) 금지).
+
+패턴별 호출 수·적중 수·누적 시간이 필요하면 enable_stats() 후 파싱하고 stats_report()로 확인합니다.
+꺼져 있을 때는 속성이 컴파일된 re.Pattern 그대로라 추가 비용이 없습니다.
+
+사용법:
+    python3 scripts/regex_registry.py check                      # 파서 함수 안에 인라인 re.* 호출이 없는지 검사
+    python3 scripts/regex_registry.py stats <stage1_raw.txt|폴더>  # 저장된 1단계 텍스트로 패턴별 hit/time 집계
+"""
+
+import ast
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+# check 대상: 레지스트리를 쓰는 파서 모듈
+CHECKED_MODULES = ("parse_pdf_resume.py", "parse_docx_form_pdf.py", "layout_lines.py")
+# re 모듈에서 패턴 문자열을 받아 (캐시 조회 후) 컴파일하는 함수들
+_COMPILING_FUNCS = {"compile", "match", "fullmatch", "search", "sub", "subn", "split", "findall", "finditer"}
+
+
+class _CountingPattern:
+    """stats 활성화 시 re.Pattern 대신 들어가는 래퍼. 호출 수·적중 수·누적 시간 기록."""
+
+    __slots__ = ("name", "compiled", "calls", "hits", "seconds")
+
+    def __init__(self, name: str, compiled: re.Pattern):
+        self.name = name
+        self.compiled = compiled
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+    @property
+    def pattern(self) -> str:
+        return self.compiled.pattern
+
+    @property
+    def flags(self) -> int:
+        return self.compiled.flags
+
+    def _timed(self, fn, *args, **kwargs):
+        t0 = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self.seconds += time.perf_counter() - t0
+        self.calls += 1
+        return result
+
+    def match(self, *args, **kwargs):
+        m = self._timed(self.compiled.match, *args, **kwargs)
+        self.hits += m is not None
+        return m
+
+    def fullmatch(self, *args, **kwargs):
+        m = self._timed(self.compiled.fullmatch, *args, **kwargs)
+        self.hits += m is not None
+        return m
+
+    def search(self, *args, **kwargs):
+        m = self._timed(self.compiled.search, *args, **kwargs)
+        self.hits += m is not None
+        return m
+
+    def findall(self, *args, **kwargs):
+        found = self._timed(self.compiled.findall, *args, **kwargs)
+        self.hits += bool(found)
+        return found
+
+    def finditer(self, *args, **kwargs):
+        # 지연 반복자라 소비 시간까지 재려면 리스트로 만들어 돌려줌
+        found = self._timed(lambda *a, **k: list(self.compiled.finditer(*a, **k)), *args, **kwargs)
+        self.hits += bool(found)
+        return iter(found)
+
+    def sub(self, *args, **kwargs):
+        return self._timed(self.compiled.sub, *args, **kwargs)
+
+    def subn(self, *args, **kwargs):
+        return self._timed(self.compiled.subn, *args, **kwargs)
+
+    def split(self, *args, **kwargs):
+        return self._timed(self.compiled.split, *args, **kwargs)
+
+
+class PatternRegistry:
+    """이름 → 컴파일된 정규식. 파서 모듈마다 하나씩 두고 속성으로 접근 (P.CAREER_DATE_LINE)."""
+
+    def __init__(self, owner: str):
+        self._owner = owner
+        self._compiled: dict[str, re.Pattern] = {}
+        self._counters: Optional[dict[str, _CountingPattern]] = None
+        _REGISTRIES.append(self)
+
+    def add(self, name: str, pattern: str, flags: int = 0) -> re.Pattern:
+        """패턴을 컴파일해 name 속성으로 등록하고 컴파일된 패턴을 반환. 같은 이름 중복 등록은 오류."""
+        if name in self._compiled:
+            raise ValueError(f"duplicate pattern name: {self._owner}.{name}")
+        compiled = re.compile(pattern, flags)
+        self._compiled[name] = compiled
+        if self._counters is not None:
+            self._counters[name] = _CountingPattern(name, compiled)
+            setattr(self, name, self._counters[name])
+        else:
+            setattr(self, name, compiled)
+        return compiled
+
+    def names(self) -> list[str]:
+        return list(self._compiled)
+
+    def enable_stats(self) -> None:
+        """모든 패턴을 카운터 래퍼로 교체 (카운터 0부터 시작)."""
+        self._counters = {name: _CountingPattern(name, c) for name, c in self._compiled.items()}
+        for name, counter in self._counters.items():
+            setattr(self, name, counter)
+
+    def disable_stats(self) -> None:
+        self._counters = None
+        for name, compiled in self._compiled.items():
+            setattr(self, name, compiled)
+
+    def stats(self) -> list[dict]:
+        """패턴별 {owner, name, calls, hits, totalMs, pattern}. stats 비활성 상태면 빈 리스트."""
+        if self._counters is None:
+            return []
+        return [
+            {
+                "owner": self._owner,
+                "name": c.name,
+                "calls": c.calls,
+                "hits": c.hits,
+                "totalMs": round(c.seconds * 1000, 3),
+                "pattern": c.pattern,
+            }
+            for c in self._counters.values()
+        ]
+
+
+_REGISTRIES: list[PatternRegistry] = []
+
+
+def enable_stats() -> None:
+    """import된 모든 레지스트리의 패턴별 집계 시작."""
+    for registry in _REGISTRIES:
+        registry.enable_stats()
+
+
+def disable_stats() -> None:
+    for registry in _REGISTRIES:
+        registry.disable_stats()
+
+
+def stats_report() -> list[dict]:
+    """모든 레지스트리의 패턴별 집계를 누적 시간 내림차순으로."""
+    rows = [row for registry in _REGISTRIES for row in registry.stats()]
+    return sorted(rows, key=lambda r: (-r["totalMs"], -r["calls"], r["owner"], r["name"]))
+
+
+def find_inline_patterns(path: str) -> list[dict]:
+    """함수 본문 안의 re.<compile|match|search|...>(...) 호출 위치 목록 (레지스트리를 거치지 않는 패턴)."""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=path)
+    found = []
+
+    def _visit(node: ast.AST, func_name: Optional[str]) -> None:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            func_name = getattr(node, "name", "<lambda>")
+        if (
+            func_name
+            and isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "re"
+            and node.func.attr in _COMPILING_FUNCS
+        ):
+            found.append({"file": Path(path).name, "line": node.lineno, "function": func_name, "call": f"re.{node.func.attr}"})
+        for child in ast.iter_child_nodes(node):
+            _visit(child, func_name)
+
+    _visit(tree, None)
+    return found
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] == "check":
+        found = []
+        for name in CHECKED_MODULES:
+            found += find_inline_patterns(str(Path(_SCRIPTS_DIR) / name))
+        print(json.dumps({"ok": not found, "inlinePatterns": found}, ensure_ascii=False, indent=2))
+        sys.exit(1 if found else 0)
+    if len(args) == 2 and args[0] == "stats":
+        # 스크립트로 실행하면 이 파일은 __main__ 이고 파서들은 regex_registry 모듈을 따로 import 하므로 그쪽 레지스트리를 사용
+        import parse_docx_form_pdf
+        import parse_pdf_resume
+        import regex_registry
+        from stage1_cache import iter_stage1_files, read_stage1_text
+
+        target = Path(args[1])
+        paths = iter_stage1_files(str(target)) if target.is_dir() else [str(target)]
+        regex_registry.enable_stats()
+        for path in paths:
+            text, engine, _ = read_stage1_text(path)
+            if path.endswith("_pdftotext.txt"):
+                parse_docx_form_pdf.parse_docx_form_pdf_text(text)
+            else:
+                parse_pdf_resume.parse_pdf_resume_text(text, engine)
+        print(json.dumps({"files": len(paths), "patterns": regex_registry.stats_report()}, ensure_ascii=False, indent=2))
+        return
+    print(json.dumps({"error": "Usage: regex_registry.py check | stats <stage1_raw.txt|dir>"}), file=sys.stderr)
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
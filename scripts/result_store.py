@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+폴더별 .career-fit-cache.json 을 대신하는 전역 결과 저장소. 사용자 데이터 폴더의 SQLite 파일 하나(WAL 모드)에 저장합니다.
+
+키: SHA-256(파일 바이트) + 파서 버전.
+  - 폴더를 복사하거나 파일 이름을 바꿔도 내용이 같으면 다시 파싱하지 않음 (기존 캐시는 경로 + 크기 + mtime 키)
+  - 파서 버전이 바뀌면 다른 키가 되어 다시 파싱 (Electron은 앱 버전 등 자기 버전 문자열을 넘김)
+경로 → 해시 표(file_hash)에 크기·mtime을 같이 기록해, 바뀌지 않은 파일은 조회할 때마다 다시 해시하지 않습니다.
+결과는 항목 단위로 upsert 하므로 저장할 때 전체 파일을 다시 쓰지 않고, 조회는 경로 목록을 한 번에 받아 IN 쿼리로 묶어 처리합니다.
+증명사진은 photoDataUrl(base64)로 결과마다 넣지 않고 SHA-256 으로 중복 제거한 blob(photo 표)으로 저장하고,
+결과에는 photoSha256 만 남깁니다 (필요할 때 photo 요청 / --with-photos 로 꺼냄).
+
+사용법:
+    python3 scripts/result_store.py [--db PATH] [--parser-version V] serve                 # JSON Lines (아래)
+    python3 scripts/result_store.py [--db PATH] [--parser-version V] lookup [--with-photos] <파일> ...
+    python3 scripts/result_store.py [--db PATH] [--parser-version V] put <entries.json|->
+    python3 scripts/result_store.py [--db PATH] [--parser-version V] import <폴더|.career-fit-cache.json>
+    python3 scripts/result_store.py [--db PATH] photo <sha256> <out_dir>
+    python3 scripts/result_store.py [--db PATH] [--parser-version V] gc [--keep-version]
+    python3 scripts/result_store.py [--db PATH] stats
+
+serve 요청 (한 줄 = JSON 객체 1개, 응답은 {"id", "result"} 또는 {"id", "error"} 한 줄):
+  {"id": 1, "type": "lookup", "paths": ["a.pdf", "b.docx"], "withPhotos": false}
+      → {"cached": {경로: data}, "toProcess": [경로], "hashes": {경로: sha256|null}}   (main.ts load-cache 와 같은 모양)
+  {"id": 2, "type": "put", "entries": [{"filePath": "a.pdf", "fileName": "a.pdf", "data": {...}}]}
+      → {"stored", "newPhotos", "missing": [경로]}   (main.ts save-cache 와 같은 입력, data.photoPath 가 있으면 사진도 저장)
+  {"id": 3, "type": "photo", "sha256": "...", "outDir": "..."}  → {"path", "mime", "size"} | null
+  {"id": 4, "type": "stats"} / {"type": "ping"} / {"type": "shutdown"}
+  - parserVersion 생략 시 --parser-version (기본: default_parser_version())
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Iterable, Optional, TextIO
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    # 임베디드 Python(._pth 사용)은 스크립트 폴더를 sys.path에 넣지 않으므로 직접 추가
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from stage1_cache import _compress, _decompress, sha256_file  # noqa: E402
+
+DEFAULT_DB_NAME = "result_store.db"
+# Electron app.getPath('userData') 폴더 이름 (electron-builder.yml productName)
+APP_DATA_NAME = "이력서 적합도 평가 시스템"
+# 기존 폴더별 캐시 파일 (import 대상)
+LEGACY_CACHE_NAME = ".career-fit-cache.json"
+# SQLite 변수 개수 제한(구버전 999) 안에서 IN (...) 으로 묶는 개수
+BATCH_SIZE = 500
+
+_PHOTO_MIME = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "bmp": "image/bmp",
+    "tif": "image/tiff",
+    "tiff": "image/tiff",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS result (
+    content_sha256 TEXT NOT NULL,
+    parser_version TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    photo_sha256 TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (content_sha256, parser_version)
+);
+CREATE INDEX IF NOT EXISTS result_photo ON result (photo_sha256);
+CREATE TABLE IF NOT EXISTS photo (
+    sha256 TEXT PRIMARY KEY,
+    ext TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS file_hash (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_sha256 TEXT NOT NULL,
+    checked_at REAL NOT NULL
+);
+"""
+
+
+def default_db_path() -> str:
+    """기본 DB 경로: $CAREER_FIT_RESULT_STORE, 없으면 Electron userData 폴더와 같은 위치의 result_store.db.
+    Electron은 path.join(app.getPath('userData'), 'result_store.db') 를 --db 로 넘기는 것을 권장."""
+    override = os.environ.get("CAREER_FIT_RESULT_STORE")
+    if override:
+        return override
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or str(Path.home() / "AppData" / "Roaming")
+    elif sys.platform == "darwin":
+        base = str(Path.home() / "Library" / "Application Support")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    return str(Path(base) / APP_DATA_NAME / DEFAULT_DB_NAME)
+
+
+def default_parser_version() -> str:
+    """파서 버전 기본값: PDF 파서들의 PARSER_VERSION. 점수·AI 결과까지 저장하는 쪽은 자기 버전을 넘겨야 함."""
+    import parse_docx_form_pdf
+    import parse_pdf_resume
+
+    return f"pdf_resume/{parse_pdf_resume.PARSER_VERSION}+docx_form_pdf/{parse_docx_form_pdf.PARSER_VERSION}"
+
+
+def _chunks(items: list, size: int = BATCH_SIZE) -> Iterable[list]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _photo_ext(name: str) -> str:
+    ext = Path(name).suffix.lstrip(".").lower()
+    return ext if ext in _PHOTO_MIME else "jpg"
+
+
+def _decode_data_url(url: str) -> Optional[tuple[str, bytes]]:
+    """'data:image/png;base64,...' → (확장자, 바이트). 형식이 다르면 None."""
+    if not isinstance(url, str) or not url.startswith("data:") or ";base64," not in url:
+        return None
+    header, payload = url[5:].split(";base64,", 1)
+    ext = next((e for e, mime in _PHOTO_MIME.items() if mime == header), "jpg")
+    try:
+        return ext, base64.b64decode(payload)
+    except ValueError:
+        return None
+
+
+class ResultStore:
+    """content-addressed 결과 저장소. Electron 프로세스와 배치 프로세스가 같은 DB를 써도 되도록 WAL 모드 사용."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or default_db_path()
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def content_hashes(self, paths: list[str]) -> dict[str, Optional[str]]:
+        """경로 → 내용 SHA-256 (파일이 없으면 None). 크기·mtime이 file_hash 기록과 같으면 다시 해시하지 않음."""
+        known = {}
+        for chunk in _chunks(list(dict.fromkeys(paths))):
+            marks = ",".join("?" * len(chunk))
+            for path, size, mtime_ns, sha in self._conn.execute(
+                f"SELECT path, size, mtime_ns, content_sha256 FROM file_hash WHERE path IN ({marks})", chunk
+            ):
+                known[path] = (size, mtime_ns, sha)
+        hashes = {}
+        updates = []
+        now = time.time()
+        for path in paths:
+            if path in hashes:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                hashes[path] = None
+                continue
+            record = known.get(path)
+            if record and record[0] == st.st_size and record[1] == st.st_mtime_ns:
+                hashes[path] = record[2]
+                continue
+            sha = sha256_file(path)
+            hashes[path] = sha
+            updates.append((path, st.st_size, st.st_mtime_ns, sha, now))
+        if updates:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO file_hash (path, size, mtime_ns, content_sha256, checked_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    updates,
+                )
+        return hashes
+
+    def lookup(self, paths: list[str], parser_version: str, with_photos: bool = False) -> dict:
+        """경로 목록을 한 번에 조회: {cached: {경로: data}, toProcess: [경로], hashes: {경로: sha256|None}}.
+        data 에는 photoSha256 이 들어가고, with_photos=True 면 photoDataUrl 도 채움 (기존 캐시와 같은 모양)."""
+        hashes = self.content_hashes(paths)
+        shas = sorted({sha for sha in hashes.values() if sha})
+        rows = {}
+        for chunk in _chunks(shas):
+            marks = ",".join("?" * len(chunk))
+            for sha, codec, photo_sha, blob in self._conn.execute(
+                f"SELECT content_sha256, codec, photo_sha256, data FROM result "
+                f"WHERE parser_version = ? AND content_sha256 IN ({marks})",
+                [parser_version] + chunk,
+            ):
+                raw = _decompress(codec, blob)
+                if raw is not None:
+                    rows[sha] = (json.loads(raw.decode("utf-8")), photo_sha)
+        photos = self._photo_urls({p for _, p in rows.values() if p}) if with_photos else {}
+        cached = {}
+        to_process = []
+        for path in paths:
+            row = rows.get(hashes.get(path))
+            if row is None:
+                to_process.append(path)
+                continue
+            data, photo_sha = row
+            data = dict(data)
+            if photo_sha:
+                data["photoSha256"] = photo_sha
+                if photo_sha in photos:
+                    data["photoDataUrl"] = photos[photo_sha]
+            cached[path] = data
+        return {"cached": cached, "toProcess": to_process, "hashes": hashes}
+
+    def _photo_urls(self, shas: set[str]) -> dict[str, str]:
+        urls = {}
+        for chunk in _chunks(sorted(shas)):
+            marks = ",".join("?" * len(chunk))
+            for sha, ext, blob in self._conn.execute(
+                f"SELECT sha256, ext, data FROM photo WHERE sha256 IN ({marks})", chunk
+            ):
+                urls[sha] = f"data:{_PHOTO_MIME[ext]};base64,{base64.b64encode(blob).decode('ascii')}"
+        return urls
+
+    def put(self, entries: list[dict], parser_version: str) -> dict:
+        """결과 upsert (한 트랜잭션). entries: [{filePath, data}] (main.ts save-cache 입력과 같음).
+        data.photoPath 파일 또는 data.photoDataUrl 이 있으면 사진을 blob으로 저장하고 data 에서는 photoDataUrl 을 뺌."""
+        hashes = self.content_hashes([e.get("filePath") for e in entries if e.get("filePath")])
+        now = time.time()
+        stored = 0
+        new_photos = 0
+        missing = []
+        with self._conn:
+            for entry in entries:
+                path = entry.get("filePath")
+                sha = hashes.get(path) if path else None
+                if not sha:
+                    missing.append(path)
+                    continue
+                data = dict(entry.get("data") or {})
+                photo = self._read_photo(data.get("photoPath"), data.pop("photoDataUrl", None))
+                data.pop("photoSha256", None)
+                photo_sha = None
+                if photo:
+                    ext, blob = photo
+                    photo_sha = hashlib.sha256(blob).hexdigest()
+                    cur = self._conn.execute(
+                        "INSERT OR IGNORE INTO photo (sha256, ext, size, created_at, data) VALUES (?, ?, ?, ?, ?)",
+                        (photo_sha, ext, len(blob), now, blob),
+                    )
+                    new_photos += cur.rowcount
+                codec, blob = _compress(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+                self._conn.execute(
+                    "INSERT INTO result (content_sha256, parser_version, codec, photo_sha256, created_at, updated_at, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(content_sha256, parser_version) DO UPDATE SET "
+                    "codec = excluded.codec, photo_sha256 = excluded.photo_sha256, "
+                    "updated_at = excluded.updated_at, data = excluded.data",
+                    (sha, parser_version, codec, photo_sha, now, now, blob),
+                )
+                stored += 1
+        return {"stored": stored, "newPhotos": new_photos, "missing": missing}
+
+    @staticmethod
+    def _read_photo(photo_path, data_url) -> Optional[tuple[str, bytes]]:
+        """(확장자, 바이트): photoPath 파일이 있으면 그 파일, 없으면 photoDataUrl."""
+        if isinstance(photo_path, str) and photo_path and os.path.isfile(photo_path):
+            with open(photo_path, "rb") as f:
+                return _photo_ext(photo_path), f.read()
+        return _decode_data_url(data_url) if data_url else None
+
+    def export_photo(self, photo_sha: str, out_dir: str) -> Optional[dict]:
+        """사진 blob 을 out_dir/<sha256 앞 16자>.<확장자> 로 저장. 없으면 None."""
+        row = self._conn.execute("SELECT ext, data FROM photo WHERE sha256 = ?", (photo_sha,)).fetchone()
+        if row is None:
+            return None
+        ext, blob = row
+        Path(out_dir).mkdir(parents=True, exist_ok=True)
+        out_path = Path(out_dir) / f"{photo_sha[:16]}.{ext}"
+        if not out_path.exists() or out_path.stat().st_size != len(blob):
+            out_path.write_bytes(blob)
+        return {"path": str(out_path), "mime": _PHOTO_MIME[ext], "size": len(blob)}
+
+    def import_legacy_cache(self, cache_path: str, parser_version: str) -> dict:
+        """폴더별 .career-fit-cache.json 가져오기. 크기·mtime이 지금 파일과 같은 항목만 (기존 캐시가 유효하다고 본 것만) 저장."""
+        with open(cache_path, "r", encoding="utf-8") as f:
+            legacy = json.load(f)
+        entries = []
+        stale = 0
+        for entry in (legacy.get("entries") or {}).values():
+            path = entry.get("filePath")
+            try:
+                st = os.stat(path)
+            except (OSError, TypeError):
+                stale += 1
+                continue
+            # main.ts: stats.mtime.getTime() (ms)
+            if entry.get("size") != st.st_size or entry.get("mtime") != st.st_mtime_ns // 1_000_000:
+                stale += 1
+                continue
+            entries.append({"filePath": path, "data": entry.get("data") or {}})
+        summary = self.put(entries, parser_version)
+        summary["stale"] = stale
+        summary["cachePath"] = cache_path
+        return summary
+
+    def gc(self, keep_version: Optional[str] = None) -> dict:
+        """keep_version 이 있으면 다른 파서 버전 결과 삭제. 참조가 없는 사진, 없어진 파일의 해시 기록 삭제."""
+        with self._conn:
+            results = 0
+            if keep_version:
+                results = self._conn.execute(
+                    "DELETE FROM result WHERE parser_version != ?", (keep_version,)
+                ).rowcount
+            photos = self._conn.execute(
+                "DELETE FROM photo WHERE sha256 NOT IN "
+                "(SELECT photo_sha256 FROM result WHERE photo_sha256 IS NOT NULL)"
+            ).rowcount
+            gone = [(p,) for (p,) in self._conn.execute("SELECT path FROM file_hash") if not os.path.exists(p)]
+            self._conn.executemany("DELETE FROM file_hash WHERE path = ?", gone)
+        return {"deletedResults": results, "deletedPhotos": photos, "deletedPaths": len(gone)}
+
+    def stats(self) -> dict:
+        results, result_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM result"
+        ).fetchone()
+        photos, photo_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM photo"
+        ).fetchone()
+        versions = dict(self._conn.execute(
+            "SELECT parser_version, COUNT(*) FROM result GROUP BY parser_version"
+        ).fetchall())
+        paths = self._conn.execute("SELECT COUNT(*) FROM file_hash").fetchone()[0]
+        return {
+            "dbPath": self.db_path,
+            "results": results,
+            "resultBytes": result_bytes,
+            "photos": photos,
+            "photoBytes": photo_bytes,
+            "knownPaths": paths,
+            "parserVersions": versions,
+        }
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _legacy_cache_path(target: str) -> str:
+    return str(Path(target) / LEGACY_CACHE_NAME) if Path(target).is_dir() else target
+
+
+def handle_request(req: dict, store: ResultStore, parser_version: str) -> Optional[dict]:
+    """serve 요청 1건 처리. 실패 시 예외."""
+    req_type = req.get("type")
+    version = req.get("parserVersion") or parser_version
+    if req_type == "lookup":
+        return store.lookup(list(req.get("paths") or []), version, bool(req.get("withPhotos")))
+    if req_type == "put":
+        return store.put(list(req.get("entries") or []), version)
+    if req_type == "photo":
+        return store.export_photo(req.get("sha256") or "", req.get("outDir") or ".")
+    if req_type == "import":
+        return store.import_legacy_cache(_legacy_cache_path(req.get("path") or ""), version)
+    if req_type == "stats":
+        return store.stats()
+    raise ValueError(f"Unknown request type: {req_type}")
+
+
+def serve(store: ResultStore, parser_version: str, stdin: TextIO = sys.stdin, stdout: TextIO = sys.stdout) -> None:
+    """stdin이 닫히거나 shutdown 요청이 올 때까지 요청을 한 줄씩 처리 (parse_worker.py 와 같은 JSON Lines 형식)."""
+    for raw in stdin:
+        line = raw.strip()
+        if not line:
+            continue
+        req_id = None
+        try:
+            req = json.loads(line)
+            if not isinstance(req, dict):
+                raise ValueError("request must be a JSON object")
+            req_id = req.get("id")
+            if req.get("type") == "shutdown":
+                break
+            if req.get("type") == "ping":
+                resp = {"id": req_id, "result": "pong"}
+            else:
+                resp = {"id": req_id, "result": handle_request(req, store, parser_version)}
+        except Exception as e:
+            resp = {"id": req_id, "error": str(e), "traceback": traceback.format_exc()}
+        stdout.write(json.dumps(resp, ensure_ascii=False, separators=(",", ":")) + "\n")
+        stdout.flush()
+
+
+def main():
+    args = sys.argv[1:]
+    db_path = None
+    parser_version = None
+    with_photos = False
+    keep_version = False
+    while args and args[0].startswith("--"):
+        if args[0] == "--db" and len(args) >= 2:
+            db_path = args[1]
+            args = args[2:]
+        elif args[0] == "--parser-version" and len(args) >= 2:
+            parser_version = args[1]
+            args = args[2:]
+        else:
+            break
+    command = args[0] if args else None
+    args = args[1:]
+    while args and args[0].startswith("--"):
+        if args[0] == "--with-photos" and command == "lookup":
+            with_photos = True
+        elif args[0] == "--keep-version" and command == "gc":
+            keep_version = True
+        else:
+            command = None
+            break
+        args = args[1:]
+    arity = {"serve": (0, 0), "stats": (0, 0), "gc": (0, 0), "lookup": (1, None), "put": (1, 1),
+             "import": (1, 1), "photo": (2, 2)}
+    low, high = arity.get(command, (1, 0))
+    if len(args) < low or (high is not None and len(args) > high):
+        print(json.dumps({"error": "Usage: result_store.py [--db PATH] [--parser-version V] serve | stats | gc [--keep-version] | lookup [--with-photos] <file>... | put <entries.json|-> | import <dir|.career-fit-cache.json> | photo <sha256> <out_dir>"}), file=sys.stderr)
+        sys.exit(1)
+    # Windows 콘솔/파이프에서도 UTF-8로 주고받음
+    for stream in (sys.stdin, sys.stdout):
+        try:
+            stream.reconfigure(encoding="utf-8")
+        except Exception:
+            pass
+    store = ResultStore(db_path)
+    try:
+        if command in ("serve", "lookup", "put", "import") or keep_version:
+            parser_version = parser_version or default_parser_version()
+        if command == "serve":
+            serve(store, parser_version)
+            return
+        if command == "lookup":
+            result = store.lookup([os.path.abspath(p) for p in args], parser_version, with_photos)
+        elif command == "put":
+            if args[0] == "-":
+                entries = json.load(sys.stdin)
+            else:
+                with open(args[0], "r", encoding="utf-8") as f:
+                    entries = json.load(f)
+            result = store.put(entries, parser_version)
+        elif command == "import":
+            result = store.import_legacy_cache(_legacy_cache_path(args[0]), parser_version)
+        elif command == "photo":
+            result = store.export_photo(args[0], args[1])
+        elif command == "gc":
+            result = store.gc(parser_version if keep_version else None)
+        else:
+            result = store.stats()
+    except Exception as e:
+        print(json.dumps({"error": str(e)}, ensure_ascii=False), file=sys.stderr)
+        sys.exit(1)
+    finally:
+        store.close()
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+1단계(pdftotext / pymupdf) 추출 텍스트 캐시. SQLite 파일 하나에 zstd 압축 blob으로 저장합니다.
+
+키: SHA-256(PDF 바이트) + 추출 엔진 식별자(예: "pdftotext 24.02.0").
+  - 같은 PDF가 다른 폴더에 있거나 다시 업로드돼도 내용이 같으면 pdftotext를 다시 돌리지 않음
+  - pdftotext 버전이 바뀌면 자동으로 다른 키가 되어 다시 추출 (엔진별로 따로 저장, pdf_text_engines.py)
+용량 제한: max_bytes(압축 후 크기 합)를 넘으면 마지막 사용 시각이 오래된 것부터 삭제(LRU).
+압축: Python 3.14+ 의 compression.zstd (번들 python-embed에 _zstd 포함). 없으면 zlib으로 저장.
+
+2단계 결과도 같은 DB(stage2_result)에 저장합니다. 키는 (PDF SHA-256, 엔진, 파서 이름)이고
+파서 버전 + 헤더 설정 해시(fingerprint)를 함께 기록해, 규칙이 바뀌면 stale로 보고 2단계만 다시 돌립니다.
+
+사용법:
+    python3 scripts/stage1_cache.py stats <cache.db>
+    python3 scripts/stage1_cache.py clear <cache.db>
+    python3 scripts/parse_pdf_resume.py --stage1-cache <cache.db> [--stage1-cache-max-mb N] <pdf_path>
+    python3 scripts/parse_pdf_resume.py --from-stage1 <cache.db|dir|stage1_raw.txt> [--stale-only] [--all]
+"""
+
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Optional, TextIO
+
+try:
+    from compression import zstd as _zstd  # Python 3.14+
+except ImportError:
+    _zstd = None
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+ZSTD_LEVEL = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stage1_text (
+    key TEXT PRIMARY KEY,
+    pdf_sha256 TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    raw_size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stage1_text_last_access ON stage1_text (last_access);
+CREATE TABLE IF NOT EXISTS stage2_result (
+    key TEXT PRIMARY KEY,
+    pdf_sha256 TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    parser TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stage2_result_text ON stage2_result (pdf_sha256, engine);
+CREATE TABLE IF NOT EXISTS cache_stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def sha256_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용 SHA-256 (hex)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def stage1_key(pdf_path: str, pdftotext_exe: Optional[str] = None, engine: str = "pdftotext") -> tuple[str, str]:
+    """캐시 키 구성요소 (PDF SHA-256, 엔진 식별자). 엔진 식별자는 pdf_text_engines.engine_id()."""
+    from pdf_text_engines import engine_id
+
+    return sha256_file(pdf_path), engine_id(engine, pdftotext_exe)
+
+
+def stage2_fingerprint(parser: str, version: str, config) -> str:
+    """2단계 결과 유효성 판단용 해시: 파서 이름 + 파서 버전 + 헤더/섹션 설정(JSON 직렬화 가능한 값)."""
+    payload = json.dumps(
+        {"parser": parser, "version": version, "config": config},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# --debug-dir 에 남는 1단계 원문 파일 (parse_pdf_resume / parse_docx_form_pdf)
+STAGE1_FILE_SUFFIXES = (".stage1_raw.txt", "_pdftotext.txt")
+
+
+def read_stage1_text(path: str) -> tuple[str, str, str]:
+    """저장된 1단계 원문 파일을 읽어 (텍스트, 엔진, 원본 basename) 반환.
+    *.stage1_raw.txt 는 첫 줄 '# engine: ...' 을 떼어 내고, 그 외 파일은 pdftotext 원문으로 봄."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    name = Path(path).name
+    engine = "pdftotext"
+    if text.startswith("# engine:"):
+        first_nl = text.find("\n")
+        engine = text[len("# engine:") : first_nl if first_nl >= 0 else len(text)].strip() or engine
+        text = text[first_nl + 1 :] if first_nl >= 0 else ""
+    base = Path(path).stem
+    for suffix in STAGE1_FILE_SUFFIXES:
+        if name.endswith(suffix):
+            base = name[: -len(suffix)]
+            break
+    return text, engine, base
+
+
+def iter_stage1_files(dir_path: str) -> list[str]:
+    """폴더 안의 1단계 원문 파일 목록 (*.stage1_raw.txt, *_pdftotext.txt)."""
+    return sorted(
+        str(p)
+        for p in Path(dir_path).iterdir()
+        if p.is_file() and p.name.endswith(STAGE1_FILE_SUFFIXES)
+    )
+
+
+def is_cache_db(path: str) -> bool:
+    """SQLite 파일 여부 (헤더 매직으로 판별)."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(16) == b"SQLite format 3\x00"
+    except OSError:
+        return False
+
+
+def _compress(data: bytes) -> tuple[str, bytes]:
+    if _zstd is not None:
+        return "zstd", _zstd.compress(data, level=ZSTD_LEVEL)
+    return "zlib", zlib.compress(data, 6)
+
+
+def _decompress(codec: str, blob: bytes) -> Optional[bytes]:
+    """codec을 풀 수 없으면 None (예: zstd로 저장된 DB를 3.14 미만에서 읽을 때 → 캐시 미스로 처리)."""
+    if codec == "zstd":
+        return _zstd.decompress(blob) if _zstd is not None else None
+    if codec == "zlib":
+        return zlib.decompress(blob)
+    return None
+
+
+class Stage1Cache:
+    """content-addressed 1단계 텍스트 캐시. 여러 프로세스(--batch 워커)가 같은 DB를 써도 되도록 WAL 모드 사용."""
+
+    def __init__(self, db_path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def make_key(pdf_sha256: str, engine: str) -> str:
+        return f"{pdf_sha256}:{engine}"
+
+    def _bump(self, name: str) -> None:
+        self._conn.execute(
+            "INSERT INTO cache_stats (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def get(self, pdf_sha256: str, engine: str) -> Optional[str]:
+        """캐시된 텍스트 반환 (없으면 None). 조회 시 last_access 갱신, hit/miss 카운트."""
+        key = self.make_key(pdf_sha256, engine)
+        row = self._conn.execute("SELECT codec, data FROM stage1_text WHERE key = ?", (key,)).fetchone()
+        raw = _decompress(row[0], row[1]) if row else None
+        with self._conn:
+            if raw is None:
+                self.misses += 1
+                self._bump("misses")
+                return None
+            self.hits += 1
+            self._bump("hits")
+            self._conn.execute("UPDATE stage1_text SET last_access = ? WHERE key = ?", (time.time(), key))
+        return raw.decode("utf-8")
+
+    def put(self, pdf_sha256: str, engine: str, text: str) -> None:
+        """텍스트 저장 후 용량 제한을 넘으면 LRU 순으로 삭제."""
+        raw = text.encode("utf-8")
+        codec, blob = _compress(raw)
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stage1_text "
+                "(key, pdf_sha256, engine, codec, raw_size, stored_size, created_at, last_access, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.make_key(pdf_sha256, engine), pdf_sha256, engine, codec, len(raw), len(blob), now, now, blob),
+            )
+            self._evict()
+
+    def _evict(self) -> int:
+        total = self._conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM stage1_text").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        victims = []
+        for key, size in self._conn.execute("SELECT key, stored_size FROM stage1_text ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM stage1_text WHERE key = ?", victims)
+        # 원문이 빠진 2단계 결과는 더 이상 다시 만들 수 없으므로 같이 삭제
+        self._conn.execute(
+            "DELETE FROM stage2_result WHERE pdf_sha256 || ':' || engine NOT IN (SELECT key FROM stage1_text)"
+        )
+        for _ in victims:
+            self._bump("evictions")
+        return len(victims)
+
+    def iter_entries(self) -> list[tuple[str, str]]:
+        """저장된 1단계 항목 (pdf_sha256, engine) 목록."""
+        return self._conn.execute("SELECT pdf_sha256, engine FROM stage1_text ORDER BY created_at").fetchall()
+
+    def get_result(self, pdf_sha256: str, engine: str, parser: str, fingerprint: str) -> Optional[dict]:
+        """fingerprint가 일치하는 2단계 결과 반환. 없거나 fingerprint가 다르면(stale) None."""
+        row = self._conn.execute(
+            "SELECT fingerprint, codec, data FROM stage2_result WHERE key = ?",
+            (self.make_key(pdf_sha256, engine) + ":" + parser,),
+        ).fetchone()
+        raw = _decompress(row[1], row[2]) if row and row[0] == fingerprint else None
+        with self._conn:
+            if raw is None:
+                self._bump("result_stale" if row else "result_misses")
+                return None
+            self._bump("result_hits")
+        return json.loads(raw.decode("utf-8"))
+
+    def put_result(self, pdf_sha256: str, engine: str, parser: str, fingerprint: str, result: dict) -> None:
+        codec, blob = _compress(json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stage2_result "
+                "(key, pdf_sha256, engine, parser, fingerprint, codec, created_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.make_key(pdf_sha256, engine) + ":" + parser, pdf_sha256, engine, parser,
+                 fingerprint, codec, time.time(), blob),
+            )
+
+    def result_status(self, parser: str, fingerprint: str) -> dict[tuple[str, str], str]:
+        """1단계 항목별 2단계 결과 상태: 'fresh' | 'stale' | 'missing'."""
+        rows = self._conn.execute(
+            "SELECT t.pdf_sha256, t.engine, r.fingerprint FROM stage1_text t "
+            "LEFT JOIN stage2_result r ON r.pdf_sha256 = t.pdf_sha256 AND r.engine = t.engine AND r.parser = ?",
+            (parser,),
+        ).fetchall()
+        return {
+            (sha, engine): "missing" if fp is None else ("fresh" if fp == fingerprint else "stale")
+            for sha, engine, fp in rows
+        }
+
+    def stats(self) -> dict:
+        """현재 항목 수·용량과 hit/miss 카운터 (이번 프로세스 + DB 누적)."""
+        entries, raw_bytes, stored_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(stored_size), 0) FROM stage1_text"
+        ).fetchone()
+        totals = dict(self._conn.execute("SELECT name, value FROM cache_stats").fetchall())
+        results = self._conn.execute("SELECT COUNT(*) FROM stage2_result").fetchone()[0]
+        return {
+            "dbPath": self.db_path,
+            "entries": entries,
+            "rawBytes": raw_bytes,
+            "storedBytes": stored_bytes,
+            "maxBytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "totalHits": totals.get("hits", 0),
+            "totalMisses": totals.get("misses", 0),
+            "totalEvictions": totals.get("evictions", 0),
+            "results": results,
+            "totalResultHits": totals.get("result_hits", 0),
+            "totalResultStale": totals.get("result_stale", 0),
+            "totalResultMisses": totals.get("result_misses", 0),
+            "codec": "zstd" if _zstd is not None else "zlib",
+        }
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM stage1_text")
+            self._conn.execute("DELETE FROM stage2_result")
+            self._conn.execute("DELETE FROM cache_stats")
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_SHARED: dict[tuple[str, int], Stage1Cache] = {}
+
+
+def get_shared_cache(db_path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> Stage1Cache:
+    """프로세스당 DB별 연결 하나를 재사용 (워커·배치 프로세스에서 파일마다 다시 열지 않도록)."""
+    key = (str(Path(db_path).resolve()), max_bytes)
+    cache = _SHARED.get(key)
+    if cache is None:
+        cache = _SHARED[key] = Stage1Cache(db_path, max_bytes)
+    return cache
+
+
+def reparse_stage2(
+    target: str,
+    parser: str,
+    fingerprint: str,
+    parse_text: Callable[[str, str, str], dict],
+    out: TextIO,
+    stale_only: bool = False,
+    all_entries: bool = False,
+) -> dict:
+    """저장된 1단계 텍스트로 2단계만 다시 실행하고 NDJSON 한 줄씩 출력 (--from-stage1 <폴더|cache.db>).
+    parse_text(text, engine, base_name) -> 결과 dict.
+    - 폴더: *.stage1_raw.txt / *_pdftotext.txt 마다 {"path", "result"|"error"}
+    - cache.db: 이 parser 의 2단계 결과가 이미 있는 1단계 항목마다 {"pdfSha256", "engine", "result"|"error"} 후
+      결과를 fingerprint와 함께 저장. 1단계 캐시는 파서들이 함께 쓰므로(parse_worker, pdf_format_router)
+      다른 파서의 문서는 건너뜀 (all_entries=True 이면 모든 항목). stale_only=True 이면 fresh 항목은 건너뜀.
+    마지막 줄에 {"summary": {...}} 출력 후 summary 반환."""
+    started = time.perf_counter()
+    counts = {"reparsed": 0, "skippedFresh": 0, "skippedOtherParser": 0, "errors": 0}
+
+    def _emit(record: dict) -> None:
+        if "error" in record:
+            counts["errors"] += 1
+        else:
+            counts["reparsed"] += 1
+        out.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        out.flush()
+
+    if is_cache_db(target):
+        cache = get_shared_cache(target)
+        status = cache.result_status(parser, fingerprint)
+        summary = {"entries": len(status), "stale": sum(1 for v in status.values() if v == "stale")}
+        for sha, engine in cache.iter_entries():
+            if not all_entries and status.get((sha, engine), "missing") == "missing":
+                counts["skippedOtherParser"] += 1
+                continue
+            if stale_only and status.get((sha, engine)) == "fresh":
+                counts["skippedFresh"] += 1
+                continue
+            record = {"pdfSha256": sha, "engine": engine}
+            try:
+                text = cache.get(sha, engine)
+                if text is None:
+                    raise RuntimeError("stage-1 text unavailable (codec not supported)")
+                result = parse_text(text, engine.split()[0], sha[:16])
+                cache.put_result(sha, engine, parser, fingerprint, result)
+                record["result"] = result
+            except Exception as e:
+                record["error"] = str(e)
+            _emit(record)
+    else:
+        files = iter_stage1_files(target)
+        summary = {"entries": len(files)}
+        for path in files:
+            try:
+                text, engine, base = read_stage1_text(path)
+                _emit({"path": path, "result": parse_text(text, engine, base)})
+            except Exception as e:
+                _emit({"path": path, "error": str(e)})
+    elapsed = time.perf_counter() - started
+    summary.update(counts)
+    summary.update({"parser": parser, "fingerprint": fingerprint, "elapsedSec": round(elapsed, 3)})
+    out.write(json.dumps({"summary": summary}, ensure_ascii=False, separators=(",", ":")) + "\n")
+    out.flush()
+    return summary
+
+
+def main():
+    args = sys.argv[1:]
+    if len(args) != 2 or args[0] not in ("stats", "clear"):
+        print(json.dumps({"error": "Usage: stage1_cache.py stats|clear <cache.db>"}), file=sys.stderr)
+        sys.exit(1)
+    cache = Stage1Cache(args[1])
+    try:
+        if args[0] == "clear":
+            cache.clear()
+        print(json.dumps(cache.stats(), ensure_ascii=False, indent=2))
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파싱 단계별 시간·카운터 (--profile).
+
+parse_pdf_resume / parse_docx_form_pdf / extract_resume_form_structure 에 --profile 을 주면 결과 JSON에
+"_timings": {"unit": "ms", "stages": {단계: 누적 ms}, "counts": {lines, blocks, chars, ...}} 가 붙습니다.
+시간은 time.perf_counter() (monotonic) 기준이고, 같은 이름 단계가 여러 번 불리면 합산합니다.
+단계는 겹칠 수 있습니다 (예: extract_table_data 안의 extract_images_from_cell) — 합이 전체 시간은 아님.
+--profile 이 없을 때는 NULL_PROFILER(아무것도 기록하지 않는 같은 인터페이스)를 쓰므로 추가 비용이 거의 없습니다.
+
+summarize 는 --profile 결과를 모아 단계·카운터별 p50/p95/평균/최대를 냅니다.
+입력: 결과 JSON 파일(*.json)이 든 폴더, 또는 --batch / 워커 NDJSON 출력 파일 (result._timings 도 인식).
+
+사용법:
+    python3 scripts/stage_profile.py summarize <폴더|결과.ndjson>
+"""
+
+import json
+import statistics
+import sys
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional
+
+# 단계 이름 (결과 _timings.stages 키). 파서 함수별 시간은 함수 이름을 그대로 씀 (parse_career_entries 등)
+STAGE1 = "stage1"
+SEGMENTATION = "segmentation"
+PHOTO = "photo"
+SERIALIZATION = "serialization"
+
+
+class _Stage:
+    """with profiler.stage(name): 블록의 경과 시간을 stages[name]에 더함."""
+
+    __slots__ = ("stages", "name", "started")
+
+    def __init__(self, stages: dict, name: str):
+        self.stages = stages
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stages[self.name] = self.stages.get(self.name, 0.0) + (time.perf_counter() - self.started)
+        return False
+
+
+class StageProfiler:
+    """단계별 누적 시간(초)과 카운터. to_dict()로 결과 JSON의 _timings 형태(ms)로 변환."""
+
+    enabled = True
+
+    def __init__(self):
+        self.stages: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+
+    def stage(self, name: str) -> _Stage:
+        return _Stage(self.stages, name)
+
+    def count(self, name: str, value: int) -> None:
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def to_dict(self) -> dict:
+        return {
+            "unit": "ms",
+            "stages": {name: round(sec * 1000, 3) for name, sec in self.stages.items()},
+            "counts": dict(self.counts),
+        }
+
+
+class _NullProfiler:
+    """--profile 이 꺼져 있을 때 쓰는 profiler. 같은 nullcontext 하나를 돌려주고 카운터는 버림."""
+
+    enabled = False
+    _context = nullcontext()
+
+    def stage(self, name: str):
+        return self._context
+
+    def count(self, name: str, value: int) -> None:
+        pass
+
+
+NULL_PROFILER = _NullProfiler()
+
+
+def get_profiler(profile: bool):
+    """profile이면 새 StageProfiler, 아니면 공용 NULL_PROFILER."""
+    return StageProfiler() if profile else NULL_PROFILER
+
+
+def dumps_profiled(payload, timings: Optional[dict] = None, **kwargs) -> str:
+    """json.dumps(payload, **kwargs). timings(payload 안에 들어 있는 _timings dict)가 있으면 한 번 직렬화해
+    걸린 시간을 timings["stages"]["serialization"]에 넣고 다시 직렬화 (--profile 일 때만 두 번)."""
+    if timings is None:
+        return json.dumps(payload, **kwargs)
+    started = time.perf_counter()
+    json.dumps(payload, **kwargs)
+    timings["stages"][SERIALIZATION] = round((time.perf_counter() - started) * 1000, 3)
+    return json.dumps(payload, **kwargs)
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    """nearest-rank 백분위 (samples는 비어 있지 않음)."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def _describe(samples: list[float]) -> dict:
+    return {
+        "n": len(samples),
+        "p50": round(_percentile(samples, 0.5), 3),
+        "p95": round(_percentile(samples, 0.95), 3),
+        "mean": round(statistics.mean(samples), 3),
+        "max": round(max(samples), 3),
+    }
+
+
+def _find_timings(record) -> Optional[dict]:
+    """결과 JSON / 배치·워커 한 줄에서 _timings 찾기."""
+    if not isinstance(record, dict):
+        return None
+    if isinstance(record.get("_timings"), dict):
+        return record["_timings"]
+    result = record.get("result")
+    if isinstance(result, dict) and isinstance(result.get("_timings"), dict):
+        return result["_timings"]
+    return None
+
+
+def _iter_records(target: str):
+    """폴더면 *.json 파일마다 JSON 하나, 파일이면 NDJSON 한 줄씩 (통째로 JSON 하나인 파일도 허용)."""
+    p = Path(target)
+    if p.is_dir():
+        for path in sorted(p.glob("*.json")):
+            try:
+                yield json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+        return
+    try:
+        text = p.read_text(encoding="utf-8")
+    except (OSError, ValueError):
+        return
+    try:
+        yield json.loads(text)
+        return
+    except ValueError:
+        pass
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            continue
+
+
+def summarize(target: str) -> dict:
+    """target(폴더 또는 NDJSON)의 _timings를 모아 단계·카운터별 {n, p50, p95, mean, max}."""
+    stages: dict[str, list[float]] = {}
+    counts: dict[str, list[float]] = {}
+    files = 0
+    for record in _iter_records(target):
+        timings = _find_timings(record)
+        if timings is None:
+            continue
+        files += 1
+        for name, ms in (timings.get("stages") or {}).items():
+            stages.setdefault(name, []).append(ms)
+        for name, value in (timings.get("counts") or {}).items():
+            counts.setdefault(name, []).append(value)
+    # 단계는 p95 큰 순서 (느린 단계가 위로)
+    stage_rows = sorted(((name, _describe(v)) for name, v in stages.items()), key=lambda row: -row[1]["p95"])
+    return {
+        "files": files,
+        "unit": "ms",
+        "stages": dict(stage_rows),
+        "counts": {name: _describe(v) for name, v in sorted(counts.items())},
+    }
+
+
+def main():
+    args = sys.argv[1:]
+    if len(args) == 2 and args[0] == "summarize" and Path(args[1]).exists():
+        print(json.dumps(summarize(args[1]), ensure_ascii=False, indent=2))
+        return
+    print(json.dumps({"error": "Usage: stage_profile.py summarize <dir|results.ndjson>"}), file=sys.stderr)
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()